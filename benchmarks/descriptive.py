@@ -0,0 +1,53 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Parsing time of descriptive chords by number of intervals.
+# Usage: PYTHONPATH=. python benchmarks/descriptive.py [repeats]
+
+import sys
+import time
+
+import harmalysis.parsers.roman as roman
+
+INTERVALS = ['M2', 'M3', 'P4', 'P5', 'M6', 'm7', 'P8', 'M9', 'm10', 'P11', 'A12', 'M13', 'm14', 'P15']
+ROOTS = ['?C', '?e#', 'C:?bVI']
+
+
+def labels(count):
+    return [root + ''.join(INTERVALS[:count]) for root in ROOTS]
+
+
+def seconds_per_label(queries, repeats):
+    # The parse tree cache is bypassed, every label is parsed again
+    for query in queries:
+        roman.parse(query)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            roman.RomanParser().transform(roman.parser.parse(query))
+    return (time.perf_counter() - start) / (repeats * len(queries))
+
+
+def main(repeats=200):
+    print('{:<12}{:>12}'.format('intervals', 'us/label'))
+    for count in (2, 4, 8, 14):
+        print('{:<12}{:>12.1f}'.format(count, seconds_per_label(labels(count), repeats) * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
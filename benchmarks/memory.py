@@ -0,0 +1,38 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Bytes kept alive per parsed label, by chord family.
+# Usage: PYTHONPATH=. python benchmarks/memory.py [copies]
+
+import sys
+
+from harmalysis.footprint import COPIES, FAMILIES, FOOTPRINTS, bytes_per_label
+
+
+def main(copies=COPIES):
+    print('{:<12}{:>12}{:>12}{:>18}'.format('family', 'recorded', 'bytes/label', 'with spellings'))
+    for family, labels in FAMILIES.items():
+        print('{:<12}{:>12}{:>12.0f}{:>18.0f}'.format(
+            family,
+            FOOTPRINTS[family],
+            bytes_per_label(labels, copies),
+            bytes_per_label(labels, copies, pitch_classes=True)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COPIES)
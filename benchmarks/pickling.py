@@ -0,0 +1,82 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Pickled bytes and round-trip time per parsed label, with the compact
+# reductions of harmalysis.classes and with the default object graph.
+# Usage: PYTHONPATH=. python benchmarks/pickling.py [copies]
+
+import copyreg
+import io
+import pickle
+import sys
+import time
+
+import harmalysis.parsers.roman as roman
+
+FAMILIES = {
+    'tertian': ['C:I', 'C:V7', 'C:ii65', 'c:viio7', 'C:bVI', 'C:V9'],
+    'special': ['C:Ger65', 'c:It6', 'C:Fr43', 'c:N6', 'C:Cad64', 'C:CTo7'],
+    'descriptive': ['?CM3P5', '?e#m3D5m7', 'C:?bVIM3P5'],
+    'tonicized': ['C:V7/V', 'C:viio7/ii', 'C:V/V/V', 'c:iv6/bVI'],
+    'alternate': ['C:I[V]', 'C:V7/V[ii7]', 'C:I[G:V]'],
+}
+
+
+class DefaultPickler(pickle.Pickler):
+    # Ignores the custom reductions, as objects were pickled before them
+    def reducer_override(self, obj):
+        if type(obj).__module__.startswith('harmalysis.classes'):
+            return (copyreg.__newobj__, (type(obj),), obj.__dict__)
+        return NotImplemented
+
+
+def dumps(analyses, default=False):
+    if not default:
+        return pickle.dumps(analyses, protocol=pickle.HIGHEST_PROTOCOL)
+    out = io.BytesIO()
+    DefaultPickler(out, protocol=pickle.HIGHEST_PROTOCOL).dump(analyses)
+    return out.getvalue()
+
+
+def round_trip(labels, copies=200, default=False, chunk=1):
+    # Labels are pickled in chunks, as the results of a process pool
+    analyses = roman.parse_batch(labels * copies)
+    chunks = [analyses[i:i + chunk] for i in range(0, len(analyses), chunk)]
+    size = 0
+    start = time.perf_counter()
+    for results in chunks:
+        data = dumps(results, default)
+        size += len(data)
+        pickle.loads(data)
+    elapsed = time.perf_counter() - start
+    return size / len(analyses), elapsed / len(analyses) * 1e6
+
+
+def main(copies=200):
+    print('{:<12}{:>7}{:>16}{:>16}{:>16}{:>16}'.format(
+        'family', 'chunk', 'bytes/label', 'default', 'us/label', 'default'))
+    for family, labels in FAMILIES.items():
+        for chunk in (1, 100):
+            size, elapsed = round_trip(labels, copies, chunk=chunk)
+            default_size, default_elapsed = round_trip(labels, copies, default=True, chunk=chunk)
+            print('{:<12}{:>7}{:>16.0f}{:>16.0f}{:>16.1f}{:>16.1f}'.format(
+                family, chunk, size, default_size, elapsed, default_elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -18,11 +18,27 @@
 
 import harmalysis.parsers.roman
 import harmalysis.parsers.chordlabel
+import harmalysis.parsers.canonical
 
-def parse(query, syntax='roman'):
+def parse(query, syntax='roman', limits=None):
     if syntax == 'roman':
-        roman = harmalysis.parsers.roman.parse(query)
+        roman = harmalysis.parsers.roman.parse(query, limits=limits)
         return roman
     elif syntax == 'chordlabel':
-        chordlabel = harmalysis.parsers.chordlabel.parse(query)
-        return chordlabel
\ No newline at end of file
+        chordlabel = harmalysis.parsers.chordlabel.parse(query, limits=limits)
+        return chordlabel
+
+def validate(queries):
+    return harmalysis.parsers.roman.validate(queries)
+
+def normalize(query):
+    return harmalysis.parsers.canonical.normalize(query)
+
+def realize(progression):
+    # Imported here, numpy is not needed to parse labels
+    import harmalysis.voicing
+    return harmalysis.voicing.realize(progression)
+
+def diff(a, b, onsets_a=None, onsets_b=None):
+    import harmalysis.agreement
+    return harmalysis.agreement.diff(a, b, onsets_a, onsets_b)
@@ -19,7 +19,7 @@
 import harmalysis.parsers.roman
 import harmalysis.parsers.chordlabel
 import harmalysis.classes.pitch_class
-import lark.exceptions
+import harmalysis.functions
 
 test_strings = [
     'C:viio65',
@@ -37,17 +37,18 @@ if __name__ == '__main__':
         try:
             roman = harmalysis.parsers.roman.parse(query)
             chordlabel = harmalysis.parsers.chordlabel.parse(str(roman.chord))
-        except lark.exceptions.UnexpectedCharacters:
+            harmalysis.functions.infer_functions([roman])
+        except harmalysis.parsers.roman.UnexpectedCharacters:
             print('Invalid entry. Try again.')
             continue
         print('\tCurrent key: ' + str(roman.main_key))
         print('\tTonicized key: ' + str(roman.secondary_key))
         print('\tIntervallic construction: ' + str(roman.chord))
         print('\tInversion: ' + str(roman.chord.inversion))
-        print('\tChord label: ' + chordlabel)
+        print('\tChord label: ' + chordlabel.description)
         print('\tDefault function: ' + roman.chord.default_function)
         print('\tChord pitches: ' + str(roman.chord.get_pitch_spellings()))
         print('\tChord pitch classes: ' + str(roman.chord.get_pitch_classes()))
-        # print('\tContextual function: ' + roman.chord.contextual_function)
+        print('\tContextual function: ' + roman.chord.contextual_function)
         main_key = roman.main_key
 
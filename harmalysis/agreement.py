@@ -0,0 +1,211 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Aligned comparison of two analyses of the same piece, e.g., by two
+# annotators or by two releases of harmalysis. Every analysis is reduced
+# once to an integer code per level and the levels are compared as arrays.
+
+import collections
+import difflib
+
+import numpy as np
+
+import harmalysis.parsers.roman as roman
+from harmalysis import stats
+from harmalysis.classes.harmalysis import Harmalysis
+from harmalysis.classes.key import Key
+from harmalysis.parsers.roman_lalr import UnexpectedInput, VisitError
+
+LEVELS = ['label', 'degree', 'chord', 'pcset', 'key']
+MISSING = -1
+_missing = (MISSING,) * len(LEVELS)
+
+# Every sequence is read from the key a label starts with
+_initial_key = Key("C", scale="major")
+
+Mismatch = collections.namedtuple('Mismatch', ['index_a', 'index_b', 'onset', 'label_a', 'label_b', 'levels'])
+
+
+def _spelled_code(chord):
+    if chord.root is None:
+        return MISSING
+    return chord.get_spelled_code()
+
+
+def _pcset_code(chord):
+    return chord.get_pcset_code() if chord.root is not None else MISSING
+
+
+class _Encoder(object):
+    # Label codes are shared by both sequences (and by every piece compared
+    # with the same encoder). Labels are parsed and encoded once for each
+    # established key, the only state that changes their meaning.
+    def __init__(self):
+        self.label_ids = {}
+        self.queries = {}
+
+    def codes(self, analysis):
+        label = analysis.to_label('reference')
+        chord = analysis.chord
+        key = analysis.main_key
+        return (
+            self.label_ids.setdefault(label, len(self.label_ids)),
+            stats.degree_code(chord),
+            _spelled_code(chord),
+            _pcset_code(chord),
+            key.to_code() if key else MISSING,
+        ), label
+
+    def parse(self, query):
+        cached = '=>' not in query
+        if cached:
+            state = (query, Harmalysis.established_key.to_code())
+            if state in self.queries:
+                return self.queries[state]
+        try:
+            analysis = roman.RomanParser().transform(roman.parse_tree(query))
+            result = self.codes(analysis)
+        except (UnexpectedInput, VisitError, ValueError):
+            # Kept as written, it never agrees with anything
+            result = (_missing, query)
+        if cached:
+            self.queries[state] = result
+        return result
+
+    def encode(self, sequence):
+        # Accepts labels, Harmalysis objects and None (a missing analysis).
+        # The key established by another sequence does not carry over.
+        rows = []
+        labels = []
+        established_key = Harmalysis.established_key
+        Harmalysis.established_key = _initial_key
+        try:
+            for item in sequence:
+                if item is None:
+                    row, label = _missing, None
+                elif isinstance(item, str):
+                    row, label = self.parse(item)
+                else:
+                    try:
+                        row, label = self.codes(item)
+                    except ValueError:
+                        row, label = _missing, None
+                rows.append(row)
+                labels.append(label)
+        finally:
+            Harmalysis.established_key = established_key
+        codes = np.array(rows, dtype=np.int64).reshape(-1, len(LEVELS))
+        return codes, labels
+
+
+def align(codes_a, codes_b):
+    # Pairs of indices (-1 for a gap) from the longest matching blocks of
+    # the two sequences; replaced blocks are paired position by position
+    matcher = difflib.SequenceMatcher(None, codes_a.tolist(), codes_b.tolist(), autojunk=False)
+    pairs = []
+    for _, i1, i2, j1, j2 in matcher.get_opcodes():
+        length = max(i2 - i1, j2 - j1)
+        for k in range(length):
+            pairs.append((i1 + k if i1 + k < i2 else MISSING, j1 + k if j1 + k < j2 else MISSING))
+    return np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+
+def align_onsets(onsets_a, onsets_b):
+    # Every onset of either sequence, paired with the analyses sounding at
+    # that time in each one (-1 before the first analysis)
+    onsets_a = np.asarray(onsets_a, dtype=np.float64)
+    onsets_b = np.asarray(onsets_b, dtype=np.float64)
+    if np.any(np.diff(onsets_a) < 0) or np.any(np.diff(onsets_b) < 0):
+        raise ValueError('onsets must be sorted.')
+    onsets = np.union1d(onsets_a, onsets_b)
+    pairs = np.stack([
+        np.searchsorted(onsets_a, onsets, side='right') - 1,
+        np.searchsorted(onsets_b, onsets, side='right') - 1,
+    ], axis=1)
+    return pairs, onsets
+
+
+class AnalysisDiff(object):
+    def __init__(self, pairs, codes_a, codes_b, labels_a, labels_b, onsets=None):
+        self.pairs = pairs
+        self.onsets = onsets
+        self.labels_a = labels_a
+        self.labels_b = labels_b
+        gap = (pairs[:, 0] == MISSING) | (pairs[:, 1] == MISSING)
+        aligned_a = codes_a[pairs[:, 0]]
+        aligned_b = codes_b[pairs[:, 1]]
+        # A missing analysis or a missing level is never in agreement
+        valid = ~gap[:, np.newaxis] & (aligned_a != MISSING) & (aligned_b != MISSING)
+        self.equal = valid & (aligned_a == aligned_b)
+        self.compared = int(np.count_nonzero(~gap))
+        self.matches = dict(zip(LEVELS, self.equal.sum(axis=0).tolist()))
+        self.gaps = int(np.count_nonzero(gap))
+
+    def __len__(self):
+        return len(self.pairs)
+
+    @property
+    def agreement(self):
+        # Proportion of the aligned positions that agree at each level
+        return {level: matches / self.compared if self.compared else 0.0 for level, matches in self.matches.items()}
+
+    @property
+    def mismatches(self):
+        disagreements = np.flatnonzero(~self.equal[:, 0])
+        result = []
+        for position in disagreements.tolist():
+            i, j = self.pairs[position].tolist()
+            result.append(Mismatch(
+                i, j,
+                float(self.onsets[position]) if self.onsets is not None else None,
+                self.labels_a[i] if i != MISSING else None,
+                self.labels_b[j] if j != MISSING else None,
+                tuple(level for level, equal in zip(LEVELS, self.equal[position].tolist()) if not equal),
+            ))
+        return result
+
+
+def diff(a, b, onsets_a=None, onsets_b=None, encoder=None):
+    # a and b are sequences of labels or Harmalysis objects. Without onsets
+    # the sequences are aligned by their labels.
+    if (onsets_a is None) != (onsets_b is None):
+        raise ValueError('onsets are needed for both sequences.')
+    encoder = encoder or _Encoder()
+    codes_a, labels_a = encoder.encode(a)
+    codes_b, labels_b = encoder.encode(b)
+    onsets = None
+    if onsets_a is None:
+        pairs = align(codes_a[:, 0], codes_b[:, 0])
+    else:
+        if len(onsets_a) != len(codes_a) or len(onsets_b) != len(codes_b):
+            raise ValueError('there must be one onset per analysis.')
+        pairs, onsets = align_onsets(onsets_a, onsets_b)
+    return AnalysisDiff(pairs, codes_a, codes_b, labels_a, labels_b, onsets)
+
+
+def diff_corpus(pieces):
+    # pieces yields (a, b) or (a, b, onsets_a, onsets_b) tuples. Returns
+    # the diff of every piece and the agreement pooled over all of them.
+    encoder = _Encoder()
+    diffs = [diff(*piece, encoder=encoder) for piece in pieces]
+    compared = sum(d.compared for d in diffs)
+    agreement = {
+        level: sum(d.matches[level] for d in diffs) / compared if compared else 0.0
+        for level in LEVELS
+    }
+    return diffs, agreement
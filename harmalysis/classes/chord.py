@@ -16,7 +16,48 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from harmalysis.classes import interval
+import functools
+import operator
+
+import harmalysis.common as common
+from harmalysis.classes import interval, pitch_class
+
+# Identity codes: the quality of each interval (0 when missing) takes
+# QUALITY_BITS bits above the ROOT_BITS bits of the root spelling
+QUALITY_BITS = 3
+ROOT_BITS = 6
+_quality_codes = {quality: code for code, quality in enumerate(interval.IntervalSpelling.interval_qualities, 1)}
+
+
+# Attributes that are not pickled as they are
+_unpickled = ('root', 'intervals', 'pitch_spellings', 'pcset')
+
+
+def _unpickle(cls, root, intervals, fields, state):
+    chord = cls.__new__(cls)
+    chord.root = pitch_class.from_code(root) if root is not None else None
+    chord.intervals = dict.fromkeys(range(2, 16))
+    for step in chord.intervals:
+        code = (intervals >> (QUALITY_BITS * (step - 2))) & ((1 << QUALITY_BITS) - 1)
+        if code:
+            chord.intervals[step] = interval.from_code((code - 1) * 16 + step)
+    chord.pitch_spellings = None
+    chord.pcset = None
+    chord.__dict__.update(zip(cls._pickled, fields))
+    if state:
+        chord.__dict__.update(state)
+    return chord
+
+
+@functools.lru_cache(maxsize=None)
+def set_classes():
+    # set_classes()[mask] is the smallest transposition of a 12-bit
+    # pitch-class mask, shared by every set of the same set class
+    full = (1 << common.PITCH_CLASSES) - 1
+    return tuple(
+        min(((mask << t) | (mask >> (common.PITCH_CLASSES - t))) & full for t in range(common.PITCH_CLASSES))
+        for mask in range(full + 1)
+    )
 
 
 class DescriptiveChord(object):
@@ -38,6 +79,12 @@ class DescriptiveChord(object):
         'vii': 'dominant'
     }
 
+    # Function of the chord regardless of its context, if any
+    given_function = None
+
+    # Attributes pickled by position, see __reduce__()
+    _pickled = ('scale_degree', 'scale_degree_alteration', 'default_function', 'contextual_function', 'chord_label', 'bass')
+
     def __init__(self):
         self.scale_degree = None
         self.scale_degree_alteration = None
@@ -86,6 +133,47 @@ class DescriptiveChord(object):
             self.get_pitch_spellings()
         return tuple([x.chromatic_class for x in self.pitch_spellings])
 
+    def _intervals_code(self):
+        code = 0
+        for step in sorted(self.intervals, reverse=True):
+            interv = self.intervals[step]
+            code = (code << QUALITY_BITS) | (_quality_codes[interv.interval_quality] if interv else 0)
+        return code
+
+    def get_spelled_code(self):
+        # Root spelling and interval qualities, e.g., Ger and V7/N differ
+        alteration = pitch_class.PitchClassSpelling.alterations.get(self.root.alteration, 0)
+        return (self._intervals_code() << ROOT_BITS) | (self.root.diatonic_class * 5 + alteration + 2)
+
+    def get_pcset_code(self):
+        # 12-bit mask of the pitch classes, equal for enharmonic spellings
+        if self.pcset is None:
+            mask = 0
+            for pc in self.get_pitch_classes():
+                mask |= 1 << pc
+            self.pcset = mask
+        return self.pcset
+
+    def get_set_class_code(self):
+        # Equal for every transposition of the pitch-class set
+        return set_classes()[self.get_pcset_code()]
+
+    def __reduce__(self):
+        # The root and the intervals are pickled as small integers, the
+        # cached spellings are computed again when needed
+        state = None
+        if len(self.__dict__) > len(self._pickled) + len(_unpickled):
+            state = {name: value for name, value in self.__dict__.items() if name not in self._pickled and name not in _unpickled}
+        root = self.root.to_code() if self.root else None
+        return (_unpickle, (type(self), root, self._intervals_code(), operator.attrgetter(*self._pickled)(self), state))
+
+    def to_label(self, key=None):
+        if self.scale_degree:
+            root = pitch_class.PitchClassSpelling.canonical_alteration(self.scale_degree_alteration) + self.scale_degree.lower()
+        else:
+            root = self.root.to_label()
+        return '?' + root + ''.join(str(interv) for interv in self.intervals.values() if interv)
+
     def __str__(self):
         ret = str(self.root)
         for interv in self.intervals.values():
@@ -102,6 +190,8 @@ class InvertibleChord(DescriptiveChord):
         'a', 'b', 'c', 'd', 'e', 'f', 'g'
     ]
 
+    _pickled = DescriptiveChord._pickled + ('inversion',)
+
     def __init__(self):
         super().__init__()
         self.inversion = 0
@@ -125,6 +215,10 @@ class InvertibleChord(DescriptiveChord):
             raise KeyError("the inversion letter '{}' is not supported".format(inversion_by_letter))
         self.inversion = self.inversions_by_letter.index(inversion_by_letter)
 
+    def inversion_label(self):
+        # Canonical labels spell every inversion by letter, root position is implicit
+        return self.inversions_by_letter[self.inversion] if self.inversion else ''
+
 
 class TertianChord(InvertibleChord):
     triad_qualities = [
@@ -133,6 +227,14 @@ class TertianChord(InvertibleChord):
         'diminished_triad',
         'augmented_triad'
     ]
+    triad_quality_labels = {
+        'major_triad': '',
+        'minor_triad': '',
+        'diminished_triad': 'o',
+        'augmented_triad': '+'
+    }
+
+    _pickled = InvertibleChord._pickled + ('triad_quality',)
 
     def __init__(self):
         super().__init__()
@@ -155,8 +257,43 @@ class TertianChord(InvertibleChord):
             self.add_interval(interval.IntervalSpelling('M', 3))
             self.add_interval(interval.IntervalSpelling('A', 5))
 
+    def added_interval(self, step):
+        # Diatonic extensions are stored as simple intervals (e.g., a ninth as a second)
+        if step > 7 and not self.intervals[step]:
+            return self.intervals[step - 7]
+        return self.intervals[step]
+
+    def to_label(self, key):
+        label = pitch_class.PitchClassSpelling.canonical_alteration(self.scale_degree_alteration)
+        label += self.scale_degree + self.triad_quality_labels[self.triad_quality]
+        added = [step for step in (7, 9, 11, 13) if self.added_interval(step)]
+        if added:
+            highest = added[-1]
+            quality = self.added_interval(highest).interval_quality
+            try:
+                diatonic_quality = key.diatonic_interval(self.scale_degree, self.root, highest).interval_quality
+            except ValueError:
+                # Keys with many alterations (e.g., 'D##:') cannot spell every
+                # diatonic step; the quality of the extension is written out
+                diatonic_quality = None
+            # A diatonic extension implies the diatonic extensions below it
+            if added == [7, 9, 11, 13][:len(added)] and diatonic_quality == quality:
+                label += str(highest)
+            else:
+                label += quality + str(highest)
+        missing = [step for step in (3, 5) if not self.intervals[step]]
+        return label + self.inversion_label() + ''.join('x{}'.format(step) for step in missing)
+
 
 class AugmentedSixthChord(InvertibleChord):
+    augmented_sixth_labels = {
+        'german': 'Ger',
+        'french': 'Fr',
+        'italian': 'It'
+    }
+
+    _pickled = InvertibleChord._pickled + ('augmented_sixth_type',)
+
     def __init__(self, augmented_sixth_type):
         super().__init__()
         self.set_scale_degree('iv', '#')
@@ -168,6 +305,9 @@ class AugmentedSixthChord(InvertibleChord):
         elif self.augmented_sixth_type == 'french':
             self.add_interval(interval.IntervalSpelling("m", 6))
 
+    def to_label(self, key=None):
+        return self.augmented_sixth_labels[self.augmented_sixth_type] + self.inversion_label()
+
 
 class NeapolitanChord(TertianChord):
     def __init__(self):
@@ -177,6 +317,9 @@ class NeapolitanChord(TertianChord):
         self.add_interval(interval.IntervalSpelling('M', 3))
         self.add_interval(interval.IntervalSpelling('P', 5))
 
+    def to_label(self, key=None):
+        return 'N' + self.inversion_label()
+
 
 class HalfDiminishedChord(TertianChord):
     def __init__(self, scale_degree='vii'):
@@ -191,32 +334,47 @@ class HalfDiminishedChord(TertianChord):
         self.add_interval(interval.IntervalSpelling("D", 5))
         self.add_interval(interval.IntervalSpelling("m", 7))
 
+    def to_label(self, key):
+        if self.scale_degree != 'vii':
+            return super().to_label(key)
+        return 'vii0' + self.inversion_label()
+
 
 class CadentialSixFourChord(TertianChord):
+    given_function = 'dominant'
+
     def __init__(self):
         super().__init__()
         self.set_inversion_by_number(64)
 
+    def to_label(self, key=None):
+        return 'Cad'
+
     def set_as_major(self):
-        self.set_scale_degree('I', function='dominant')
+        self.set_scale_degree('I', function=self.given_function)
         self.triad_quality = "major_triad"
         self.add_interval(interval.IntervalSpelling("M", 3))
         self.add_interval(interval.IntervalSpelling("P", 5))
 
     def set_as_minor(self):
-        self.set_scale_degree('i', function='dominant')
+        self.set_scale_degree('i', function=self.given_function)
         self.triad_quality = "minor_triad"
         self.add_interval(interval.IntervalSpelling("m", 3))
         self.add_interval(interval.IntervalSpelling("P", 5))
 
 
 class CommonToneDiminishedChord(TertianChord):
+    given_function = 'subdominant'
+
     def __init__(self):
         super().__init__()
         # TODO: Figure out this one more in depth
-        self.set_scale_degree('I', function='subdominant')
+        self.set_scale_degree('I', function=self.given_function)
         self.triad_quality = "diminished_triad"
         self.add_interval(interval.IntervalSpelling("m", 3))
         self.add_interval(interval.IntervalSpelling("D", 5))
         self.add_interval(interval.IntervalSpelling("D", 7))
 
+    def to_label(self, key=None):
+        return 'CTo' + self.inversion_label()
+
@@ -0,0 +1,94 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import enum
+import functools
+
+from harmalysis.classes import interval, pitch_class
+
+
+class ChordType(enum.Enum):
+    MAJOR = 'major'
+    MINOR = 'minor'
+    AUGMENTED = 'augmented'
+    DIMINISHED = 'diminished'
+    MAJOR_SEVENTH = 'major seventh'
+    DOMINANT_SEVENTH = 'dominant seventh'
+    AUGMENTED_MAJOR_SEVENTH = 'augmented major seventh'
+    MINOR_SEVENTH = 'minor seventh'
+    MINOR_MAJOR_SEVENTH = 'minor major seventh'
+    HALF_DIMINISHED_SEVENTH = 'half-diminished seventh'
+    FULLY_DIMINISHED_SEVENTH = 'fully-diminished seventh'
+    ITALIAN_AUGMENTED_SIXTH = 'italian augmented sixth'
+    FRENCH_AUGMENTED_SIXTH = 'french augmented sixth'
+    GERMAN_AUGMENTED_SIXTH = 'german augmented sixth'
+
+
+# The intervals above the root, as spelled in the labels
+chord_type_intervals = {
+    ChordType.MAJOR: 'M3P5',
+    ChordType.MINOR: 'm3P5',
+    ChordType.AUGMENTED: 'M3A5',
+    ChordType.DIMINISHED: 'm3D5',
+    ChordType.MAJOR_SEVENTH: 'M3P5M7',
+    ChordType.DOMINANT_SEVENTH: 'M3P5m7',
+    ChordType.AUGMENTED_MAJOR_SEVENTH: 'M3A5M7',
+    ChordType.MINOR_SEVENTH: 'm3P5m7',
+    ChordType.MINOR_MAJOR_SEVENTH: 'm3P5M7',
+    ChordType.HALF_DIMINISHED_SEVENTH: 'm3D5m7',
+    ChordType.FULLY_DIMINISHED_SEVENTH: 'm3D5D7',
+    ChordType.ITALIAN_AUGMENTED_SIXTH: 'D3D5',
+    ChordType.FRENCH_AUGMENTED_SIXTH: 'D3D5m6',
+    ChordType.GERMAN_AUGMENTED_SIXTH: 'D3D5D7',
+}
+
+
+class ChordLabel(object):
+    # Shared by every label of the same chord, see from_codes()
+    def __init__(self, root, chord_type):
+        self.root = root
+        self.chord_type = chord_type
+        spelled = chord_type_intervals[chord_type]
+        self.intervals = tuple(
+            interval.from_code(interval.IntervalSpelling.interval_qualities.index(spelled[i]) * 16 + int(spelled[i + 1]))
+            for i in range(0, len(spelled), 2)
+        )
+
+    @property
+    def description(self):
+        return '{} {}'.format(self.root, self.chord_type.value)
+
+    def get_pitch_spellings(self):
+        return [self.root] + [self.root.to_interval(i) for i in self.intervals]
+
+    def get_pitch_classes(self):
+        return [pc.chromatic_class for pc in self.get_pitch_spellings()]
+
+    def __reduce__(self):
+        return (from_codes, (self.root.to_code(), self.chord_type.name))
+
+    def __repr__(self):
+        return 'ChordLabel({!r})'.format(self.description)
+
+    def __str__(self):
+        return self.description
+
+
+@functools.lru_cache(maxsize=None)
+def from_codes(root, chord_type):
+    return ChordLabel(pitch_class.from_code(root), ChordType[chord_type])
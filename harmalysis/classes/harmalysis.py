@@ -17,10 +17,18 @@
 '''
 
 from harmalysis.classes.key import Key
+import operator
 
 
 class Harmalysis(object):
     established_key = Key("C", scale="major")
+    # Attributes pickled by position, see __reduce__()
+    _pickled = ('main_key', 'secondary_key', 'chord', 'tonicized_keys', 'implicit', 'alternative')
+    _pickled_fields = operator.attrgetter(*_pickled)
+    key_function_labels = {
+        'reference': ':',
+        'established': '=>:'
+    }
 
     def __init__(self):
         self.main_key = None
@@ -29,3 +37,38 @@ class Harmalysis(object):
         self.tonicized_keys = []
         self.implicit = False
         self.alternative = None
+
+    def __reduce__(self):
+        state = None
+        if len(self.__dict__) > len(self._pickled):
+            state = {name: value for name, value in self.__dict__.items() if name not in self._pickled}
+        return (_unpickle, (self._pickled_fields(self), state))
+
+    def tonicization_label(self):
+        label = ''
+        parents = self.tonicized_keys[1:] + [self.main_key]
+        for tonicized_key, parent in zip(self.tonicized_keys, parents):
+            label += '/' + parent.scale_degree_label(tonicized_key.tonic, uppercase=tonicized_key.scale == 'major')
+        return label
+
+    def to_label(self, key_function=None):
+        label = self.chord.to_label(self.secondary_key or self.main_key) + self.tonicization_label()
+        if key_function and self.main_key:
+            label = self.main_key.to_label() + self.key_function_labels[key_function] + label
+        if self.alternative:
+            alternative_key_function = key_function
+            alternative_key = self.alternative.main_key
+            if not key_function and alternative_key and (not self.main_key or alternative_key.to_label() != self.main_key.to_label()):
+                alternative_key_function = 'reference'
+            label += '[{}]'.format(self.alternative.to_label(alternative_key_function))
+        if self.implicit:
+            label = '({})'.format(label)
+        return label
+
+
+def _unpickle(fields, state):
+    harmalysis = Harmalysis.__new__(Harmalysis)
+    harmalysis.__dict__.update(zip(Harmalysis._pickled, fields))
+    if state:
+        harmalysis.__dict__.update(state)
+    return harmalysis
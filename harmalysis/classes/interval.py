@@ -16,6 +16,8 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import functools
+
 import harmalysis.common
 from harmalysis.classes import pitch_class
 from harmalysis.classes import scale
@@ -55,10 +57,23 @@ class IntervalSpelling(object):
         self.alteration_effect = alteration_effects[interval_quality]
         self.semitones = scale.MajorScale().step_to_semitones(diatonic_interval) + self.alteration_effect
 
+    def to_code(self):
+        return IntervalSpelling.interval_qualities.index(self.interval_quality) * 16 + self.diatonic_interval
+
+    def __reduce__(self):
+        # Pickled as a small integer, unpickled as a shared instance
+        return (from_code, (self.to_code(),))
+
     def __str__(self):
         return '{}{}'.format(self.interval_quality, self.diatonic_interval)
 
 
+@functools.lru_cache(maxsize=None)
+def from_code(code):
+    quality, diatonic_interval = divmod(code, 16)
+    return IntervalSpelling(IntervalSpelling.interval_qualities[quality], diatonic_interval)
+
+
 def test_intervals():
     orig = pitch_class.PitchClassSpelling('C')
     M6 = IntervalSpelling('P', 1)
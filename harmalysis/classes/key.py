@@ -18,6 +18,7 @@
 
 from harmalysis.classes import scale, interval, pitch_class
 import harmalysis.common as common
+import functools
 
 
 class Key(object):
@@ -25,7 +26,14 @@ class Key(object):
         "major": scale.MajorScale(),
         "natural_minor": scale.NaturalMinorScale(),
         "harmonic_minor": scale.HarmonicMinorScale(), "minor": scale.HarmonicMinorScale(),
-        "ascending_melodic_minor": scale.AscendingMelodicMinorScale()
+        "ascending_melodic_minor": scale.AscendingMelodicMinorScale(),
+        "ionian": scale.Scale((2, 2, 1, 2, 2, 2, 1)),
+        "dorian": scale.Scale((2, 1, 2, 2, 2, 1, 2)),
+        "phrygian": scale.Scale((1, 2, 2, 2, 1, 2, 2)),
+        "lydian": scale.Scale((2, 2, 2, 1, 2, 2, 1)),
+        "mixolydian": scale.Scale((2, 2, 1, 2, 2, 1, 2)),
+        "aeolian": scale.Scale((2, 1, 2, 2, 1, 2, 2)),
+        "locrian": scale.Scale((1, 2, 2, 1, 2, 2, 2)),
     }
     _scale_degree_alterations = {
         '--': interval.IntervalSpelling('DD', 1),
@@ -36,6 +44,13 @@ class Key(object):
         "##": interval.IntervalSpelling('AA', 1),
         "x": interval.IntervalSpelling('AA', 1)
     }
+    # Scales in the order used by to_code()
+    code_scales = tuple(_scale_mapping)
+    _scale_suffixes = {
+        "natural_minor": "_nat",
+        "harmonic_minor": "", "minor": "",
+        "ascending_melodic_minor": "_mel"
+    }
 
     def __init__(self, note_letter, alteration=None, scale="major"):
         self.tonic = pitch_class.PitchClassSpelling(note_letter, alteration)
@@ -60,5 +75,45 @@ class Key(object):
             pc = pc.to_interval(unison_alteration)
         return pc
 
+    def scale_degree_label(self, pc, uppercase=True):
+        # Inverse of scale_degree(): the roman numeral that leads to pc
+        degree = (pc.diatonic_class - self.tonic.diatonic_class) % common.DIATONIC_CLASSES + 1
+        unaltered = self.scale_degree(degree)
+        alteration = (pc.chromatic_class - unaltered.chromatic_class + 6) % common.PITCH_CLASSES - 6
+        numeral = common.int_to_roman[degree]
+        if not uppercase:
+            numeral = numeral.lower()
+        return pitch_class.PitchClassSpelling.alterations_canonical[alteration] + numeral
+
+    def diatonic_interval(self, scale_degree, root, step):
+        # The interval from root to the diatonic step above the (unaltered) scale degree
+        if type(scale_degree) == str:
+            scale_degree = common.roman_to_int[scale_degree]
+        unaltered_root = self.scale_degree(scale_degree)
+        destination = unaltered_root.to_interval(self.mode.step_to_interval_spelling(step, mode=scale_degree))
+        return interval.pitch_class_to_pitch_class(root, destination)
+
+    def to_code(self):
+        return self.tonic.to_code() * len(self.code_scales) + self.code_scales.index(self.scale)
+
+    def __reduce__(self):
+        # Pickled as a small integer, unpickled as a shared instance
+        return (from_code, (self.to_code(),))
+
+    def to_label(self):
+        tonic = self.tonic.to_label()
+        if self.scale == "major":
+            return tonic
+        if self.scale not in self._scale_suffixes:
+            raise ValueError("scale '{}' has no label.".format(self.scale))
+        return tonic.lower() + self._scale_suffixes[self.scale]
+
     def __str__(self):
-        return str(self.tonic) + " " + self.scale
\ No newline at end of file
+        return str(self.tonic) + " " + self.scale
+
+
+@functools.lru_cache(maxsize=None)
+def from_code(code):
+    tonic, scale = divmod(code, len(Key.code_scales))
+    tonic = pitch_class.from_code(tonic)
+    return Key(tonic.note_letter, tonic.alteration, Key.code_scales[scale])
@@ -16,6 +16,8 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import functools
+
 import harmalysis.common
 from harmalysis.classes import interval
 
@@ -34,6 +36,18 @@ class PitchClassSpelling(object):
         1: '#',
         2: 'x'
     }
+    # The spelling used by canonical labels ('b' and 'x' are also
+    # note letters and missing-interval symbols in the grammar)
+    alterations_canonical = {
+        -2: '--',
+        -1: '-',
+        0: '',
+        1: '#',
+        2: '##'
+    }
+
+    # Alterations as spelled in the labels, in the order used by to_code()
+    code_alterations = ('', '#', '##', 'x', 'b', 'bb', '-', '--')
 
     def __init__(self, note_letter, alteration=None):
         note_letter = note_letter.upper()
@@ -84,6 +98,27 @@ class PitchClassSpelling(object):
         new_chromatic_class = (semitones + self.chromatic_class) % 12
         return PitchClassSpelling.from_diatonic_chromatic_classes(new_diatonic_class, new_chromatic_class)
 
+    @classmethod
+    def canonical_alteration(cls, alteration):
+        if not alteration:
+            return ''
+        return cls.alterations_canonical[cls.alterations[alteration]]
+
+    def to_code(self):
+        return self.diatonic_class * len(self.code_alterations) + self.code_alterations.index(self.alteration)
+
+    def __reduce__(self):
+        # Pickled as a small integer, unpickled as a shared instance
+        return (from_code, (self.to_code(),))
+
+    def to_label(self):
+        return self.note_letter + self.canonical_alteration(self.alteration)
+
     def __str__(self):
         return '{}{}'.format(self.note_letter, self.alteration)
 
+
+@functools.lru_cache(maxsize=None)
+def from_code(code):
+    diatonic_class, alteration = divmod(code, len(PitchClassSpelling.code_alterations))
+    return PitchClassSpelling(PitchClassSpelling.diatonic_classes[diatonic_class], PitchClassSpelling.code_alterations[alteration])
@@ -16,125 +16,95 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import functools
+
 import harmalysis.common
 from harmalysis.classes import interval
 
-class MajorScale(object):
-    def __init__(self):
-        self._qualities = [
-            # Starting from I
-            ['P', 'M', 'M', 'P', 'P', 'M', 'M'],
-            # Starting from II
-            ['P', 'M', 'm', 'P', 'P', 'M', 'm'],
-            # Starting from III
-            ['P', 'm', 'm', 'P', 'P', 'm', 'm'],
-            # Starting from IV
-            ['P', 'M', 'M', 'A', 'P', 'M', 'M'],
-            # Starting from V
-            ['P', 'M', 'M', 'P', 'P', 'M', 'm'],
-            # Starting from VI
-            ['P', 'M', 'm', 'P', 'P', 'm', 'm'],
-            # Starting from VII
-            ['P', 'm', 'm', 'P', 'D', 'm', 'm'],
-        ]
-
-        self._semitones = [
-            # Starting from I
-            [0, 2, 4, 5, 7, 9, 11],
-            # Starting from II
-            [0, 2, 3, 5, 7, 9, 10],
-            # Starting from III
-            [0, 1, 3, 5, 7, 8, 10],
-            # Starting from IV
-            [0, 2, 4, 6, 7, 9, 11],
-            # Starting from V
-            [0, 2, 4, 5, 7, 9, 10],
-            # Starting from VI
-            [0, 2, 3, 5, 7, 8, 10],
-            # Starting from VII
-            [0, 1, 3, 5, 6, 8, 10],
-        ]
+# Semitones from the tonic to each degree of the major scale, the
+# reference for the qualities of the intervals of every other scale
+_MAJOR_STEPS = (2, 2, 1, 2, 2, 2, 1)
+_DEGREES = harmalysis.common.DIATONIC_CLASSES
+_OCTAVE = harmalysis.common.PITCH_CLASSES
+_PERFECT_QUALITIES = {-2: 'DD', -1: 'D', 0: 'P', 1: 'A', 2: 'AA'}
+_NONPERFECT_QUALITIES = {-3: 'DD', -2: 'D', -1: 'm', 0: 'M', 1: 'A', 2: 'AA'}
+
+
+def _cumulative(steps):
+    semitones = [0]
+    for step in steps[:-1]:
+        semitones.append(semitones[-1] + step)
+    return semitones
+
+
+@functools.lru_cache(maxsize=None)
+def mode_tables(steps):
+    # The semitones and qualities of the intervals above every degree of a
+    # heptatonic scale, given by its steps in semitones (e.g., the major
+    # scale is (2, 2, 1, 2, 2, 2, 1)). Each table is a flat tuple of 7x7
+    # entries, indexed by (mode - 1) * 7 + (step - 1).
+    if len(steps) != _DEGREES or sum(steps) != _OCTAVE:
+        raise ValueError('a scale needs 7 steps adding up to an octave instead of {}'.format(steps))
+    reference = _cumulative(_MAJOR_STEPS)
+    semitones = []
+    qualities = []
+    for mode in range(_DEGREES):
+        row = _cumulative(steps[mode:] + steps[:mode])
+        for step, distance in enumerate(row, 1):
+            alterations = _PERFECT_QUALITIES if interval.is_perfect_interval(step) else _NONPERFECT_QUALITIES
+            difference = distance - reference[step - 1]
+            if difference not in alterations:
+                raise ValueError('the scale {} has an unsupported interval of {} semitones above degree {}'.format(steps, distance, mode + 1))
+            semitones.append(distance)
+            qualities.append(alterations[difference])
+    return tuple(semitones), tuple(qualities)
+
+
+@functools.lru_cache(maxsize=None)
+def mode_intervals(steps):
+    # The interned spellings of the simple intervals of mode_tables()
+    _, qualities = mode_tables(steps)
+    return tuple(
+        interval.from_code(interval.IntervalSpelling.interval_qualities.index(quality) * 16 + i % _DEGREES + 1)
+        for i, quality in enumerate(qualities)
+    )
+
+
+class Scale(object):
+    steps = _MAJOR_STEPS
+
+    def __init__(self, steps=None):
+        if steps is not None:
+            self.steps = tuple(steps)
+        # Shared by every scale with the same steps
+        self._semitones, self._qualities = mode_tables(self.steps)
+        self._intervals = None
 
     def step_to_interval_spelling(self, step, mode=1):
-        qualities = self._qualities[(mode - 1) % harmalysis.common.DIATONIC_CLASSES]
-        quality = qualities[(step - 1) % harmalysis.common.DIATONIC_CLASSES]
-        return interval.IntervalSpelling(quality, step)
+        index = (mode - 1) % _DEGREES * _DEGREES + (step - 1) % _DEGREES
+        if step <= _DEGREES:
+            if self._intervals is None:
+                self._intervals = mode_intervals(self.steps)
+            return self._intervals[index]
+        return interval.IntervalSpelling(self._qualities[index], step)
 
     def step_to_semitones(self, step, mode=1):
-        semitones = self._semitones[(mode - 1) % harmalysis.common.DIATONIC_CLASSES]
-        step_semitones = semitones[(step - 1) % harmalysis.common.DIATONIC_CLASSES]
-        octaves = (step - 1) // harmalysis.common.DIATONIC_CLASSES
-        distance = (12 * octaves) + step_semitones
-        return distance
+        octaves, step = divmod(step - 1, _DEGREES)
+        return _OCTAVE * octaves + self._semitones[(mode - 1) % _DEGREES * _DEGREES + step]
+
+
+class MajorScale(Scale):
+    steps = (2, 2, 1, 2, 2, 2, 1)
 
 
 class NaturalMinorScale(MajorScale):
-    def __init__(self):
-        super().__init__()
-        self._qualities = [
-            ['P', 'M', 'm', 'P', 'P', 'm', 'm'],
-            ['P', 'm', 'm', 'P', 'D', 'm', 'm'],
-            ['P', 'M', 'M', 'P', 'P', 'M', 'M'],
-            ['P', 'M', 'm', 'P', 'P', 'M', 'm'],
-            ['P', 'm', 'm', 'P', 'P', 'm', 'm'],
-            ['P', 'M', 'M', 'A', 'P', 'M', 'M'],
-            ['P', 'M', 'M', 'P', 'P', 'M', 'm'],
-        ]
-
-        self._semitones = [
-            [0, 2, 3, 5, 7, 8, 10],
-            [0, 1, 3, 5, 6, 8, 10],
-            [0, 2, 4, 5, 7, 9, 11],
-            [0, 2, 3, 5, 7, 9, 10],
-            [0, 1, 3, 5, 7, 8, 10],
-            [0, 2, 4, 6, 7, 9, 11],
-            [0, 2, 4, 5, 7, 9, 10],
-        ]
+    steps = (2, 1, 2, 2, 1, 2, 2)
 
 
 class HarmonicMinorScale(NaturalMinorScale):
-    def __init__(self):
-        super().__init__()
-        self._qualities = [
-            ['P', 'M', 'm', 'P', 'P', 'm', 'M'],
-            ['P', 'm', 'm', 'P', 'D', 'M', 'm'],
-            ['P', 'M', 'M', 'P', 'A', 'M', 'M'],
-            ['P', 'M', 'm', 'A', 'P', 'M', 'm'],
-            ['P', 'm', 'M', 'P', 'P', 'm', 'm'],
-            ['P', 'A', 'M', 'A', 'P', 'M', 'M'],
-            ['P', 'm', 'm', 'D', 'D', 'm', 'D'],
-        ]
-
-        self._semitones = [
-            [0, 2, 3, 5, 7, 8, 11],
-            [0, 1, 3, 5, 6, 9, 10],
-            [0, 2, 4, 5, 6, 9, 11],
-            [0, 2, 3, 6, 7, 9, 10],
-            [0, 1, 4, 5, 7, 8, 10],
-            [0, 3, 4, 6, 7, 9, 11],
-            [0, 1, 3, 4, 6, 8, 9],
-        ]
+    steps = (2, 1, 2, 2, 1, 3, 1)
 
 
 class AscendingMelodicMinorScale(HarmonicMinorScale):
-    def __init__(self):
-        super().__init__()
-        self._qualities = [
-            ['P', 'M', 'm', 'P', 'P', 'M', 'M'],
-            ['P', 'm', 'm', 'P', 'P', 'M', 'm'],
-            ['P', 'M', 'M', 'A', 'A', 'M', 'M'],
-            ['P', 'M', 'M', 'A', 'P', 'M', 'm'],
-            ['P', 'M', 'M', 'P', 'P', 'm', 'm'],
-            ['P', 'M', 'm', 'P', 'D', 'm', 'm'],
-            ['P', 'm', 'm', 'D', 'D', 'm', 'm'],
-        ]
-
-        self._semitones = [
-            [0, 2, 3, 5, 7, 9, 11],
-            [0, 1, 3, 5, 7, 9, 10],
-            [0, 2, 4, 6, 8, 9, 11],
-            [0, 2, 4, 6, 7, 9, 10],
-            [0, 2, 4, 5, 7, 8, 10],
-            [0, 2, 3, 5, 6, 8, 10],
-            [0, 1, 3, 4, 6, 8, 10]
-        ]
\ No newline at end of file
+    steps = (2, 1, 2, 2, 2, 2, 1)
+
@@ -35,4 +35,14 @@ roman_to_int = {
     'V':   5, 'v':   5,
     'VI':  6, 'vi':  6,
     'VII': 7, 'vii': 7
-}
\ No newline at end of file
+}
+
+int_to_roman = {
+    1: 'I',
+    2: 'II',
+    3: 'III',
+    4: 'IV',
+    5: 'V',
+    6: 'VI',
+    7: 'VII'
+}
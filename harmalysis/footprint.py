@@ -0,0 +1,65 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import gc
+import tracemalloc
+
+import harmalysis.parsers.roman as roman
+
+# Chord families, with the bytes kept alive per parsed label as measured by
+# benchmarks/memory.py. The tests fail when a family grows over TOLERANCE.
+FAMILIES = {
+    'tertian': ['I', 'V7', 'ii65', 'viio7', 'bVI', 'V9'],
+    'special': ['Ger65', 'It6', 'Fr43', 'N6', 'Cad64', 'CTo7'],
+    'descriptive': ['?CM3P5', '?e#m3D5m7', '?bVIM3P5'],
+    'tonicized': ['V7/V', 'viio7/ii', 'V/V/V', 'iv6/bVI'],
+    'alternate': ['I[V]', 'V7/V[ii7]', 'I[G:V]'],
+}
+FOOTPRINTS = {
+    'tertian': 1510,
+    'special': 1420,
+    'descriptive': 1160,
+    'tonicized': 1810,
+    'alternate': 3060,
+}
+TOLERANCE = 1.2
+COPIES = 200
+
+
+def bytes_per_label(labels, copies=COPIES, pitch_classes=False):
+    # The parse trees are cached first, so only the analyses are measured
+    roman.parse_batch(labels)
+    queries = labels * copies
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        analyses = roman.parse_batch(queries)
+        if pitch_classes:
+            for harmalysis in analyses:
+                harmalysis.chord.get_pitch_classes()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del analyses
+    return (after - before) / len(queries)
+
+
+def threshold(family):
+    return FOOTPRINTS[family] * TOLERANCE
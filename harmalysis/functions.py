@@ -0,0 +1,150 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import itertools
+
+from harmalysis.classes.chord import DescriptiveChord, CadentialSixFourChord
+
+FUNCTIONS = ['tonic', 'subdominant', 'dominant']
+UNKNOWN = 'unknown'
+
+# The function that prepares each function in a T-S-D-T progression, taken
+# by the applied dominants of a degree (e.g., V/V prepares the dominant)
+PREPARES = {
+    'tonic': 'dominant',
+    'subdominant': 'tonic',
+    'dominant': 'subdominant',
+}
+APPLIED_DOMINANTS = ('V', 'vii')
+# Steps of each function before the tonic
+_DISTANCES = {'tonic': 0, 'dominant': 1, 'subdominant': 2}
+
+# (scale degree, previous function, next function) -> contextual function,
+# None matches any function. The most specific rule wins.
+RULES = {
+    ('vi', 'dominant', None): 'tonic',        # deceptive resolution
+    ('VI', 'dominant', None): 'tonic',
+    ('iii', None, 'subdominant'): 'tonic',    # tonic substitute before the predominant
+    ('iii', 'tonic', 'tonic'): 'tonic',
+    ('III', None, 'dominant'): 'subdominant',
+    ('v', None, 'tonic'): 'dominant',         # minor dominant resolving to the tonic
+    ('v', None, 'subdominant'): 'dominant',   # descending bass, i-v6-iv6
+    ('VII', None, 'tonic'): 'dominant',       # subtonic resolving to the tonic
+    ('VII', None, 'subdominant'): 'tonic',    # V/III in a minor key
+    ('I', 'dominant', 'dominant'): 'tonic',
+    ('IV', 'tonic', 'tonic'): 'subdominant',  # plagal neighbour
+}
+
+
+def _table():
+    # Every combination of degree and neighbouring functions, precomputed
+    neighbours = FUNCTIONS + [UNKNOWN]
+    table = {}
+    for degree, default in DescriptiveChord.degree_default_function.items():
+        for previous, following in itertools.product(neighbours, neighbours):
+            for rule in ((degree, previous, following), (degree, previous, None), (degree, None, following)):
+                if rule in RULES:
+                    table[(degree, previous, following)] = RULES[rule]
+                    break
+            else:
+                table[(degree, previous, following)] = default
+    return table
+
+
+TRANSITIONS = _table()
+
+
+def _target_function(analysis):
+    # Function of the tonicized degree in the main key
+    target = analysis.tonicized_keys[-1]
+    degree = analysis.main_key.scale_degree_label(target.tonic, uppercase=target.scale == 'major').lstrip('#-')
+    return DescriptiveChord.degree_default_function.get(degree, UNKNOWN)
+
+
+def _key_label(analysis):
+    if analysis is None:
+        return None
+    return analysis.main_key.to_label() if analysis.main_key else ''
+
+
+def _tonicized_function(analysis):
+    # The function of a chord in the tonicized key, seen from the main key:
+    # the tonic of the tonicized key takes the function of the target, its
+    # dominant prepares the target, and its subdominant prepares that dominant
+    target = _target_function(analysis)
+    chord = analysis.chord
+    if target == UNKNOWN or not chord.scale_degree:
+        return UNKNOWN
+    if chord.scale_degree in APPLIED_DOMINANTS:
+        return PREPARES[target]
+    function = target
+    for _ in range(_DISTANCES.get(chord.default_function, 0)):
+        function = PREPARES[function]
+    return function
+
+
+def _given_function(analysis, key, targets):
+    # Functions that do not depend on the neighbours of a chord
+    if analysis is None:
+        return UNKNOWN
+    # Not the contextual function, which may be left by an earlier inference
+    if analysis.chord.given_function:
+        return analysis.chord.given_function
+    if analysis.tonicized_keys:
+        target = (key, analysis.tonicized_keys[-1].to_label(), analysis.chord.scale_degree, analysis.chord.default_function)
+        if target not in targets:
+            targets[target] = _tonicized_function(analysis)
+        return targets[target]
+    return None
+
+
+def infer_functions(analyses):
+    # Assigns the contextual function of every chord of a sequence from its
+    # neighbours, in a single pass. The previous chord contributes its
+    # inferred function and the next one its default function.
+    # A change of main key (or a missing analysis) breaks the context.
+    analyses = list(analyses)
+    keys = [_key_label(analysis) for analysis in analyses] + [object()]
+    targets = {}
+    given = [_given_function(analysis, key, targets) for analysis, key in zip(analyses, keys)]
+    functions = []
+    previous = UNKNOWN
+    for i, analysis in enumerate(analyses):
+        if analysis is None:
+            functions.append(UNKNOWN)
+            previous = UNKNOWN
+            continue
+        if i and keys[i - 1] != keys[i]:
+            previous = UNKNOWN
+        next_function = UNKNOWN
+        if keys[i + 1] == keys[i]:
+            next_function = given[i + 1] or analyses[i + 1].chord.default_function or UNKNOWN
+        chord = analysis.chord
+        if isinstance(chord, CadentialSixFourChord) and next_function != 'dominant':
+            # A six-four that does not resolve to the dominant prolongs the tonic
+            function = 'tonic'
+        elif given[i]:
+            function = given[i]
+        elif chord.scale_degree:
+            function = TRANSITIONS[(chord.scale_degree, previous, next_function)]
+        else:
+            function = UNKNOWN
+        chord.contextual_function = function
+        functions.append(function)
+        previous = function
+    return functions
@@ -0,0 +1,212 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import collections
+import functools
+import re
+
+import harmalysis.parsers.roman as roman
+from harmalysis.classes.chord import InvertibleChord, AugmentedSixthChord, CadentialSixFourChord
+
+HumdrumRecord = collections.namedtuple('HumdrumRecord', ['measure', 'line', 'spine', 'harmalysis'])
+
+_key_interpretation = re.compile(r'^\*([A-Ga-g](?:#+|-+)?):')
+_barline = re.compile(r'^=+(\d+)?')
+
+_augmented_sixths = {'german': 'Gn', 'french': 'Fr', 'italian': 'Lt'}
+
+# **harm spellings of the augmented sixths; the Tristan chord ('Tr') has no
+# equivalent in harmalysis and is not supported
+_harm_chords = re.compile(r'Gn|Lt')
+_harm_translations = {'Gn': 'Ger', 'Lt': 'It'}
+_unsupported = re.compile(r'Tr')
+
+
+class _Spine(object):
+    def __init__(self, exclusive=None):
+        self.exclusive = exclusive
+        self.key = None
+
+
+def _manipulate(spines, fields):
+    manipulated = []
+    merging = False
+    exchanged = []
+    for spine, field in zip(spines, fields):
+        if field == '*^':
+            split = _Spine(spine.exclusive)
+            split.key = spine.key
+            manipulated += [spine, split]
+        elif field == '*v':
+            # Adjacent '*v' spines are joined into the first one
+            if not merging:
+                manipulated.append(spine)
+            merging = True
+            continue
+        elif field == '*-':
+            pass
+        elif field == '*+':
+            manipulated += [spine, _Spine()]
+        else:
+            if field == '*x':
+                exchanged.append(len(manipulated))
+            manipulated.append(spine)
+        merging = False
+    if len(exchanged) == 2:
+        a, b = exchanged
+        manipulated[a], manipulated[b] = manipulated[b], manipulated[a]
+    return manipulated
+
+
+def _key_definition(field):
+    match = _key_interpretation.match(field)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=16384)
+def translate(token):
+    if _unsupported.search(token):
+        raise ValueError('Unsupported **harm token {}'.format(token))
+    return _harm_chords.sub(lambda match: _harm_translations[match.group(0)], token)
+
+
+def _establish(key, label):
+    # Implied harmonies '(...)' take the key inside the parentheses
+    if label.startswith('('):
+        return '({}=>:{}'.format(key, label[1:])
+    return '{}=>:{}'.format(key, label)
+
+
+def parse_lines(lines, skip_errors=False, batch_size=1024):
+    spines = []
+    harm = []
+    measure = 0
+    pending = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if not line or line[0] == '!':
+            continue
+        if line[0] == '*':
+            fields = line.split('\t')
+            if line.startswith('**'):
+                spines = [_Spine(field) for field in fields]
+            elif any(field in ('*^', '*v', '*-', '*+', '*x') for field in fields):
+                spines = _manipulate(spines, fields)
+            else:
+                for spine, field in zip(spines, fields):
+                    key = _key_definition(field)
+                    if key:
+                        spine.key = key
+            for spine, field in zip(spines, fields):
+                if field.startswith('**'):
+                    spine.exclusive = field
+            harm = [i for i, spine in enumerate(spines) if spine.exclusive == '**harm']
+            continue
+        if line[0] == '=':
+            match = _barline.match(line)
+            if match and match.group(1):
+                measure = int(match.group(1))
+            continue
+        if not harm:
+            continue
+        fields = line.split('\t')
+        for i in harm:
+            token = fields[i]
+            if token == '.':
+                continue
+            spine = spines[i]
+            for subtoken in token.split(' '):
+                try:
+                    label = translate(subtoken)
+                except ValueError:
+                    if skip_errors:
+                        continue
+                    raise
+                # Every label restates the key of its spine, records do not
+                # depend on the key established by previously parsed labels
+                if spine.key:
+                    label = _establish(spine.key, label)
+                pending.append((measure, line_number, i, label))
+        if len(pending) >= batch_size:
+            yield from _flush(pending, skip_errors)
+            pending = []
+    yield from _flush(pending, skip_errors)
+
+
+def _flush(pending, skip_errors):
+    analyses = roman.parse_batch([label for _, _, _, label in pending], skip_errors=skip_errors)
+    for (measure, line, spine, _), harmalysis in zip(pending, analyses):
+        if harmalysis is not None:
+            yield HumdrumRecord(measure, line, spine, harmalysis)
+
+
+def read(filename, skip_errors=False, batch_size=1024):
+    with open(filename, encoding='utf-8') as f:
+        yield from parse_lines(f, skip_errors=skip_errors, batch_size=batch_size)
+
+
+def _key(key):
+    # **harm has no interpretation for the natural and melodic minor scales
+    tonic = key.tonic.to_label()
+    return tonic if key.scale == 'major' else tonic.lower()
+
+
+def _chord(chord, key):
+    if isinstance(chord, AugmentedSixthChord):
+        return _augmented_sixths[chord.augmented_sixth_type] + chord.inversion_label()
+    if isinstance(chord, CadentialSixFourChord):
+        return chord.scale_degree + chord.inversion_label()
+    if not isinstance(chord, InvertibleChord):
+        # Descriptive chords have no **harm equivalent
+        return None
+    return chord.to_label(key)
+
+
+def _harm_chord(harmalysis):
+    return _chord(harmalysis.chord, harmalysis.secondary_key or harmalysis.main_key)
+
+
+def to_harm(harmalysis):
+    token = _harm_chord(harmalysis)
+    if token is None:
+        raise ValueError('{} cannot be written as **harm'.format(harmalysis.to_label()))
+    token += harmalysis.tonicization_label()
+    # Alternatives that cannot be written as **harm (descriptive chords) are
+    # left out, the main analysis is still written
+    if harmalysis.alternative and _harm_chord(harmalysis.alternative) is not None:
+        token += '[{}]'.format(to_harm(harmalysis.alternative))
+    if harmalysis.implicit:
+        token = '({})'.format(token)
+    return token
+
+
+def write(records, f):
+    f.write('**harm\n')
+    key = None
+    measure = None
+    for record in records:
+        harmalysis = getattr(record, 'harmalysis', record)
+        record_measure = getattr(record, 'measure', None)
+        if record_measure is not None and record_measure != measure:
+            f.write('={}\n'.format(record_measure))
+            measure = record_measure
+        if harmalysis.main_key is not None and _key(harmalysis.main_key) != key:
+            key = _key(harmalysis.main_key)
+            f.write('*{}:\n'.format(key))
+        f.write(to_harm(harmalysis) + '\n')
+    f.write('*-\n')
@@ -0,0 +1,160 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Random access to newline-delimited label files of any size. The file is
+# memory-mapped and the offsets of the line starts are kept in an index
+# ('<filename>.lines.npy', reused while the file does not change), so any
+# range of labels is decoded without reading the lines before it.
+
+import mmap
+import os
+import tempfile
+
+import numpy as np
+
+import harmalysis.parsers.roman as roman
+
+# Bytes scanned at a time while building the index
+CHUNK_SIZE = 1 << 26
+NEWLINE = ord('\n')
+
+
+def index_filename(filename):
+    return filename + '.lines.npy'
+
+
+def load_index(filename):
+    # None if the index is missing or unreadable (e.g., a truncated file)
+    try:
+        return np.load(filename, mmap_mode='r')
+    except (OSError, ValueError, EOFError):
+        return None
+
+
+def save_index(filename, offsets):
+    # Written next to the index and renamed over it, so other processes
+    # never load a half-written index
+    f = tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(filename)), suffix='.tmp', delete=False)
+    try:
+        with f:
+            np.save(f, offsets)
+        os.replace(f.name, filename)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+
+def build_index(data):
+    # Offsets of the line starts, followed by the size of the file
+    size = len(data)
+    offsets = [np.zeros(1, dtype=np.uint64)]
+    for start in range(0, size, CHUNK_SIZE):
+        chunk = np.frombuffer(data, dtype=np.uint8, count=min(CHUNK_SIZE, size - start), offset=start)
+        offsets.append(np.flatnonzero(chunk == NEWLINE).astype(np.uint64) + np.uint64(start + 1))
+    offsets = np.concatenate(offsets)
+    if size and offsets[-1] == size:
+        # The newline at the end of the file does not start another line
+        offsets = offsets[:-1]
+    return np.append(offsets, np.uint64(size)) if size else offsets
+
+
+class LabelFile(object):
+    def __init__(self, filename, cache_index=True):
+        self.filename = filename
+        self.cache_index = cache_index
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.offsets = self._index()
+
+    def _index(self):
+        cached = index_filename(self.filename)
+        if self.cache_index and os.path.exists(cached) and os.path.getmtime(cached) >= os.path.getmtime(self.filename):
+            offsets = load_index(cached)
+            if offsets is not None and offsets.ndim == 1 and len(offsets) and offsets[-1] == len(self.data):
+                return offsets
+        offsets = build_index(self.data)
+        if self.cache_index:
+            try:
+                save_index(cached, offsets)
+            except OSError:
+                # E.g., a read-only corpus, the index is kept in memory
+                pass
+        return offsets
+
+    def __len__(self):
+        return max(len(self.offsets) - 1, 0)
+
+    def _range(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return start, max(start, stop)
+
+    def labels(self, start=0, stop=None):
+        # Decoded with one call, the trailing '\r' of Windows files is removed
+        start, stop = self._range(start, stop)
+        if start == stop:
+            return []
+        text = self.data[int(self.offsets[start]):int(self.offsets[stop])].decode('utf-8')
+        lines = text.split('\n')
+        if len(lines) > stop - start:
+            lines.pop()
+        return [line[:-1] if line.endswith('\r') else line for line in lines]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError('label files are read in contiguous ranges.')
+            return self.labels(index.start, index.stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('label {} is out of range.'.format(index))
+        return self.labels(index, index + 1)[0]
+
+    def parse(self, start=0, stop=None, skip_errors=False, **kwargs):
+        return roman.parse_batch(self.labels(start, stop), skip_errors=skip_errors, **kwargs)
+
+    def split(self, parts):
+        # Index ranges of about the same number of labels, e.g., one for
+        # each worker; every worker maps the file and reads its own range
+        bounds = np.linspace(0, len(self), parts + 1).astype(np.int64)
+        return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if a < b]
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.offsets = None
+
+    def __reduce__(self):
+        # Sent to other processes by name, they map the file themselves
+        return (LabelFile, (self.filename, self.cache_index))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read(filename, start=0, stop=None, skip_errors=False, batch_size=1024):
+    # Analyses of the labels in [start, stop), parsed in batches
+    with LabelFile(filename) as labels:
+        start, stop = labels._range(start, stop)
+        for batch in range(start, stop, batch_size):
+            yield from labels.parse(batch, min(batch + batch_size, stop), skip_errors=skip_errors)
@@ -0,0 +1,163 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import collections
+import functools
+import re
+
+import harmalysis.parsers.roman as roman
+from harmalysis.parsers import limits as label_limits
+
+RomanTextRecord = collections.namedtuple('RomanTextRecord', ['measure', 'beat', 'harmalysis'])
+
+_measure_line = re.compile(r'^m(\d+)[a-z]?(?:-\d+[a-z]?)?\s+(.*)$')
+_beat_token = re.compile(r'^b(\d+(?:\.\d+)?)$')
+_barline_token = re.compile(r'^[|:.]+$')
+_bracket = re.compile(r'\[([^\]]*)\]')
+_chord_figure = re.compile(r'^(?P<chord>[#b\-]*(?:[ivIV]+|Ger|It|Fr|N|Cad|CTo))(?P<quality>ø|o|\+)?(?P<figure>\d*)$')
+_scale_degree = re.compile(r'^(?P<accidentals>[#b\-]*)(?P<numeral>[ivIV]+)$')
+_alteration_symbols = {-2: '--', -1: '-', 0: '', 1: '#', 2: '##'}
+
+# RomanText figures that harmalysis writes differently
+_triad_figures = {'': '', '5': '', '53': '', '6': '6', '63': '6', '64': '64'}
+_seventh_inversion_letters = {'': '', '7': '', '65': 'b', '43': 'c', '42': 'd', '2': 'd'}
+_special_figures = {
+    'Ger': {'': '', '7': '', '65': '65', '43': '43', '42': '42', '2': '2'},
+    'Fr': {'': '', '7': '', '65': '65', '43': '43', '42': '42', '2': '2'},
+    'It': {'': '', '53': '', '6': '6', '64': '64'},
+    'N': {'': '', '53': '', '6': '6', '64': '64'},
+    'Cad': {'': '', '64': '64'},
+    'CTo': {'': '', '7': '7', '65': '65', '43': '43', '42': '42', '2': '2'},
+}
+
+
+def _minor_degree(degree):
+    # In minor keys, RomanText reads the sixth and seventh degrees against
+    # the natural minor scale, raised for minor and diminished chords unless
+    # an accidental is given; harmalysis minor keys are harmonic minor
+    match = _scale_degree.match(degree)
+    if not match:
+        return degree
+    accidentals, numeral = match.group('accidentals', 'numeral')
+    if numeral.upper() not in ('VI', 'VII'):
+        return degree
+    if accidentals:
+        alteration = accidentals.count('#') - len(accidentals.replace('#', ''))
+    else:
+        alteration = 1 if numeral.islower() else 0
+    if numeral.upper() == 'VII':
+        alteration -= 1
+    if alteration not in _alteration_symbols:
+        raise ValueError('Unsupported RomanText scale degree {}'.format(degree))
+    return _alteration_symbols[alteration] + numeral
+
+
+def _translate_chord(chord, minor=False):
+    missing = []
+    for content in _bracket.findall(chord):
+        if content.startswith('no') and content[2:].isdigit():
+            missing.append(int(content[2:]))
+        else:
+            # Added tones ('[add9]') have no harmalysis equivalent
+            raise ValueError('Unsupported RomanText bracket [{}]'.format(content))
+    chord = _bracket.sub('', chord)
+    match = _chord_figure.match(chord)
+    if not match:
+        return chord
+    degree, quality, figure = match.group('chord', 'quality', 'figure')
+    if minor:
+        degree = _minor_degree(degree)
+    if degree in _special_figures:
+        figure = _special_figures[degree].get(figure, figure)
+    elif quality == 'ø':
+        # Half-diminished: diminished triad with a minor seventh
+        quality = 'om7'
+        figure = _seventh_inversion_letters.get(figure, figure)
+    elif quality == 'o' and figure in _seventh_inversion_letters and figure:
+        # Fully-diminished: diminished triad with a diminished seventh
+        quality = 'oD7'
+        figure = _seventh_inversion_letters[figure]
+    elif figure in _triad_figures:
+        figure = _triad_figures[figure]
+    missing = ''.join('x{}'.format(interval) for interval in sorted(missing))
+    return degree + (quality or '') + figure + missing
+
+
+@functools.lru_cache(maxsize=16384)
+def translate(label, minor=False):
+    label = label.replace('/o', 'ø')
+    chord, *tonicizations = label.split('/')
+    # Each degree is read in the key of the tonicization that follows it,
+    # the last tonicization in the key of the label
+    translated = []
+    for tonicization in reversed(tonicizations):
+        translated.insert(0, _minor_degree(tonicization) if minor else tonicization)
+        minor = tonicization.islower()
+    return '/'.join([_translate_chord(chord, minor)] + translated)
+
+
+def _key_definition(token):
+    # 'Bb:', 'B-:', 'f#:' are valid harmalysis key definitions already
+    return token[:-1]
+
+
+def parse_lines(lines, skip_errors=False):
+    key = None
+    for line in lines:
+        match = _measure_line.match(line.strip())
+        if not match:
+            # Metadata (Composer, Time Signature, Note, etc.)
+            continue
+        measure = int(match.group(1))
+        content = match.group(2)
+        if content.startswith('=') or content.startswith('var'):
+            # Repeated measures and variant readings are not supported
+            continue
+        beat = 1.0
+        for token in content.split():
+            beat_match = _beat_token.match(token)
+            if beat_match:
+                beat = float(beat_match.group(1))
+            elif token.endswith(':'):
+                key = _key_definition(token)
+            elif _barline_token.match(token):
+                continue
+            else:
+                try:
+                    label = translate(token, minor=bool(key) and key[0].islower())
+                except ValueError:
+                    if skip_errors:
+                        continue
+                    raise
+                # Every label restates its key, records do not depend on
+                # the key established by previously parsed labels
+                if key:
+                    label = '{}=>:{}'.format(key, label)
+                try:
+                    label_limits.prescan(label)
+                    ast = roman.parse_tree(label)
+                except (roman.UnexpectedInput, roman.LabelLimitError):
+                    if skip_errors:
+                        continue
+                    raise
+                yield RomanTextRecord(measure, beat, roman.RomanParser().transform(ast))
+
+
+def read(filename, skip_errors=False):
+    with open(filename, encoding='utf-8') as f:
+        yield from parse_lines(f, skip_errors=skip_errors)
@@ -0,0 +1,168 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import collections
+import functools
+
+import numpy as np
+
+import harmalysis.common as common
+import harmalysis.modulation as modulation
+import harmalysis.parsers.roman as roman
+from harmalysis.classes.pitch_class import PitchClassSpelling
+
+# Weight of each scale degree in the key templates
+DEGREE_WEIGHTS = (2.0, 1.0, 1.5, 1.0, 1.75, 1.0, 1.0)
+
+# Candidate labels in each scale, read in C (or c) to build the chord templates
+VOCABULARIES = {
+    'major': [
+        'I', 'ii', 'iii', 'IV', 'V', 'vi', 'viio',
+        'I7', 'ii7', 'iii7', 'IV7', 'V7', 'vi7', 'viio7', 'viioD7',
+        'V7/V', 'V7/ii', 'V7/vi', 'V7/IV', 'viioD7/V',
+        'iv', '-VI', 'N', 'Ger', 'It', 'Fr',
+    ],
+    'harmonic_minor': [
+        'i', 'iio', 'III', 'iv', 'V', 'VI', 'viio',
+        'iio7', 'iv7', 'V7', 'VI7', 'viio7',
+        'V7/V', 'V7/iv', 'V7/III', 'I', 'N', 'Ger', 'It', 'Fr',
+    ],
+    'natural_minor': [
+        'i', 'iio', 'III', 'iv', 'v', 'VI', 'VII',
+        'i7', 'iio7', 'III7', 'iv7', 'v7', 'VI7', 'VII7',
+    ],
+    'ascending_melodic_minor': [
+        'i', 'ii', 'IV', 'V', 'vio', 'viio', 'IV7', 'V7',
+    ],
+}
+
+# The key of C in each scale
+TEMPLATE_KEYS = {
+    'major': 'C',
+    'harmonic_minor': 'c',
+    'natural_minor': 'c_nat',
+    'ascending_melodic_minor': 'c_mel',
+}
+
+Proposal = collections.namedtuple('Proposal', ['key', 'label', 'score'])
+
+
+def _zscore(matrix):
+    # Rows with zero mean and unit norm, so that dot products are correlations
+    matrix = np.asarray(matrix, dtype=np.float64)
+    matrix = matrix - matrix.mean(axis=-1, keepdims=True)
+    norm = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return np.divide(matrix, norm, out=np.zeros_like(matrix), where=norm > 0)
+
+
+def _accidentals(key):
+    return sum(abs(PitchClassSpelling.alterations.get(key.scale_degree(degree).alteration, 0))
+               for degree in range(1, common.DIATONIC_CLASSES + 1))
+
+
+class KeyFinder(object):
+    def __init__(self, degree_weights=DEGREE_WEIGHTS, vocabularies=None):
+        vocabularies = vocabularies or VOCABULARIES
+        self.scales = list(vocabularies)
+        # One key per tonic pitch class and scale, spelled with the fewest accidentals
+        spelled = {}
+        for key in modulation.relations().keys:
+            if key.scale not in vocabularies:
+                continue
+            code = (key.tonic.chromatic_class, key.scale)
+            if code not in spelled or _accidentals(key) < _accidentals(spelled[code]):
+                spelled[code] = key
+        self.keys = [spelled[(tonic, scale)] for scale in self.scales for tonic in range(common.PITCH_CLASSES)]
+        key_templates = np.zeros((len(self.keys), common.PITCH_CLASSES))
+        for k, key in enumerate(self.keys):
+            for degree, weight in enumerate(degree_weights, 1):
+                key_templates[k, key.scale_degree(degree).chromatic_class] = weight
+        self.key_templates = _zscore(key_templates)
+        # Chord templates are built in C and transposed to the other tonics;
+        # equal pitch-class sets share a single template
+        self.vocabulary = max(len(labels) for labels in vocabularies.values())
+        self.labels = np.full((len(self.scales), self.vocabulary), '', dtype=object)
+        self.chord_ids = np.full((len(self.keys), self.vocabulary), -1, dtype=np.int64)
+        masks = {}
+        for s, scale in enumerate(self.scales):
+            labels = vocabularies[scale]
+            analyses = roman.parse_batch(['{}:{}'.format(TEMPLATE_KEYS[scale], label) for label in labels])
+            for v, (label, harmalysis) in enumerate(zip(labels, analyses)):
+                self.labels[s, v] = label
+                pcs = set(harmalysis.chord.get_pitch_classes())
+                for tonic in range(common.PITCH_CLASSES):
+                    mask = sum(1 << ((pc + tonic) % common.PITCH_CLASSES) for pc in pcs)
+                    self.chord_ids[s * common.PITCH_CLASSES + tonic, v] = masks.setdefault(mask, len(masks))
+        chord_templates = np.zeros((len(masks), common.PITCH_CLASSES))
+        for mask, i in masks.items():
+            chord_templates[i] = [(mask >> pc) & 1 for pc in range(common.PITCH_CLASSES)]
+        self.chord_templates = _zscore(chord_templates)
+
+    def key_scores(self, histograms):
+        return _zscore(histograms) @ self.key_templates.T
+
+    def find_keys(self, histograms, top=3):
+        scores = self.key_scores(histograms)
+        top = min(top, len(self.keys))
+        order = np.argsort(-scores, axis=1, kind='stable')[:, :top]
+        return order, np.take_along_axis(scores, order, axis=1)
+
+    def propose_indices(self, histograms, keys=3, top=5, key_weight=1.0):
+        # Every window is scored against every key and chord template with
+        # two matrix products; the best labels of the best keys are ranked
+        windows = _zscore(np.atleast_2d(histograms))
+        key_scores = windows @ self.key_templates.T
+        chord_scores = windows @ self.chord_templates.T
+        keys = min(keys, len(self.keys))
+        best_keys = np.argsort(-key_scores, axis=1, kind='stable')[:, :keys]
+        ids = self.chord_ids[best_keys]
+        rows = np.arange(len(windows))[:, np.newaxis, np.newaxis]
+        scores = key_weight * np.take_along_axis(key_scores, best_keys, axis=1)[:, :, np.newaxis]
+        scores = scores + np.where(ids >= 0, chord_scores[rows, np.maximum(ids, 0)], -np.inf)
+        scores = scores.reshape(len(windows), -1)
+        # Shorter vocabularies are padded with -inf, which is never proposed;
+        # windows with fewer candidates than top keep -inf scores at the end
+        top = min(top, np.isfinite(scores).sum(axis=1).max(initial=0))
+        order = np.argsort(-scores, axis=1, kind='stable')[:, :top]
+        key_indices = np.take_along_axis(best_keys, order // self.vocabulary, axis=1)
+        return key_indices, order % self.vocabulary, np.take_along_axis(scores, order, axis=1)
+
+    def propose(self, histograms, keys=3, top=5, key_weight=1.0):
+        key_indices, label_indices, scores = self.propose_indices(histograms, keys, top, key_weight)
+        key_labels = [key.to_label() for key in self.keys]
+        proposals = []
+        for window_keys, window_labels, window_scores in zip(key_indices.tolist(), label_indices.tolist(), scores.tolist()):
+            proposals.append([
+                Proposal(self.keys[k], '{}:{}'.format(key_labels[k], self.labels[k // common.PITCH_CLASSES, v]), score)
+                for k, v, score in zip(window_keys, window_labels, window_scores)
+                if score != -np.inf
+            ])
+        return proposals
+
+
+@functools.lru_cache(maxsize=None)
+def key_finder():
+    return KeyFinder()
+
+
+def find_keys(histograms, top=3):
+    return key_finder().find_keys(histograms, top)
+
+
+def propose(histograms, keys=3, top=5):
+    return key_finder().propose(histograms, keys, top)
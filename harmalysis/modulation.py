@@ -0,0 +1,156 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import functools
+import numpy as np
+
+import harmalysis.common as common
+from harmalysis.classes.key import Key
+from harmalysis.classes.pitch_class import PitchClassSpelling
+
+SCALES = ['major', 'natural_minor', 'harmonic_minor', 'ascending_melodic_minor']
+TONIC_ALTERATIONS = ['b', None, '#']
+
+# Qualities of the third and fifth above the root of a diatonic triad
+_triad_qualities = {
+    ('M', 'P'): 'major_triad',
+    ('m', 'P'): 'minor_triad',
+    ('m', 'D'): 'diminished_triad',
+    ('M', 'A'): 'augmented_triad',
+}
+
+# Position of the natural note letters in the line of fifths (C = 0)
+_letter_fifths = {'F': -1, 'C': 0, 'G': 1, 'D': 2, 'A': 3, 'E': 4, 'B': 5}
+
+# Minor keys share the key signature of their relative major
+_signature_offset = {
+    'major': 0,
+    'natural_minor': -3,
+    'harmonic_minor': -3,
+    'ascending_melodic_minor': -3
+}
+
+
+def _spelling_code(pc):
+    # Independent of the alteration alias ('b' or '-', 'x' or '##')
+    alteration = PitchClassSpelling.alterations.get(pc.alteration, 0)
+    return (pc.note_letter, alteration)
+
+
+def _scale_name(scale):
+    # 'minor' is an alias of 'harmonic_minor' in Key._scale_mapping
+    return 'harmonic_minor' if scale == 'minor' else scale
+
+
+class KeyRelations(object):
+    def __init__(self):
+        self.keys = []
+        self.key_index = {}
+        for scale in SCALES:
+            for letter in PitchClassSpelling.diatonic_classes:
+                for alteration in TONIC_ALTERATIONS:
+                    key = Key(letter, alteration, scale)
+                    self.key_index[_spelling_code(key.tonic) + (scale,)] = len(self.keys)
+                    self.keys.append(key)
+        nkeys = len(self.keys)
+        # Vocabulary of every diatonic triad found in any of the keys
+        self.chords = []
+        self.chord_index = {}
+        self.diatonic_chords = np.empty((nkeys, common.DIATONIC_CLASSES), dtype=np.int32)
+        for k, key in enumerate(self.keys):
+            for degree in range(1, common.DIATONIC_CLASSES + 1):
+                root = key.scale_degree(degree)
+                third = key.mode.step_to_interval_spelling(3, mode=degree)
+                fifth = key.mode.step_to_interval_spelling(5, mode=degree)
+                quality = _triad_qualities[(third.interval_quality, fifth.interval_quality)]
+                code = _spelling_code(root) + (quality,)
+                if code not in self.chord_index:
+                    self.chord_index[code] = len(self.chords)
+                    self.chords.append((str(root), quality))
+                self.diatonic_chords[k, degree - 1] = self.chord_index[code]
+        nchords = len(self.chords)
+        rows = np.arange(nkeys)[:, np.newaxis]
+        # membership[k, c] is True if chord c is diatonic in key k
+        self.membership = np.zeros((nkeys, nchords), dtype=bool)
+        self.membership[rows, self.diatonic_chords] = True
+        # degree_in_key[k, c] is the (1-based) scale degree of chord c in key k, 0 if not diatonic
+        self.degree_in_key = np.zeros((nkeys, nchords), dtype=np.int8)
+        self.degree_in_key[rows, self.diatonic_chords] = np.arange(1, common.DIATONIC_CLASSES + 1)
+        # pivot_degrees[a, b, d - 1] is the degree in key b of the triad on degree d of key a
+        self.pivot_degrees = self.degree_in_key[np.arange(nkeys)[np.newaxis, :, np.newaxis],
+                                                self.diatonic_chords[:, np.newaxis, :]]
+        self.shared_chord_count = np.count_nonzero(self.pivot_degrees, axis=2).astype(np.int8)
+        signatures = np.array([
+            _letter_fifths[key.tonic.note_letter]
+            + 7 * PitchClassSpelling.alterations.get(key.tonic.alteration, 0)
+            + _signature_offset[key.scale]
+            for key in self.keys
+        ])
+        steps = np.abs(signatures[:, np.newaxis] - signatures[np.newaxis, :]) % common.PITCH_CLASSES
+        self.circle_of_fifths_distance = np.minimum(steps, common.PITCH_CLASSES - steps).astype(np.int8)
+
+    def index(self, key):
+        code = _spelling_code(key.tonic) + (_scale_name(key.scale),)
+        if code not in self.key_index:
+            raise KeyError("key '{}' is not in the key relationship tables.".format(key))
+        return self.key_index[code]
+
+    def chord_id(self, chord):
+        quality = getattr(chord, 'triad_quality', None)
+        if quality is None or chord.root is None:
+            return -1
+        return self.chord_index.get(_spelling_code(chord.root) + (quality,), -1)
+
+    def distance(self, key_a, key_b):
+        return int(self.circle_of_fifths_distance[self.index(key_a), self.index(key_b)])
+
+    def pivot_chords(self, key_a, key_b):
+        a = self.index(key_a)
+        b = self.index(key_b)
+        degrees_b = self.pivot_degrees[a, b]
+        pivots = []
+        for degree_a in np.flatnonzero(degrees_b):
+            root, quality = self.chords[self.diatonic_chords[a, degree_a]]
+            pivots.append((int(degree_a) + 1, int(degrees_b[degree_a]), root, quality))
+        return pivots
+
+    def pivot_mask(self, chords, key_a, key_b):
+        a = self.index(key_a)
+        b = self.index(key_b)
+        ids = np.array([self.chord_id(chord) for chord in chords], dtype=np.int64)
+        known = ids >= 0
+        mask = np.zeros(len(ids), dtype=bool)
+        mask[known] = self.membership[a, ids[known]] & self.membership[b, ids[known]]
+        return mask
+
+
+@functools.lru_cache(maxsize=None)
+def relations():
+    return KeyRelations()
+
+
+def distance(key_a, key_b):
+    return relations().distance(key_a, key_b)
+
+
+def pivot_chords(key_a, key_b):
+    return relations().pivot_chords(key_a, key_b)
+
+
+def pivot_mask(chords, key_a, key_b):
+    return relations().pivot_mask(chords, key_a, key_b)
@@ -0,0 +1,188 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import collections
+
+import numpy as np
+
+import harmalysis.parsers.roman as roman
+
+MODES = ['major', 'minor']
+MAX_N = 5
+
+# Keys used to read query labels that do not define one
+_query_keys = {None: 'C', 'major': 'C', 'minor': 'c'}
+
+Matches = collections.namedtuple('Matches', ['pieces', 'positions'])
+
+
+def token(harmalysis):
+    # Scale degree, triad quality, extensions, inversion and tonicizations,
+    # relative to the key, so the same progression matches in every key
+    key = harmalysis.secondary_key or harmalysis.main_key
+    return harmalysis.chord.to_label(key) + harmalysis.tonicization_label()
+
+
+def mode(harmalysis):
+    # Chords described by letter (e.g., '?CM3P5') have no key, nor mode
+    if harmalysis.main_key is None:
+        return None
+    return 'major' if harmalysis.main_key.scale == 'major' else 'minor'
+
+
+def _mode_code(mode):
+    return len(MODES) if mode is None else MODES.index(mode)
+
+
+def _encode(value, buffer):
+    # Variable-length (7 bits per byte) encoding of a non-negative integer
+    while value >= 0x80:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _decode(buffer):
+    data = np.frombuffer(bytes(buffer), dtype=np.uint8)
+    if not len(data):
+        return np.empty(0, dtype=np.int64)
+    ends = (data & 0x80) == 0
+    group = np.cumsum(ends) - ends
+    starts = np.flatnonzero(np.concatenate([[True], ends[:-1]]))
+    shift = 7 * (np.arange(len(data)) - starts[group])
+    values = np.zeros(len(starts), dtype=np.int64)
+    np.add.at(values, group, (data & 0x7f).astype(np.int64) << shift)
+    # Postings are stored as gaps between consecutive positions
+    return np.cumsum(values)
+
+
+class NgramIndex(object):
+    def __init__(self, max_n=MAX_N):
+        if not 1 <= max_n <= MAX_N:
+            raise ValueError("n-grams of length '{}' are not supported".format(max_n))
+        self.max_n = max_n
+        self.vocabulary = []
+        self.token_ids = {}
+        self.piece_names = []
+        self._piece_offsets = []
+        self._modes = bytearray()
+        self._postings = {}
+        self._last = {}
+
+    def __len__(self):
+        return len(self._modes)
+
+    def _token_id(self, token, create=False):
+        if token not in self.token_ids:
+            if not create:
+                return -1
+            self.token_ids[token] = len(self.vocabulary)
+            self.vocabulary.append(token)
+        return self.token_ids[token]
+
+    def add_piece(self, analyses, name=None):
+        # The index is only modified once every analysis has been read
+        analyses = list(analyses)
+        tokens = [token(harmalysis) for harmalysis in analyses]
+        modes = [_mode_code(mode(harmalysis)) for harmalysis in analyses]
+        offset = len(self._modes)
+        ids = [self._token_id(t, create=True) for t in tokens]
+        self._modes.extend(modes)
+        self._piece_offsets.append(offset)
+        self.piece_names.append(name)
+        for start in range(len(ids)):
+            position = offset + start
+            for n in range(1, min(self.max_n, len(ids) - start) + 1):
+                ngram = tuple(ids[start:start + n])
+                if ngram not in self._postings:
+                    self._postings[ngram] = bytearray()
+                _encode(position - self._last.get(ngram, 0), self._postings[ngram])
+                self._last[ngram] = position
+        return len(self.piece_names) - 1
+
+    def _query_ids(self, labels, mode):
+        queries = [label if ':' in label else '{}:{}'.format(_query_keys[mode], label)
+                   for label in labels if isinstance(label, str)]
+        parsed = iter(roman.parse_batch(queries))
+        analyses = [next(parsed) if isinstance(label, str) else label for label in labels]
+        return tuple(self._token_id(token(harmalysis)) for harmalysis in analyses)
+
+    def positions(self, labels, mode=None):
+        if not 1 <= len(labels) <= self.max_n:
+            raise ValueError("queries must have between 1 and {} labels".format(self.max_n))
+        if mode is not None and mode not in MODES:
+            raise KeyError("the mode '{}' is not supported".format(mode))
+        ngram = self._query_ids(labels, mode)
+        if ngram not in self._postings:
+            return np.empty(0, dtype=np.int64)
+        positions = _decode(self._postings[ngram])
+        if mode is not None:
+            # Every chord of the match is in the requested mode
+            modes = np.frombuffer(self._modes, dtype=np.uint8)
+            matching = np.ones(len(positions), dtype=bool)
+            for i in range(len(ngram)):
+                matching &= modes[positions + i] == MODES.index(mode)
+            positions = positions[matching]
+            del modes
+        return positions
+
+    def query(self, labels, mode=None):
+        positions = self.positions(labels, mode)
+        offsets = np.array(self._piece_offsets, dtype=np.int64)
+        pieces = np.searchsorted(offsets, positions, side='right') - 1
+        return Matches(pieces, positions - offsets[pieces])
+
+    def count(self, labels, mode=None):
+        return len(self.positions(labels, mode))
+
+    def save(self, filename):
+        ngrams = list(self._postings)
+        ngram_ids = np.full((len(ngrams), self.max_n), -1, dtype=np.int32)
+        for i, ngram in enumerate(ngrams):
+            ngram_ids[i, :len(ngram)] = ngram
+        postings = [self._postings[ngram] for ngram in ngrams]
+        posting_offsets = np.cumsum([0] + [len(posting) for posting in postings])
+        np.savez_compressed(
+            filename,
+            max_n=self.max_n,
+            vocabulary=np.array(self.vocabulary, dtype=str),
+            piece_names=np.array(['' if name is None else name for name in self.piece_names], dtype=str),
+            piece_offsets=np.array(self._piece_offsets, dtype=np.int64),
+            modes=np.frombuffer(bytes(self._modes), dtype=np.uint8),
+            ngram_ids=ngram_ids,
+            postings=np.frombuffer(b''.join(postings), dtype=np.uint8),
+            posting_offsets=posting_offsets.astype(np.int64),
+            last=np.array([self._last[ngram] for ngram in ngrams], dtype=np.int64),
+        )
+
+    @classmethod
+    def load(cls, filename):
+        with np.load(filename) as data:
+            index = cls(int(data['max_n']))
+            index.vocabulary = data['vocabulary'].tolist()
+            index.token_ids = {token: i for i, token in enumerate(index.vocabulary)}
+            index.piece_names = [name or None for name in data['piece_names'].tolist()]
+            index._piece_offsets = data['piece_offsets'].tolist()
+            index._modes = bytearray(data['modes'].tobytes())
+            postings = data['postings'].tobytes()
+            offsets = data['posting_offsets'].tolist()
+            for i, (row, last) in enumerate(zip(data['ngram_ids'].tolist(), data['last'].tolist())):
+                ngram = tuple(token_id for token_id in row if token_id >= 0)
+                index._postings[ngram] = bytearray(postings[offsets[i]:offsets[i + 1]])
+                index._last[ngram] = last
+        return index
@@ -0,0 +1,71 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Regenerates the standalone LALR parsers shipped with the package.
+# Usage: python -m harmalysis.parsers.build
+
+import hashlib
+import io
+import os
+import pathlib
+
+from lark import Lark, __version__ as lark_version
+from lark.tools.standalone import gen_standalone
+
+current_dir = pathlib.Path(__file__).parent.absolute()
+
+# Grammar file -> generated module
+GRAMMARS = {
+    'roman.lark': 'roman_lalr.py',
+    'chordlabel.lark': 'chordlabel_lalr.py',
+}
+
+HEADER = '''# Generated from {grammar} (sha256 {digest}) with lark {version}.
+# Do not edit, run `python -m harmalysis.parsers.build` instead.
+'''
+
+
+def grammar_digest(grammar):
+    with open(os.path.join(str(current_dir), grammar), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def module_digest(module):
+    # The digest of the grammar the module was generated from
+    with open(os.path.join(str(current_dir), module)) as f:
+        header = f.readline()
+    return header.split('sha256 ')[1].split(')')[0] if 'sha256 ' in header else None
+
+
+def generate(grammar):
+    with open(os.path.join(str(current_dir), grammar)) as f:
+        parser = Lark(f.read(), parser='lalr', lexer='contextual', maybe_placeholders=False)
+    out = io.StringIO()
+    out.write(HEADER.format(grammar=grammar, digest=grammar_digest(grammar), version=lark_version))
+    gen_standalone(parser, out=out)
+    return out.getvalue()
+
+
+def build():
+    for grammar, module in GRAMMARS.items():
+        with open(os.path.join(str(current_dir), module), 'w') as f:
+            f.write(generate(grammar))
+
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,198 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Persistent parse cache in a SQLite file, shared by the worker processes of
+# a batch job and by later runs. The pickled analyses are keyed by the
+# label, the established key, the harmalysis version and a hash of the
+# grammar. SQLite in WAL mode allows many readers next to one writer and
+# concurrent writers wait for each other (up to 'timeout' seconds).
+
+import hashlib
+import os
+import pickle
+import re
+import sqlite3
+
+import harmalysis.__version__
+import harmalysis.functions as functions
+import harmalysis.parsers.roman as roman
+from harmalysis.parsers import limits as label_limits
+from harmalysis.parsers.limits import LabelLimitError
+from harmalysis.classes.harmalysis import Harmalysis
+from harmalysis.parsers.roman_lalr import UnexpectedInput
+
+# SQLite limits the number of parameters of a query
+CHUNK_SIZE = 500
+
+# Stored in place of the established key for labels whose every analysis
+# has a key of its own (e.g., 'G:V7[D:V]'), which do not depend on it
+REFERENCED = -1
+
+_key_reference = re.compile(r'^\(?[A-Ga-g](?:--?|bb?|##?|x)?(?:_(?:nat|har|mel))?:')
+
+
+def referenced(query):
+    return all(_key_reference.match(part) for part in query.split('['))
+
+
+class CachedParseError(UnexpectedInput):
+    # A parse error stored in the cache, raised without parsing the label
+    # again; it has the column and the expected terminals of the original
+    def __init__(self, label, error, column, expected):
+        super().__init__("{} in '{}' at column {}, expected one of {}".format(error, label, column, ', '.join(expected)))
+        self.label = label
+        self.error = error
+        self.line = 1
+        self.column = column
+        self.expected = expected
+
+
+def grammar_hash():
+    with open(roman.grammarfile, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class ParseCache(object):
+    def __init__(self, filename, timeout=30.0):
+        self.filename = filename
+        self.timeout = timeout
+        self.version = harmalysis.__version__.__version__
+        self.grammar = grammar_hash()
+        # (label, established key code) -> pickled analysis, or the pickled
+        # (error, column, expected) of a label that does not parse
+        self.entries = {}
+        self.pending = {}
+        self._connection = None
+        self._pid = None
+
+    def connection(self):
+        # Connections are not shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.filename, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS analyses ('
+                'label TEXT NOT NULL, established INTEGER NOT NULL, version TEXT NOT NULL, grammar TEXT NOT NULL, data BLOB, '
+                'PRIMARY KEY (label, established, version, grammar)) WITHOUT ROWID'
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def prefetch(self, queries):
+        # Loads every stored analysis of the distinct labels in one pass, e.g.,
+        # prefetch(line.strip() for line in f) for a file with one label per line
+        distinct = [query for query in set(queries) if '=>' not in query and (query, None) not in self.entries]
+        connection = self.connection()
+        found = 0
+        for i in range(0, len(distinct), CHUNK_SIZE):
+            chunk = distinct[i:i + CHUNK_SIZE]
+            rows = connection.execute(
+                'SELECT label, established, data FROM analyses WHERE version = ? AND grammar = ? AND label IN ({})'.format(', '.join('?' * len(chunk))),
+                [self.version, self.grammar] + chunk,
+            )
+            for label, established, data in rows:
+                self.entries[(label, established)] = data
+                found += 1
+            # Marks the labels as fetched
+            for query in chunk:
+                self.entries[(query, None)] = None
+        return found
+
+    def _transform(self, query):
+        return roman.RomanParser().transform(roman.parse_tree(query))
+
+    def parse(self, query, limits=None):
+        label_limits.prescan(query, limits)
+        if '=>' in query:
+            # Labels that establish a key change the state, they are parsed
+            return self._transform(query)
+        if (query, None) not in self.entries:
+            self.prefetch([query])
+        established = REFERENCED if referenced(query) else Harmalysis.established_key.to_code()
+        entry = (query, established)
+        if entry in self.entries:
+            value = pickle.loads(self.entries[entry])
+            if isinstance(value, tuple):
+                raise CachedParseError(query, *value)
+            return value
+        try:
+            analysis = self._transform(query)
+        except UnexpectedInput as e:
+            column, expected = roman.error_location(query, e)
+            error = pickle.dumps((type(e).__name__, column, expected), protocol=pickle.HIGHEST_PROTOCOL)
+            self.entries[entry] = self.pending[entry] = error
+            raise
+        self.entries[entry] = self.pending[entry] = pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL)
+        return analysis
+
+    def parse_batch(self, queries, skip_errors=False, infer_functions=False, limits=None):
+        # Like roman.parse_batch(), the labels missing from the cache are
+        # parsed and stored when the batch is done
+        queries = list(queries)
+        self.prefetch(queries)
+        analyses = []
+        try:
+            for query in queries:
+                try:
+                    analyses.append(self.parse(query, limits))
+                except (UnexpectedInput, LabelLimitError):
+                    if not skip_errors:
+                        raise
+                    analyses.append(None)
+        finally:
+            self.flush()
+        if infer_functions:
+            functions.infer_functions(analyses)
+        return analyses
+
+    def flush(self):
+        if not self.pending:
+            return
+        rows = [(label, established, self.version, self.grammar, data) for (label, established), data in self.pending.items()]
+        connection = self.connection()
+        # Waits for the other writers, the rows written by them are kept
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany('INSERT OR IGNORE INTO analyses VALUES (?, ?, ?, ?, ?)', rows)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        self.pending = {}
+
+    def clear(self):
+        # Removes the analyses of other versions and grammars
+        connection = self.connection()
+        connection.execute('DELETE FROM analyses WHERE version != ? OR grammar != ?', (self.version, self.grammar))
+
+    def close(self):
+        self.flush()
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def __len__(self):
+        return self.connection().execute('SELECT COUNT(*) FROM analyses WHERE version = ? AND grammar = ?', (self.version, self.grammar)).fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
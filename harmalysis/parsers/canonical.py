@@ -0,0 +1,156 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import functools
+import re
+
+# String-level rewriting of the aliases accepted by roman.lark into the
+# spelling emitted by Harmalysis.to_label(). Anything that is not
+# recognized is left untouched, so that the parser reports the error.
+
+_ALTERATION = r'(--|bb|-|b|##|x|#)?'
+_DEGREE = r'(VII|III|IV|VI|II|V|I|vii|iii|iv|vi|ii|v|i)'
+_INTERVALS = r'((?:(?:AA|DD|[MmPAD])\d+)*)'
+
+_implicit = re.compile(r'^\((.*)\)$')
+_alternate = re.compile(r'^([^\[]*)\[(.*)\]$')
+_key = re.compile(r'^([A-Ga-g])' + _ALTERATION + r'(_nat|_har|_mel)?(=>:|:)(.*)$')
+_tertian = re.compile(r'^' + _ALTERATION + _DEGREE + r'([o+]?)((?:AA|DD|[MmPAD])?(?:13|11|9|7))?(64|65|43|42|6|2)?([a-g])?((?:x(?:11|1|3|5|7|9))*)$')
+_special = re.compile(r'^(Ger|Gn|It|Lt|Fr|N|Tr|vii0|viiø|Cad|CTo)(7?)(64|65|43|42|6|2)?([a-g])?$')
+_tonicization = re.compile(r'^' + _ALTERATION + r'(VII|III|IV|VI|II|V|I|vii|iii|iv|vi|ii|v|i|N)$')
+_descriptive_letter = re.compile(r'^\?([A-Ga-g])' + _ALTERATION + _INTERVALS + r'$')
+_descriptive_degree = re.compile(r'^\?' + _ALTERATION + _DEGREE + _INTERVALS + r'$')
+
+_alterations = {
+    None: '', '-': '-', 'b': '-', '--': '--', 'bb': '--', '#': '#', '##': '##', 'x': '##'
+}
+_special_names = {
+    'Gn': 'Ger', 'Lt': 'It', 'viiø': 'vii0'
+}
+# Inversions accepted by each special chord (and whether it takes an optional "7")
+_seventh_inversions = (('65', '43', '42', '2'), 'abcd')
+_triad_inversions = (('6', '64'), 'abc')
+_special_inversions = {
+    'Ger': _seventh_inversions + (False,),
+    'Fr': _seventh_inversions + (False,),
+    'It': _triad_inversions + (False,),
+    'N': _triad_inversions + (False,),
+    'vii0': _seventh_inversions + (True,),
+    'CTo': _seventh_inversions + (True,),
+    'Cad': (('64',), '', False),
+    'Tr': ((), '', False),
+}
+_inversion_letters = {
+    '6': 'b', '64': 'c', '65': 'b', '43': 'c', '42': 'd', '2': 'd', 'a': ''
+}
+# Numeric inversions of a tertian chord, with the seventh they imply
+_tertian_figures = {
+    '6': 'b', '64': 'c', '65': '7b', '43': '7c', '42': '7d', '2': '7d'
+}
+
+
+def _normalize_tertian(match):
+    alteration, degree, quality, added, figure, letter, missing = match.groups()
+    if figure and (added or letter):
+        return None
+    if figure:
+        inversion = _tertian_figures[figure]
+    else:
+        inversion = (added or '') + _inversion_letters.get(letter, letter or '')
+    return _alterations[alteration] + degree + quality + inversion + (missing or '')
+
+
+def _normalize_special(match):
+    name, seventh, figure, letter = match.groups()
+    name = _special_names.get(name, name)
+    figures, letters, takes_seventh = _special_inversions[name]
+    if figure and (letter or seventh):
+        return None
+    if (seventh and not takes_seventh) or (figure and figure not in figures) or (letter and letter not in letters):
+        return None
+    if name == 'Cad':
+        return name
+    inversion = figure or letter or ''
+    return name + _inversion_letters.get(inversion, inversion)
+
+
+def _normalize_chord(chord):
+    match = _special.match(chord)
+    if match:
+        return _normalize_special(match)
+    match = _tertian.match(chord)
+    if match:
+        return _normalize_tertian(match)
+    match = _descriptive_letter.match(chord)
+    if match:
+        letter, alteration, intervals = match.groups()
+        return '?' + letter.upper() + _alterations[alteration] + intervals
+    match = _descriptive_degree.match(chord)
+    if match:
+        alteration, degree, intervals = match.groups()
+        return '?' + _alterations[alteration] + degree.lower() + intervals
+    return None
+
+
+def _normalize_tonicization(tonicization):
+    match = _tonicization.match(tonicization)
+    if not match:
+        return None
+    alteration, degree = match.groups()
+    if degree == 'N':
+        return '-II'
+    return _alterations[alteration] + degree
+
+
+def _normalize_harmalysis(label):
+    prefix = ''
+    match = _key.match(label)
+    if match:
+        letter, alteration, scale, function, label = match.groups()
+        if letter.isupper() and scale:
+            return None
+        if scale == '_har':
+            scale = None
+        prefix = letter + _alterations[alteration] + (scale or '') + function
+    chord, *tonicizations = label.split('/')
+    parts = [_normalize_chord(chord)] + [_normalize_tonicization(t) for t in tonicizations]
+    if None in parts:
+        return None
+    return prefix + '/'.join(parts)
+
+
+def _normalize(label):
+    match = _implicit.match(label)
+    if match:
+        inner = _normalize_harmalysis(match.group(1))
+        return '({})'.format(inner) if inner is not None else None
+    match = _alternate.match(label)
+    if match:
+        first = _normalize_harmalysis(match.group(1))
+        second = _normalize_harmalysis(match.group(2))
+        if first is None or second is None:
+            return None
+        return '{}[{}]'.format(first, second)
+    return _normalize_harmalysis(label)
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize(label):
+    label = label.strip()
+    normalized = _normalize(label)
+    return normalized if normalized is not None else label
@@ -16,47 +16,87 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from lark import Lark, tree, Transformer, v_args
+from harmalysis.parsers.chordlabel_lalr import Transformer, v_args
+from harmalysis.parsers.lalr import StandaloneParser
+from harmalysis.parsers import limits as label_limits
+import harmalysis.parsers.chordlabel_lalr as chordlabel_lalr
+from harmalysis.classes.chordlabel import ChordType, chord_type_intervals, from_codes
+from harmalysis.classes.pitch_class import PitchClassSpelling
+import functools
 import sys
 import pathlib
 import os
+import re
+
+
+def _chord_label(root, alteration, chord_type):
+    # Interned by root spelling and chord type
+    root = PitchClassSpelling(root, alteration)
+    return from_codes(root.to_code(), chord_type.name)
 
 
 @v_args(inline=True)
 class ChordLabelParser(Transformer):
-    root = str
-    root_with_alteration = lambda self, letter, alteration: "{}{}".format(letter, alteration)
-    major_triad_chord = lambda self: 'major'
-    minor_triad_chord = lambda self: 'minor'
-    augmented_triad_chord = lambda self: 'augmented'
-    diminished_triad_chord = lambda self: 'diminished'
-    major_seventh_chord = lambda self: 'major seventh'
-    dominant_seventh_chord = lambda self: 'dominant seventh'
-    augmented_major_seventh_chord = lambda self: 'augmented major seventh'
-    minor_seventh_chord = lambda self: 'minor seventh'
-    minor_major_seventh_chord = lambda self: 'minor major seventh'
-    half_diminished_seventh_chord = lambda self: 'half-diminished seventh'
-    fully_diminished_seventh_chord = lambda self: 'fully-diminished seventh'
-    italian_augmented_sixth = lambda self: 'italian augmented sixth'
-    french_augmented_sixth = lambda self: 'french augmented sixth'
-    german_augmented_sixth = lambda self: 'german augmented sixth'
-    chordlabel = lambda self, root, chord: "{} {}".format(root, chord)
+    root = lambda self, letter: (str(letter), None)
+    root_with_alteration = lambda self, letter, alteration: (str(letter), str(alteration))
+    major_triad_chord = lambda self: ChordType.MAJOR
+    minor_triad_chord = lambda self: ChordType.MINOR
+    augmented_triad_chord = lambda self: ChordType.AUGMENTED
+    diminished_triad_chord = lambda self: ChordType.DIMINISHED
+    major_seventh_chord = lambda self: ChordType.MAJOR_SEVENTH
+    dominant_seventh_chord = lambda self: ChordType.DOMINANT_SEVENTH
+    augmented_major_seventh_chord = lambda self: ChordType.AUGMENTED_MAJOR_SEVENTH
+    minor_seventh_chord = lambda self: ChordType.MINOR_SEVENTH
+    minor_major_seventh_chord = lambda self: ChordType.MINOR_MAJOR_SEVENTH
+    half_diminished_seventh_chord = lambda self: ChordType.HALF_DIMINISHED_SEVENTH
+    fully_diminished_seventh_chord = lambda self: ChordType.FULLY_DIMINISHED_SEVENTH
+    italian_augmented_sixth = lambda self: ChordType.ITALIAN_AUGMENTED_SIXTH
+    french_augmented_sixth = lambda self: ChordType.FRENCH_AUGMENTED_SIXTH
+    german_augmented_sixth = lambda self: ChordType.GERMAN_AUGMENTED_SIXTH
+    chordlabel = lambda self, root, chord_type: _chord_label(root[0], root[1], chord_type)
 
 
 current_dir = pathlib.Path(__file__).parent.absolute()
 grammarfile = os.path.join(str(current_dir), 'chordlabel.lark')
-parser = Lark(open(grammarfile).read())
+parser = StandaloneParser(chordlabel_lalr)
 pngs_folder = os.path.join(str(current_dir), 'ast_pngs/')
 
-def parse(query, full_tree=False, create_png=False):
-    ast = parser.parse(query)
-    if create_png:
-        tree.pydot__tree_to_png(ast, '{}{}.png'.format(pngs_folder, query))
+# The language of chordlabel.lark is regular: a note letter, an optional
+# alteration and the intervals of one of the chord types. Labels are
+# matched by this expression, the parser is only used for the trees and
+# to report the errors.
+_alterations = sorted(PitchClassSpelling.alterations, key=len, reverse=True)
+_chord_types = {intervals: chord_type for chord_type, intervals in chord_type_intervals.items()}
+_label = re.compile(r'([A-Ga-g])({})?({})\Z'.format(
+    '|'.join(re.escape(alteration) for alteration in _alterations),
+    '|'.join(sorted(_chord_types, key=len, reverse=True)),
+))
+
+
+@functools.lru_cache(maxsize=4096)
+def _match(query):
+    match = _label.match(query)
+    if match is None:
+        return None
+    letter, alteration, intervals = match.groups()
+    return _chord_label(letter, alteration, _chord_types[intervals])
+
+def _parse(query):
+    chord_label = _match(query)
+    if chord_label is None:
+        # Raises the error of the parser (or parses what the expression missed)
+        return ChordLabelParser().transform(parser.parse(query))
+    return chord_label
+
+def parse(query, full_tree=False, limits=None):
+    # ASTs are drawn in batches by harmalysis.parsers.render. The result is
+    # a ChordLabel, its description is the former string result.
+    label_limits.prescan(query, limits)
     if full_tree:
-        return ast
-    return ChordLabelParser().transform(ast)
+        return parser.parse(query)
+    return _parse(query)
 
 if __name__ == '__main__':
-    ast = parse(sys.argv[1], full_tree=True)
-    print(ChordLabelParser().transform(ast))
-    tree.pydot__tree_to_png(ast, 'ast_pngs/harmalysis_chordlabel.png')
\ No newline at end of file
+    import harmalysis.parsers.render as render
+    print(parse(sys.argv[1]))
+    render.render([sys.argv[1]], syntax='chordlabel')
\ No newline at end of file
@@ -0,0 +1,217 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import bisect
+import itertools
+import random
+import re
+
+import harmalysis.parsers.roman as roman
+from harmalysis.classes.interval import is_perfect_interval
+
+# The weight of an expansion is the product of the weights of its rule
+# alias and of every symbol (rule or terminal name) in it, 1 by default.
+# User weights are applied on top of these.
+# Self-recursive expansions (e.g., chained tonicizations) are also
+# multiplied by the 'repeat' weight.
+# Every label belongs to the language of roman.lark; a small fraction
+# (e.g., triple sharps reached by altering degrees of sharp keys) is still
+# rejected by the chord classes when the tree is transformed.
+DEFAULT_WEIGHTS = {
+    # Labels
+    'implicit': 0.03,
+    'alternate': 0.03,
+    'key': 0.15,
+    'tonicization': 0.15,
+    'repeat': 0.1,
+    'special_chord': 0.15,
+    'descriptive_chord_by_degree': 0.01,
+    'descriptive_chord_by_letter': 0.01,
+    # Scale degrees
+    'TONIC_UPPERCASE': 4,
+    'SUBDOMINANT_UPPERCASE': 2,
+    'DOMINANT_UPPERCASE': 4,
+    'SUPERTONIC_UPPERCASE': 0.5,
+    'MEDIANT_UPPERCASE': 0.5,
+    'SUBMEDIANT_UPPERCASE': 0.5,
+    'SEVENTH_DEGREE_UPPERCASE': 0.5,
+    'TONIC_LOWERCASE': 2,
+    'SUPERTONIC_LOWERCASE': 2,
+    'SUBDOMINANT_LOWERCASE': 1.5,
+    'SUBMEDIANT_LOWERCASE': 1.5,
+    'SEVENTH_DEGREE_LOWERCASE': 1,
+    'MEDIANT_LOWERCASE': 0.5,
+    'DOMINANT_LOWERCASE': 0.5,
+    # Keys
+    '_MINOR_NATURAL': 0.05,
+    '_MINOR_HARMONIC': 0.05,
+    '_MINOR_MELODIC': 0.05,
+    # Tertian chords
+    '_alteration': 0.1,
+    'DOUBLE_FLAT': 0.05,
+    'DOUBLE_SHARP': 0.05,
+    'augmented_triad': 0.05,
+    'diminished_triad': 0.3,
+    'tertian_triad': 10,
+    'tertian_triad_with_inversion_by_number': 3,
+    'tertian_triad_with_inversion_by_letter': 0.5,
+    'tertian_seventh': 4,
+    'tertian_seventh_with_inversion_by_number': 2,
+    'tertian_seventh_with_inversion_by_letter': 0.5,
+    'tertian_ninth': 0.3,
+    'tertian_ninth_with_inversion_by_letter': 0.05,
+    'tertian_eleventh': 0.05,
+    'tertian_eleventh_with_inversion_by_letter': 0.01,
+    'tertian_thirteenth': 0.05,
+    'tertian_thirteenth_with_inversion_by_letter': 0.01,
+    'added_seventh_with_quality': 0.2,
+    'added_ninth_with_quality': 0.2,
+    'added_eleventh_with_quality': 0.2,
+    'added_thirteenth_with_quality': 0.2,
+    'DOUBLE_AUGMENTED_INTERVAL': 0.02,
+    'DOUBLE_DIMINISHED_INTERVAL': 0.02,
+    # Omitting the root is not supported by the chord classes
+    'MISSING_ROOT': 0,
+    'MISSING_THIRD': 0.02,
+    'MISSING_FIFTH': 0.05,
+    'MISSING_SEVENTH': 0.02,
+    'MISSING_NINTH': 0.02,
+    'MISSING_ELEVENTH': 0.02,
+    # Special chords (the Tristan chord is not implemented by the chord classes)
+    'special_tristan': 0,
+    # Intervals of descriptive chords, each one is included with
+    # a probability of weight / (weight + 1)
+    'DESCRIPTIVE_INTERVALS': 20,
+    'INTERVAL_UNISON': 0,
+    'INTERVAL_SECOND': 0.1,
+    'INTERVAL_THIRD': 20,
+    'INTERVAL_FOURTH': 0.1,
+    'INTERVAL_FIFTH': 10,
+    'INTERVAL_SIXTH': 0.2,
+    'INTERVAL_OCTAVE': 0.05,
+    'INTERVAL_NINTH': 0.2,
+    'INTERVAL_TENTH': 0.02,
+    'INTERVAL_ELEVENTH': 0.1,
+    'INTERVAL_TWELFTH': 0.02,
+    'INTERVAL_THIRTEENTH': 0.1,
+    'INTERVAL_FOURTEENTH': 0.02,
+    'INTERVAL_FIFTEENTH': 0.02,
+}
+
+# The intervals of descriptive chords are a single terminal
+DESCRIPTIVE_INTERVALS = [
+    'INTERVAL_UNISON', 'INTERVAL_SECOND', 'INTERVAL_THIRD', 'INTERVAL_FOURTH', 'INTERVAL_FIFTH',
+    'INTERVAL_SIXTH', 'INTERVAL_SEVENTH', 'INTERVAL_OCTAVE', 'INTERVAL_NINTH', 'INTERVAL_TENTH',
+    'INTERVAL_ELEVENTH', 'INTERVAL_TWELFTH', 'INTERVAL_THIRTEENTH', 'INTERVAL_FOURTEENTH', 'INTERVAL_FIFTEENTH',
+]
+PERFECT_QUALITIES = ['PERFECT_INTERVAL', 'AUGMENTED_INTERVAL', 'DIMINISHED_INTERVAL', 'DOUBLE_AUGMENTED_INTERVAL', 'DOUBLE_DIMINISHED_INTERVAL']
+NONPERFECT_QUALITIES = ['MAJOR_INTERVAL', 'MINOR_INTERVAL', 'AUGMENTED_INTERVAL', 'DIMINISHED_INTERVAL', 'DOUBLE_AUGMENTED_INTERVAL', 'DOUBLE_DIMINISHED_INTERVAL']
+
+_alternatives = re.compile(r'^\(\?:(.*)\)$')
+_range = re.compile(r'^\[(.)-(.)\]$')
+_escaped = re.compile(r'\\(.)')
+# Lookarounds only restrict where the lexer accepts a terminal
+_lookaround = re.compile(r'\(\?<?[=!].*\)$')
+
+
+def _terminal_strings(terminal):
+    # Every string matched by a terminal of the grammar (they are all finite)
+    pattern = terminal.pattern
+    if pattern.type == 'str':
+        return [pattern.value]
+    value = _lookaround.sub('', pattern.value)
+    match = _range.match(value)
+    if match:
+        first, last = match.groups()
+        return [chr(c) for c in range(ord(first), ord(last) + 1)]
+    match = _alternatives.match(value)
+    if match:
+        return [_escaped.sub(r'\1', alternative) for alternative in re.split(r'(?<!\\)\|', match.group(1))]
+    raise ValueError("the terminal '{}' has an unsupported pattern '{}'".format(terminal.name, pattern.value))
+
+
+class LabelGenerator(object):
+    def __init__(self, weights=None, seed=None, parser=None):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        self.weights.update(weights or {})
+        self.random = random.Random(seed)
+        parser = parser or roman.parser
+        self.terminals = {t.name: _terminal_strings(t) for t in parser.terminals if t.name != 'DESCRIPTIVE_INTERVALS'}
+        self.intervals = []
+        for step, name in enumerate(DESCRIPTIVE_INTERVALS, 1):
+            weight = self.weights.get(name, 1.0)
+            qualities = PERFECT_QUALITIES if is_perfect_interval(step) else NONPERFECT_QUALITIES
+            cumulative = list(itertools.accumulate(self.weights.get(quality, 1.0) for quality in qualities))
+            symbols = [self.terminals[quality][0] for quality in qualities]
+            self.intervals.append((weight / (weight + 1), str(step), symbols, cumulative))
+        expansions = {}
+        for rule in parser.rules:
+            origin = rule.origin.name
+            symbols = tuple(symbol.name for symbol in rule.expansion)
+            weight = self.weights.get(rule.alias, 1.0)
+            for symbol in symbols:
+                weight *= self.weights.get(symbol, 1.0)
+            if origin in symbols:
+                weight *= self.weights.get('repeat', 1.0)
+            if weight > 0:
+                expansions.setdefault(origin, []).append((symbols, weight))
+        self.rules = {}
+        for origin, choices in expansions.items():
+            cumulative = list(itertools.accumulate(weight for _, weight in choices))
+            self.rules[origin] = ([symbols for symbols, _ in choices], cumulative)
+
+    def descriptive_intervals(self):
+        uniform = self.random.random
+        output = []
+        for probability, step, qualities, cumulative in self.intervals:
+            if uniform() < probability:
+                quality = bisect.bisect_right(cumulative, uniform() * cumulative[-1])
+                output.append(qualities[min(quality, len(qualities) - 1)] + step)
+        return ''.join(output)
+
+    def label(self):
+        uniform = self.random.random
+        output = []
+        stack = ['start']
+        while stack:
+            symbol = stack.pop()
+            if symbol == 'DESCRIPTIVE_INTERVALS':
+                output.append(self.descriptive_intervals())
+                continue
+            strings = self.terminals.get(symbol)
+            if strings is not None:
+                output.append(strings[int(uniform() * len(strings))])
+                continue
+            if symbol not in self.rules:
+                raise ValueError("every expansion of '{}' has a weight of zero".format(symbol))
+            expansions, cumulative = self.rules[symbol]
+            choice = bisect.bisect_right(cumulative, uniform() * cumulative[-1])
+            stack.extend(reversed(expansions[min(choice, len(expansions) - 1)]))
+        return ''.join(output)
+
+    def __iter__(self):
+        while True:
+            yield self.label()
+
+    def generate(self, count):
+        for _ in range(count):
+            yield self.label()
+
+
+def generate(count, weights=None, seed=None):
+    return LabelGenerator(weights, seed).generate(count)
@@ -0,0 +1,38 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+
+class StandaloneParser(object):
+    # Parses with a standalone LALR module generated by build.py, which does
+    # not import lark. The grammars are LALR(1) with a contextual lexer, so
+    # the tables cover the whole language and invalid labels are reported
+    # by the LALR parser itself.
+    def __init__(self, module):
+        self.module = module
+        self.lalr = module.Lark_StandAlone()
+
+    @property
+    def rules(self):
+        return self.lalr.rules
+
+    @property
+    def terminals(self):
+        return self.lalr.terminals
+
+    def parse(self, query):
+        return self.lalr.parse(query)
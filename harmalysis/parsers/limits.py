@@ -0,0 +1,54 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Guards against labels that take long to parse, e.g., very long strings or
+# long tonicization chains. The length and the structure of a label are
+# checked with a string scan before parsing. The LALR parser is linear in
+# the length of the label, so these bound the time of a parse as well.
+
+import collections
+
+Limits = collections.namedtuple('Limits', ['max_length', 'max_tonicizations', 'max_alternatives'])
+
+# Replaced to change the limits of every parser, e.g.,
+# limits.DEFAULT = limits.DEFAULT._replace(max_length=64)
+DEFAULT = Limits(max_length=128, max_tonicizations=8, max_alternatives=1)
+
+
+class LabelLimitError(ValueError):
+    def __init__(self, query, limit, value, maximum):
+        super().__init__("label '{}' exceeds {} ({} > {})".format(query[:40], limit, value, maximum))
+        self.query = query
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+
+
+def prescan(query, limits=None):
+    # Linear in the length of the label, nothing is parsed
+    limits = limits or DEFAULT
+    if limits.max_length is not None and len(query) > limits.max_length:
+        raise LabelLimitError(query, 'max_length', len(query), limits.max_length)
+    if limits.max_alternatives is not None:
+        alternatives = query.count('[')
+        if alternatives > limits.max_alternatives:
+            raise LabelLimitError(query, 'max_alternatives', alternatives, limits.max_alternatives)
+    if limits.max_tonicizations is not None:
+        depth = max(part.count('/') for part in query.split('['))
+        if depth > limits.max_tonicizations:
+            raise LabelLimitError(query, 'max_tonicizations', depth, limits.max_tonicizations)
@@ -0,0 +1,180 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Renders the ASTs of many labels with Graphviz. Equal trees are rendered
+# once and the 'dot' processes run in a bounded pool of background threads.
+# With fmt='dot' the Graphviz sources are written and 'dot' is not needed.
+
+import concurrent.futures
+import shutil
+import subprocess
+import threading
+
+import harmalysis.parsers.roman as roman
+import harmalysis.parsers.chordlabel as chordlabel
+
+PARSERS = {
+    'roman': roman.parse_tree,
+    'chordlabel': chordlabel.parser.parse,
+}
+FOLDERS = {
+    'roman': roman.pngs_folder,
+    'chordlabel': chordlabel.pngs_folder,
+}
+
+# Fill colors of the rule nodes, by depth
+COLORS = ['#e8f0fe', '#fce8e6', '#e6f4ea', '#fef7e0', '#f3e8fd']
+
+
+def _quote(text):
+    return '"{}"'.format(str(text).replace('\\', '\\\\').replace('"', '\\"'))
+
+
+def tree_nodes(tree, prefix='n'):
+    # The node and edge statements of a tree, without the enclosing graph
+    lines = []
+    stack = [(tree, None, 0)]
+    count = 0
+    while stack:
+        node, parent, depth = stack.pop()
+        name = '{}{}'.format(prefix, count)
+        count += 1
+        if hasattr(node, 'children'):
+            lines.append('{} [label={}, style=filled, fillcolor="{}"];'.format(name, _quote(node.data), COLORS[depth % len(COLORS)]))
+            stack.extend((child, name, depth + 1) for child in reversed(node.children))
+        else:
+            lines.append('{} [label={}, shape=box];'.format(name, _quote(repr(str(node)))))
+        if parent:
+            lines.append('{} -> {};'.format(parent, name))
+    return lines
+
+
+def to_dot(tree, rankdir='LR'):
+    lines = ['digraph tree {', 'rankdir={};'.format(rankdir)]
+    lines.extend(tree_nodes(tree))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def sheet_dot(trees, rankdir='LR'):
+    # One graph with a cluster per (label, tree)
+    lines = ['digraph sheet {', 'rankdir={};'.format(rankdir)]
+    for i, (label, tree) in enumerate(trees):
+        lines.append('subgraph cluster{} {{'.format(i))
+        lines.append('label={};'.format(_quote(label)))
+        lines.extend(tree_nodes(tree, 'c{}n'.format(i)))
+        lines.append('}')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def run_dot(source, fmt):
+    if fmt == 'dot':
+        return source.encode()
+    executable = shutil.which('dot')
+    if not executable:
+        raise RuntimeError("Graphviz 'dot' was not found, it is needed to render '{}' files".format(fmt))
+    return subprocess.run([executable, '-T' + fmt], input=source.encode(), stdout=subprocess.PIPE, check=True).stdout
+
+
+class TreeRenderer(object):
+    def __init__(self, syntax='roman', folder=None, fmt='png', workers=4, pending=None):
+        if syntax not in PARSERS:
+            raise KeyError("syntax '{}' is not supported".format(syntax))
+        self.parse = PARSERS[syntax]
+        self.folder = folder or FOLDERS[syntax]
+        self.fmt = fmt
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        # Submitting blocks while this many trees are waiting to be rendered
+        self.slots = threading.BoundedSemaphore(pending or 4 * workers)
+        self.futures = {}
+
+    def filename(self, query):
+        return roman.create_filename(query, self.folder, self.fmt)
+
+    def _render(self, tree, filenames):
+        try:
+            data = run_dot(to_dot(tree), self.fmt)
+            for filename in filenames:
+                with open(filename, 'wb') as f:
+                    f.write(data)
+            return filenames
+        finally:
+            self.slots.release()
+
+    def submit(self, queries):
+        # Returns the futures of the distinct trees; a label that was
+        # already submitted is not rendered again
+        trees = {}
+        for query in queries:
+            filename = self.filename(query)
+            if filename in self.futures:
+                continue
+            filenames = trees.setdefault(self.parse(query), [])
+            if filename not in filenames:
+                filenames.append(filename)
+        futures = []
+        for tree, filenames in trees.items():
+            self.slots.acquire()
+            try:
+                future = self.executor.submit(self._render, tree, filenames)
+            except BaseException:
+                # The slot is only released by _render once it runs
+                self.slots.release()
+                raise
+            for filename in filenames:
+                self.futures[filename] = future
+            futures.append(future)
+        return futures
+
+    def wait(self):
+        for future in list(self.futures.values()):
+            future.result()
+        return sorted(self.futures)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def render(queries, syntax='roman', folder=None, fmt='png', workers=4):
+    # Writes one file per distinct label and returns their names
+    with TreeRenderer(syntax, folder, fmt, workers) as renderer:
+        renderer.submit(queries)
+        return renderer.wait()
+
+
+def render_sheet(queries, filename=None, syntax='roman', fmt='svg'):
+    # All the distinct labels in a single graph, rendered by one 'dot' call
+    if syntax not in PARSERS:
+        raise KeyError("syntax '{}' is not supported".format(syntax))
+    trees = {}
+    for query in queries:
+        labels = trees.setdefault(PARSERS[syntax](query), [])
+        if query not in labels:
+            labels.append(query)
+    data = run_dot(sheet_dot((', '.join(labels), tree) for tree, labels in trees.items()), fmt)
+    if filename:
+        with open(filename, 'wb') as f:
+            f.write(data)
+    return data
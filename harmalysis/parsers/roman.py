@@ -16,14 +16,23 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from lark import Lark, tree, Transformer, v_args
+from harmalysis.parsers.roman_lalr import Transformer, v_args, UnexpectedInput, UnexpectedCharacters, UnexpectedEOF
+from harmalysis.parsers.lalr import StandaloneParser
+from harmalysis.parsers import limits as label_limits
+from harmalysis.parsers.limits import LabelLimitError
+import harmalysis.parsers.roman_lalr as roman_lalr
 import harmalysis.common as common
+import harmalysis.functions as functions
+from harmalysis.classes import interval
 from harmalysis.classes.interval import IntervalSpelling, pitch_class_to_pitch_class
 from harmalysis.classes.chord import DescriptiveChord, InvertibleChord, TertianChord, AugmentedSixthChord, NeapolitanChord, HalfDiminishedChord, CadentialSixFourChord, CommonToneDiminishedChord
 from harmalysis.classes.harmalysis import Harmalysis
 from harmalysis.classes.key import Key
 from harmalysis.classes.pitch_class import PitchClassSpelling
+import collections
+import functools
 import pathlib
+import re
 import sys
 import os
 
@@ -54,7 +63,7 @@ def _tertian_chord(triad, missing_intervals, inversion_by_number=None, inversion
                 diatonic_intervals = [7, 9, 11, 13]
     # Handling missing intervals
     for i in missing_intervals:
-        tertian.missing_interval(int(i))
+        tertian.missing_interval(i)
     return (tertian, diatonic_intervals)
 
 
@@ -82,11 +91,25 @@ def _special_chord(name, inversion_by_number=None, inversion_by_letter=None):
     return special
 
 
+_descriptive_interval = re.compile(r'(AA|DD|[MmPAD])(\d+)')
+
+
+def _descriptive_intervals(intervals=None):
+    # The lexer already checked the order and the qualities of the
+    # intervals (e.g., 'M3P5m7'), they are only split here
+    if intervals is None:
+        return []
+    return [
+        interval.from_code(IntervalSpelling.interval_qualities.index(quality) * 16 + int(step))
+        for quality, step in _descriptive_interval.findall(intervals)
+    ]
+
+
 def _descriptive_letter(pitch_class, intervals):
     descriptive_chord = DescriptiveChord()
     descriptive_chord.root = pitch_class
-    for quality, step in zip(intervals[::2], intervals[1::2]):
-        descriptive_chord.add_interval(IntervalSpelling(str(quality), int(step)))
+    for interval_spelling in intervals:
+        descriptive_chord.add_interval(interval_spelling)
     return descriptive_chord
 
 
@@ -94,8 +117,8 @@ def _descriptive_degree(scale_degree, intervals):
     descriptive_chord = DescriptiveChord()
     alteration, degree = scale_degree
     descriptive_chord.set_scale_degree(degree, alteration)
-    for quality, step in zip(intervals[::2], intervals[1::2]):
-        descriptive_chord.add_interval(IntervalSpelling(str(quality), int(step)))
+    for interval_spelling in intervals:
+        descriptive_chord.add_interval(interval_spelling)
     return descriptive_chord
 
 
@@ -272,12 +295,12 @@ class RomanParser(Transformer):
     added_eleventh_with_quality = lambda self, quality, interval: IntervalSpelling(str(quality), int(interval))
     added_thirteenth_diatonic = int
     added_thirteenth_with_quality = lambda self, quality, interval: IntervalSpelling(str(quality), int(interval))
-    # Missing intervals
-    missing_intervals_triad = list
-    missing_intervals_seventhchord = list
-    missing_intervals_ninthchord = list
-    missing_intervals_eleventhchord = list
-    missing_intervals_thirteenthchord = list
+    # Missing intervals (e.g., 'x3', 'x5')
+    missing_intervals_triad = lambda self, *missing: [int(m[1:]) for m in missing]
+    missing_intervals_seventhchord = missing_intervals_triad
+    missing_intervals_ninthchord = missing_intervals_triad
+    missing_intervals_eleventhchord = missing_intervals_triad
+    missing_intervals_thirteenthchord = missing_intervals_triad
     # Tertian
     tertian_triad = lambda self, triad, missing_intervals: _tertian_chord(triad, missing_intervals)
     tertian_triad_with_inversion_by_number = lambda self, triad, inversion_by_number, missing_intervals: _tertian_chord(triad, missing_intervals, inversion_by_number=inversion_by_number)
@@ -326,7 +349,7 @@ class RomanParser(Transformer):
     #############################
     pitch_class = lambda self, letter: PitchClassSpelling(letter)
     pitch_class_with_alteration = lambda self, letter, alteration: PitchClassSpelling(letter, alteration)
-    descriptive_intervals = lambda self, *args: list(args)
+    descriptive_intervals = lambda self, intervals=None: _descriptive_intervals(intervals)
     scale_degree = lambda self, degree: (None, degree.lower())
     scale_degree_with_alteration = lambda self, alteration, degree: (alteration, degree.lower())
     descriptive_chord_by_letter = lambda self, pitch_class, intervals: _descriptive_letter(pitch_class, intervals)
@@ -370,10 +393,10 @@ class RomanParser(Transformer):
 
 current_dir = pathlib.Path(__file__).parent.absolute()
 grammarfile = os.path.join(str(current_dir), 'roman.lark')
-parser = Lark(open(grammarfile).read())
+parser = StandaloneParser(roman_lalr)
 pngs_folder = os.path.join(str(current_dir), 'ast_pngs/')
 
-def create_filename(query):
+def create_filename(query, folder=None, extension='png'):
     f = query.replace(":", "_colon_")
     f = f.replace("=", "_equal_")
     f = f.replace(">", "_gt_")
@@ -386,18 +409,84 @@ def create_filename(query):
     f = f.replace(")", "_parenthesisr_")
     f = f.replace("[", "_bracketl_")
     f = f.replace("]", "_bracketr_")
-    return pngs_folder + f + ".png"
-
-def parse(query, full_tree=False, create_png=False):
-    ast = parser.parse(query)
-    if create_png:
-        filename = create_filename(query)
-        tree.pydot__tree_to_png(ast, filename)
+    return os.path.join(folder or pngs_folder, '{}.{}'.format(f, extension))
+
+@functools.lru_cache(maxsize=16384)
+def parse_tree(query):
+    # The AST of a label does not depend on the established key, only its
+    # transformation does, so repeated labels can share the parse
+    return parser.parse(query)
+
+def parse_batch(queries, skip_errors=False, infer_functions=False, cache=None, limits=None):
+    # Distinct labels are parsed once; the transformation still runs in
+    # order, as labels with '=>:' change the key of the labels after them.
+    # A harmalysis.parsers.cache.ParseCache keeps the analyses across runs.
+    # Labels over the limits raise LabelLimitError (or are skipped).
+    if cache is not None:
+        return cache.parse_batch(queries, skip_errors, infer_functions, limits)
+    trees = {}
+    for query in queries:
+        if query not in trees:
+            try:
+                label_limits.prescan(query, limits)
+                trees[query] = parse_tree(query)
+            except (UnexpectedInput, LabelLimitError):
+                if not skip_errors:
+                    raise
+                trees[query] = None
+    transformer = RomanParser()
+    analyses = [transformer.transform(trees[query]) if trees[query] is not None else None for query in queries]
+    if infer_functions:
+        functions.infer_functions(analyses)
+    return analyses
+
+def _parse(query):
+    return RomanParser().transform(parser.parse(query))
+
+def parse(query, full_tree=False, limits=None):
+    # ASTs are drawn in batches by harmalysis.parsers.render
+    label_limits.prescan(query, limits)
     if full_tree:
-        return ast
-    return RomanParser().transform(ast)
+        return parser.parse(query)
+    return _parse(query)
+
+InvalidLabel = collections.namedtuple('InvalidLabel', ['index', 'label', 'column', 'expected'])
+
+
+def error_location(query, error):
+    # The LALR parser reports the end of the label as a '$END' token
+    if isinstance(error, UnexpectedEOF) or getattr(getattr(error, 'token', None), 'type', None) == '$END':
+        return (len(query) + 1, tuple(sorted(set(error.expected))))
+    expected = getattr(error, 'allowed', None) or getattr(error, 'expected', None) or []
+    return (error.column, tuple(sorted(set(expected))))
+
+
+def recognize(query, limits=None):
+    try:
+        label_limits.prescan(query, limits)
+    except LabelLimitError as e:
+        # Reported at the start of the label, with the exceeded limit
+        return (1, (e.limit,))
+    try:
+        parser.parse(query)
+        return None
+    except UnexpectedInput as e:
+        return error_location(query, e)
+
+
+def validate(queries, limits=None):
+    invalid = []
+    recognized = {}
+    for index, query in enumerate(queries):
+        if query not in recognized:
+            recognized[query] = recognize(query, limits)
+        error = recognized[query]
+        if error:
+            column, expected = error
+            invalid.append(InvalidLabel(index, query, column, expected))
+    return invalid
 
 if __name__ == '__main__':
-    ast = parse(sys.argv[1], full_tree=True)
-    print(RomanParser().transform(ast))
-    tree.pydot__tree_to_png(ast, 'ast_pngs/harmalysis_roman.png')
\ No newline at end of file
+    import harmalysis.parsers.render as render
+    print(parse(sys.argv[1]))
+    render.render([sys.argv[1]])
\ No newline at end of file
@@ -0,0 +1,3444 @@
+# Generated from roman.lark (sha256 c62b7a87840002547ffc109e647f03fb18bf9d87a6daf367fe023b4cbe3ae413) with lark 1.2.2.
+# Do not edit, run `python -m harmalysis.parsers.build` instead.
+# The file was automatically generated by Lark v1.2.2
+__version__ = "1.2.2"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        assert self.pos_in_stream is not None, self
+        pos = self.pos_in_stream
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        assert isinstance(other, Symbol), other
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name, filter_out=False):
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: Token, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner):
+        self.scanner = scanner
+
+    def __call__(self, t):
+        res = self.scanner.match(t.value, 0)
+        if res:
+            _value, t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, match_whole=True, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes, match_whole=False):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+        self.match_whole = match_whole
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        postfix = '$' if self.match_whole else ''
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp() + postfix) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text, pos):
+        for mre in self._mres:
+            m = mre.match(text, pos)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: str
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: str, line_ctr: Optional[LineCounter]=None, last_token: Optional[Token]=None):
+        self.text = text
+        self.line_ctr = line_ctr or LineCounter(b'\n' if isinstance(text, bytes) else '\n')
+        self.last_token = last_token
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text is other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: LexerState):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text: str) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text):
+        #--
+        return LexerState(text)
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner = None
+
+    def _build_scanner(self):
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        self._scanner = Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self):
+        if self._scanner is None:
+            self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < len(lex_state.text):
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', False)
+    if future_interface:
+        return lexer_class
+    else:
+        class CustomLexerWrapper(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: str) -> Union[str, LexerThread]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        return text if self.skip_lexer else cls.from_text(self.lexer, text)
+
+    def parse(self, text: str, start=None, on_error=None):
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[str]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)  ##
+
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_cache_%s_%s_%s_%s.tmp" % (username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    __serialize_fields__ = 'parser', 'rules', 'options'
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: str, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[str]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: str, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token(self.DEDENT_type, '')
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+import pickle, zlib, base64
+DATA = (
+{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}], 'ignore': [], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}, {'@': 246}, {'@': 247}, {'@': 248}, {'@': 249}, {'@': 250}, {'@': 251}, {'@': 252}, {'@': 253}, {'@': 254}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'SLASH', 1: 'RSQB', 2: '$END', 3: 'RPAR', 4: 'LSQB', 5: 'PERFECT_INTERVAL', 6: 'SEVENTHCHORD_SECOND_INVERSION_NUMERIC', 7: 'INTERVAL_SEVENTH', 8: 'AUGMENTED_INTERVAL', 9: 'INTERVAL_NINTH', 10: 'SEVENTHCHORD_THIRD_INVERSION_NUMERIC', 11: 'DIMINISHED_INTERVAL', 12: 'DOUBLE_DIMINISHED_INTERVAL', 13: 'TRIAD_SECOND_INVERSION_NUMERIC', 14: 'MINOR_INTERVAL', 15: 'INTERVAL_THIRTEENTH', 16: 'MAJOR_INTERVAL', 17: 'MISSING_THIRD', 18: 'TRIAD_FIRST_INVERSION_NUMERIC', 19: 'DOUBLE_AUGMENTED_INTERVAL', 20: 'AUGMENTED_FIFTH', 21: 'MISSING_ROOT', 22: 'MISSING_FIFTH', 23: 'INTERVAL_ELEVENTH', 24: 'TRIAD_INVERSION_LETTER', 25: 'SEVENTHCHORD_FIRST_INVERSION_NUMERIC', 26: 'seventhchord_inversion_by_letter', 27: 'SEVENTHCHORD_INVERSION_LETTER', 28: '_MINOR_HARMONIC', 29: '_MINOR_MELODIC', 30: '_MINOR_NATURAL', 31: 'DIMINISHED_FIFTH', 32: 'MISSING_NINTH', 33: 'MISSING_SEVENTH', 34: 'MISSING_ELEVENTH', 35: 'ELEVENTHCHORD_INVERSION_LETTER', 36: 'KEY_AS_ESTABLISHED', 37: 'KEY_AS_REFERENCE', 38: 'SUBMEDIANT_LOWERCASE', 39: 'SEVENTH_DEGREE_LOWERCASE', 40: 'GERMAN', 41: 'ITALIAN', 42: 'DOUBLE_SHARP', 43: 'TONIC_LOWERCASE', 44: 'QMARK', 45: 'DOUBLE_FLAT', 46: 'MEDIANT_UPPERCASE', 47: 'TONIC_UPPERCASE', 48: 'TRISTAN', 49: 'HALF_DIMINISHED_SEVENTH', 50: 'SEVENTH_DEGREE_UPPERCASE', 51: 'COMMON_TONE_DIMINISHED', 52: 'SUBMEDIANT_UPPERCASE', 53: 'SHARP', 54: 'NEAPOLITAN', 55: 'SUPERTONIC_UPPERCASE', 56: 'FLAT', 57: 'SUBDOMINANT_LOWERCASE', 58: 'FRENCH', 59: 'MEDIANT_LOWERCASE', 60: 'SUBDOMINANT_UPPERCASE', 61: 'DOMINANT_UPPERCASE', 62: 'DOMINANT_LOWERCASE', 63: 'SUPERTONIC_LOWERCASE', 64: 'CADENTIAL_SIX_FOUR', 65: 'DESCRIPTIVE_INTERVALS', 66: '_alteration', 67: 'eleventhchord_inversion_by_letter', 68: '_missing_intervals_ninthchord', 69: 'missing_intervals_eleventhchord', 70: '_missing_intervals_seventhchord', 71: '_missing_intervals_triad', 72: '_missing_intervals_eleventhchord', 73: 'missing_intervals_triad', 74: 'special_chord', 75: 'tristan', 76: 'KEY_LETTER_LOWERCASE', 77: 'triad', 78: 'italian', 79: 'german', 80: 'common_tone_diminished', 81: 'NOTE_LETTER_UPPERCASE', 82: 'tertian_chord', 83: 'half_diminished_seventh', 84: 'descriptive_chord_by_letter', 85: 'key', 86: 'neapolitan', 87: 'key_definition', 88: 'cadential_six_four', 89: 'harmalysis', 90: '_scale_degree_major', 91: 'french', 92: 'descriptive_chord_by_degree', 93: '_scale_degree_minor', 94: 'seventhchord_inversion_by_number', 95: 'THIRTEENTHCHORD_INVERSION_LETTER', 96: 'missing_intervals_ninthchord', 97: 'UNDERSCORE', 98: '__tonicization_plus_0', 99: 'tonicization', 100: 'by_scale_degree', 101: 'missing_intervals_seventhchord', 102: '_descriptive_degree_minor', 103: '_descriptive_degree_major', 104: 'scale_degree_root', 105: '_nonperfect_interval_quality', 106: 'added_eleventh', 107: 'added_ninth', 108: '_perfect_interval_quality', 109: 'added_seventh', 110: 'added_thirteenth', 111: 'triad_inversion_by_letter', 112: 'triad_inversion_by_number', 113: 'key_as_established', 114: 'key_as_reference', 115: 'descriptive_intervals', 116: 'NINTHCHORD_INVERSION_LETTER', 117: '_missing_intervals_thirteenthchord', 118: 'missing_intervals_thirteenthchord', 119: 'thirteenthchord_inversion_by_letter', 120: 'ninthchord_inversion_by_letter', 121: 'start', 122: 'alternate', 123: 'LPAR', 124: 'implicit', 125: 'PITCH_CLASS_LETTER_LOWERCASE', 126: 'pitch_class_root'}, 'states': {0: {0: (1, {'@': 167}), 1: (1, {'@': 167}), 2: (1, {'@': 167}), 3: (1, {'@': 167}), 4: (1, {'@': 167})}, 1: {5: (1, {'@': 93}), 6: (1, {'@': 93}), 7: (1, {'@': 93}), 8: (1, {'@': 93}), 9: (1, {'@': 93}), 10: (1, {'@': 93}), 11: (1, {'@': 93}), 0: (1, {'@': 93}), 12: (1, {'@': 93}), 13: (1, {'@': 93}), 14: (1, {'@': 93}), 1: (1, {'@': 93}), 15: (1, {'@': 93}), 16: (1, {'@': 93}), 17: (1, {'@': 93}), 18: (1, {'@': 93}), 19: (1, {'@': 93}), 20: (1, {'@': 93}), 21: (1, {'@': 93}), 22: (1, {'@': 93}), 23: (1, {'@': 93}), 24: (1, {'@': 93}), 25: (1, {'@': 93}), 3: (1, {'@': 93}), 4: (1, {'@': 93}), 2: (1, {'@': 93})}, 2: {26: (0, 30), 27: (0, 141), 0: (1, {'@': 193}), 1: (1, {'@': 193}), 2: (1, {'@': 193}), 3: (1, {'@': 193}), 4: (1, {'@': 193})}, 3: {28: (0, 53), 29: (0, 10), 30: (0, 183)}, 4: {5: (1, {'@': 102}), 6: (1, {'@': 102}), 7: (1, {'@': 102}), 8: (1, {'@': 102}), 9: (1, {'@': 102}), 10: (1, {'@': 102}), 11: (1, {'@': 102}), 0: (1, {'@': 102}), 12: (1, {'@': 102}), 25: (1, {'@': 102}), 13: (1, {'@': 102}), 14: (1, {'@': 102}), 1: (1, {'@': 102}), 15: (1, {'@': 102}), 16: (1, {'@': 102}), 17: (1, {'@': 102}), 18: (1, {'@': 102}), 19: (1, {'@': 102}), 21: (1, {'@': 102}), 22: (1, {'@': 102}), 31: (1, {'@': 102}), 24: (1, {'@': 102}), 23: (1, {'@': 102}), 3: (1, {'@': 102}), 4: (1, {'@': 102}), 2: (1, {'@': 102})}, 5: {2: (1, {'@': 146}), 0: (1, {'@': 146}), 32: (1, {'@': 146}), 3: (1, {'@': 146}), 33: (1, {'@': 146}), 4: (1, {'@': 146}), 1: (1, {'@': 146}), 34: (1, {'@': 146})}, 6: {17: (1, {'@': 137}), 2: (1, {'@': 137}), 0: (1, {'@': 137}), 21: (1, {'@': 137}), 3: (1, {'@': 137}), 4: (1, {'@': 137}), 33: (1, {'@': 137}), 22: (1, {'@': 137}), 1: (1, {'@': 137})}, 7: {17: (1, {'@': 127}), 35: (1, {'@': 127}), 2: (1, {'@': 127}), 0: (1, {'@': 127}), 21: (1, {'@': 127}), 32: (1, {'@': 127}), 3: (1, {'@': 127}), 4: (1, {'@': 127}), 33: (1, {'@': 127}), 22: (1, {'@': 127}), 1: (1, {'@': 127})}, 8: {6: (1, {'@': 110}), 0: (1, {'@': 110}), 13: (1, {'@': 110}), 14: (1, {'@': 110}), 1: (1, {'@': 110}), 15: (1, {'@': 110}), 16: (1, {'@': 110}), 17: (1, {'@': 110}), 18: (1, {'@': 110}), 22: (1, {'@': 110}), 23: (1, {'@': 110}), 25: (1, {'@': 110}), 5: (1, {'@': 110}), 7: (1, {'@': 110}), 8: (1, {'@': 110}), 9: (1, {'@': 110}), 10: (1, {'@': 110}), 11: (1, {'@': 110}), 12: (1, {'@': 110}), 19: (1, {'@': 110}), 21: (1, {'@': 110}), 24: (1, {'@': 110}), 2: (1, {'@': 110}), 3: (1, {'@': 110}), 4: (1, {'@': 110})}, 9: {2: (1, {'@': 254}), 0: (1, {'@': 254}), 3: (1, {'@': 254}), 4: (1, {'@': 254}), 1: (1, {'@': 254})}, 10: {36: (1, {'@': 86}), 37: (1, {'@': 86})}, 11: {5: (1, {'@': 101}), 6: (1, {'@': 101}), 7: (1, {'@': 101}), 8: (1, {'@': 101}), 9: (1, {'@': 101}), 10: (1, {'@': 101}), 11: (1, {'@': 101}), 0: (1, {'@': 101}), 12: (1, {'@': 101}), 25: (1, {'@': 101}), 13: (1, {'@': 101}), 14: (1, {'@': 101}), 1: (1, {'@': 101}), 15: (1, {'@': 101}), 16: (1, {'@': 101}), 17: (1, {'@': 101}), 18: (1, {'@': 101}), 19: (1, {'@': 101}), 21: (1, {'@': 101}), 22: (1, {'@': 101}), 31: (1, {'@': 101}), 24: (1, {'@': 101}), 23: (1, {'@': 101}), 3: (1, {'@': 101}), 4: (1, {'@': 101}), 2: (1, {'@': 101})}, 12: {2: (1, {'@': 134}), 0: (1, {'@': 134}), 3: (1, {'@': 134}), 4: (1, {'@': 134}), 1: (1, {'@': 134}), 17: (1, {'@': 134}), 21: (1, {'@': 134}), 22: (1, {'@': 134})}, 13: {2: (1, {'@': 251})}, 14: {38: (1, {'@': 76}), 39: (1, {'@': 76}), 40: (1, {'@': 76}), 41: (1, {'@': 76}), 42: (1, {'@': 76}), 43: (1, {'@': 76}), 44: (1, {'@': 76}), 45: (1, {'@': 76}), 46: (1, {'@': 76}), 47: (1, {'@': 76}), 48: (1, {'@': 76}), 49: (1, {'@': 76}), 50: (1, {'@': 76}), 51: (1, {'@': 76}), 52: (1, {'@': 76}), 53: (1, {'@': 76}), 54: (1, {'@': 76}), 55: (1, {'@': 76}), 56: (1, {'@': 76}), 57: (1, {'@': 76}), 58: (1, {'@': 76}), 59: (1, {'@': 76}), 60: (1, {'@': 76}), 61: (1, {'@': 76}), 62: (1, {'@': 76}), 63: (1, {'@': 76}), 64: (1, {'@': 76})}, 15: {2: (1, {'@': 158}), 0: (1, {'@': 158}), 3: (1, {'@': 158}), 4: (1, {'@': 158}), 1: (1, {'@': 158})}, 16: {0: (1, {'@': 187}), 1: (1, {'@': 187}), 2: (1, {'@': 187}), 3: (1, {'@': 187}), 4: (1, {'@': 187})}, 17: {2: (1, {'@': 210}), 65: (1, {'@': 210}), 3: (1, {'@': 210}), 4: (1, {'@': 210}), 1: (1, {'@': 210})}, 18: {42: (0, 39), 45: (0, 203), 53: (0, 177), 66: (0, 174), 56: (0, 88), 36: (1, {'@': 77}), 37: (1, {'@': 77})}, 19: {2: (1, {'@': 148}), 0: (1, {'@': 148}), 32: (1, {'@': 148}), 3: (1, {'@': 148}), 33: (1, {'@': 148}), 4: (1, {'@': 148}), 1: (1, {'@': 148}), 34: (1, {'@': 148})}, 20: {67: (0, 187), 68: (0, 204), 69: (0, 181), 17: (0, 57), 21: (0, 111), 70: (0, 23), 71: (0, 19), 72: (0, 15), 22: (0, 5), 35: (0, 46), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 32: (1, {'@': 147}), 3: (1, {'@': 147}), 33: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 21: {38: (1, {'@': 88}), 39: (1, {'@': 88}), 40: (1, {'@': 88}), 41: (1, {'@': 88}), 42: (1, {'@': 88}), 43: (1, {'@': 88}), 44: (1, {'@': 88}), 45: (1, {'@': 88}), 46: (1, {'@': 88}), 47: (1, {'@': 88}), 48: (1, {'@': 88}), 49: (1, {'@': 88}), 50: (1, {'@': 88}), 51: (1, {'@': 88}), 52: (1, {'@': 88}), 53: (1, {'@': 88}), 54: (1, {'@': 88}), 55: (1, {'@': 88}), 56: (1, {'@': 88}), 57: (1, {'@': 88}), 58: (1, {'@': 88}), 59: (1, {'@': 88}), 60: (1, {'@': 88}), 61: (1, {'@': 88}), 62: (1, {'@': 88}), 63: (1, {'@': 88}), 64: (1, {'@': 88})}, 22: {6: (1, {'@': 105}), 0: (1, {'@': 105}), 13: (1, {'@': 105}), 14: (1, {'@': 105}), 1: (1, {'@': 105}), 15: (1, {'@': 105}), 16: (1, {'@': 105}), 17: (1, {'@': 105}), 18: (1, {'@': 105}), 22: (1, {'@': 105}), 23: (1, {'@': 105}), 25: (1, {'@': 105}), 5: (1, {'@': 105}), 7: (1, {'@': 105}), 8: (1, {'@': 105}), 9: (1, {'@': 105}), 10: (1, {'@': 105}), 11: (1, {'@': 105}), 12: (1, {'@': 105}), 19: (1, {'@': 105}), 21: (1, {'@': 105}), 24: (1, {'@': 105}), 2: (1, {'@': 105}), 3: (1, {'@': 105}), 4: (1, {'@': 105})}, 23: {33: (0, 48), 2: (1, {'@': 150}), 0: (1, {'@': 150}), 32: (1, {'@': 150}), 3: (1, {'@': 150}), 4: (1, {'@': 150}), 1: (1, {'@': 150}), 34: (1, {'@': 150})}, 24: {2: (1, {'@': 248})}, 25: {17: (0, 57), 73: (0, 143), 21: (0, 111), 71: (0, 92), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 26: {17: (1, {'@': 126}), 35: (1, {'@': 126}), 2: (1, {'@': 126}), 0: (1, {'@': 126}), 21: (1, {'@': 126}), 32: (1, {'@': 126}), 3: (1, {'@': 126}), 4: (1, {'@': 126}), 33: (1, {'@': 126}), 22: (1, {'@': 126}), 1: (1, {'@': 126})}, 27: {0: (1, {'@': 198}), 1: (1, {'@': 198}), 2: (1, {'@': 198}), 3: (1, {'@': 198}), 4: (1, {'@': 198})}, 28: {74: (0, 95), 75: (0, 142), 76: (0, 157), 77: (0, 64), 78: (0, 180), 44: (0, 184), 79: (0, 31), 58: (0, 175), 80: (0, 128), 45: (0, 203), 47: (0, 153), 81: (0, 18), 46: (0, 112), 50: (0, 190), 55: (0, 90), 82: (0, 154), 83: (0, 80), 84: (0, 71), 85: (0, 74), 43: (0, 171), 86: (0, 170), 38: (0, 11), 66: (0, 96), 87: (0, 65), 56: (0, 88), 88: (0, 56), 42: (0, 39), 62: (0, 119), 89: (0, 166), 90: (0, 115), 91: (0, 110), 51: (0, 137), 63: (0, 98), 59: (0, 105), 57: (0, 134), 64: (0, 132), 92: (0, 164), 54: (0, 158), 41: (0, 150), 48: (0, 146), 52: (0, 195), 93: (0, 191), 60: (0, 189), 40: (0, 185), 53: (0, 177), 39: (0, 4), 61: (0, 1), 49: (0, 209)}, 29: {6: (1, {'@': 109}), 0: (1, {'@': 109}), 13: (1, {'@': 109}), 14: (1, {'@': 109}), 1: (1, {'@': 109}), 15: (1, {'@': 109}), 16: (1, {'@': 109}), 17: (1, {'@': 109}), 18: (1, {'@': 109}), 22: (1, {'@': 109}), 23: (1, {'@': 109}), 25: (1, {'@': 109}), 5: (1, {'@': 109}), 7: (1, {'@': 109}), 8: (1, {'@': 109}), 9: (1, {'@': 109}), 10: (1, {'@': 109}), 11: (1, {'@': 109}), 12: (1, {'@': 109}), 19: (1, {'@': 109}), 21: (1, {'@': 109}), 24: (1, {'@': 109}), 2: (1, {'@': 109}), 3: (1, {'@': 109}), 4: (1, {'@': 109})}, 30: {0: (1, {'@': 195}), 1: (1, {'@': 195}), 2: (1, {'@': 195}), 3: (1, {'@': 195}), 4: (1, {'@': 195})}, 31: {25: (0, 58), 10: (0, 12), 27: (0, 141), 26: (0, 152), 6: (0, 123), 94: (0, 179), 0: (1, {'@': 180}), 1: (1, {'@': 180}), 2: (1, {'@': 180}), 3: (1, {'@': 180}), 4: (1, {'@': 180})}, 32: {0: (1, {'@': 197}), 1: (1, {'@': 197}), 2: (1, {'@': 197}), 3: (1, {'@': 197}), 4: (1, {'@': 197})}, 33: {17: (1, {'@': 129}), 2: (1, {'@': 129}), 0: (1, {'@': 129}), 21: (1, {'@': 129}), 32: (1, {'@': 129}), 3: (1, {'@': 129}), 95: (1, {'@': 129}), 4: (1, {'@': 129}), 33: (1, {'@': 129}), 22: (1, {'@': 129}), 34: (1, {'@': 129}), 1: (1, {'@': 129})}, 34: {23: (1, {'@': 111})}, 35: {0: (1, {'@': 191}), 1: (1, {'@': 191}), 2: (1, {'@': 191}), 3: (1, {'@': 191}), 4: (1, {'@': 191})}, 36: {23: (0, 7)}, 37: {2: (1, {'@': 157}), 0: (1, {'@': 157}), 3: (1, {'@': 157}), 4: (1, {'@': 157}), 1: (1, {'@': 157})}, 38: {17: (0, 57), 21: (0, 111), 70: (0, 23), 71: (0, 19), 96: (0, 0), 22: (0, 5), 68: (0, 37), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 33: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 39: {36: (1, {'@': 74}), 37: (1, {'@': 74}), 57: (1, {'@': 74}), 38: (1, {'@': 74}), 39: (1, {'@': 74}), 59: (1, {'@': 74}), 60: (1, {'@': 74}), 46: (1, {'@': 74}), 43: (1, {'@': 74}), 61: (1, {'@': 74}), 62: (1, {'@': 74}), 50: (1, {'@': 74}), 63: (1, {'@': 74}), 52: (1, {'@': 74}), 55: (1, {'@': 74}), 47: (1, {'@': 74}), 97: (1, {'@': 74}), 2: (1, {'@': 74}), 3: (1, {'@': 74}), 65: (1, {'@': 74}), 4: (1, {'@': 74}), 1: (1, {'@': 74})}, 40: {98: (0, 192), 0: (0, 77), 99: (0, 176), 100: (0, 106), 1: (1, {'@': 238}), 2: (1, {'@': 238}), 4: (1, {'@': 238}), 3: (1, {'@': 238})}, 41: {2: (1, {'@': 232}), 0: (1, {'@': 232}), 3: (1, {'@': 232}), 4: (1, {'@': 232}), 1: (1, {'@': 232})}, 42: {17: (0, 57), 21: (0, 111), 101: (0, 63), 70: (0, 54), 71: (0, 19), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 43: {0: (1, {'@': 190}), 1: (1, {'@': 190}), 2: (1, {'@': 190}), 3: (1, {'@': 190}), 4: (1, {'@': 190})}, 44: {102: (0, 201), 52: (0, 70), 43: (0, 139), 60: (0, 144), 59: (0, 178), 50: (0, 79), 47: (0, 193), 39: (0, 89), 46: (0, 125), 62: (0, 140), 38: (0, 172), 103: (0, 194), 55: (0, 17), 57: (0, 207), 63: (0, 104), 61: (0, 151)}, 45: {43: (0, 139), 102: (0, 147), 66: (0, 44), 104: (0, 159), 62: (0, 140), 46: (0, 125), 103: (0, 117), 42: (0, 39), 55: (0, 17), 45: (0, 203), 39: (0, 89), 53: (0, 177), 61: (0, 151), 52: (0, 70), 60: (0, 144), 59: (0, 178), 47: (0, 193), 38: (0, 172), 57: (0, 207), 63: (0, 104), 50: (0, 79), 56: (0, 88)}, 46: {17: (1, {'@': 138}), 2: (1, {'@': 138}), 0: (1, {'@': 138}), 32: (1, {'@': 138}), 21: (1, {'@': 138}), 3: (1, {'@': 138}), 4: (1, {'@': 138}), 33: (1, {'@': 138}), 22: (1, {'@': 138}), 1: (1, {'@': 138})}, 47: {0: (1, {'@': 188}), 1: (1, {'@': 188}), 2: (1, {'@': 188}), 3: (1, {'@': 188}), 4: (1, {'@': 188})}, 48: {2: (1, {'@': 149}), 0: (1, {'@': 149}), 32: (1, {'@': 149}), 3: (1, {'@': 149}), 4: (1, {'@': 149}), 1: (1, {'@': 149}), 34: (1, {'@': 149})}, 49: {101: (0, 60), 17: (0, 57), 27: (0, 141), 21: (0, 111), 70: (0, 54), 71: (0, 19), 26: (0, 86), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 50: {38: (1, {'@': 75}), 39: (1, {'@': 75}), 40: (1, {'@': 75}), 41: (1, {'@': 75}), 42: (1, {'@': 75}), 43: (1, {'@': 75}), 44: (1, {'@': 75}), 45: (1, {'@': 75}), 46: (1, {'@': 75}), 47: (1, {'@': 75}), 48: (1, {'@': 75}), 49: (1, {'@': 75}), 50: (1, {'@': 75}), 51: (1, {'@': 75}), 52: (1, {'@': 75}), 53: (1, {'@': 75}), 54: (1, {'@': 75}), 55: (1, {'@': 75}), 56: (1, {'@': 75}), 57: (1, {'@': 75}), 58: (1, {'@': 75}), 59: (1, {'@': 75}), 60: (1, {'@': 75}), 61: (1, {'@': 75}), 62: (1, {'@': 75}), 63: (1, {'@': 75}), 64: (1, {'@': 75})}, 51: {3: (1, {'@': 227}), 2: (1, {'@': 227}), 4: (1, {'@': 227}), 1: (1, {'@': 227})}, 52: {7: (1, {'@': 118}), 15: (1, {'@': 118}), 9: (1, {'@': 118}), 23: (1, {'@': 112})}, 53: {36: (1, {'@': 84}), 37: (1, {'@': 84})}, 54: {2: (1, {'@': 156}), 0: (1, {'@': 156}), 3: (1, {'@': 156}), 4: (1, {'@': 156}), 1: (1, {'@': 156})}, 55: {2: (1, {'@': 153}), 0: (1, {'@': 153}), 3: (1, {'@': 153}), 4: (1, {'@': 153}), 1: (1, {'@': 153})}, 56: {13: (0, 27), 0: (1, {'@': 199}), 1: (1, {'@': 199}), 2: (1, {'@': 199}), 3: (1, {'@': 199}), 4: (1, {'@': 199})}, 57: {22: (0, 85), 2: (1, {'@': 145}), 0: (1, {'@': 145}), 32: (1, {'@': 145}), 3: (1, {'@': 145}), 33: (1, {'@': 145}), 4: (1, {'@': 145}), 1: (1, {'@': 145}), 34: (1, {'@': 145})}, 58: {2: (1, {'@': 132}), 0: (1, {'@': 132}), 3: (1, {'@': 132}), 4: (1, {'@': 132}), 1: (1, {'@': 132}), 17: (1, {'@': 132}), 21: (1, {'@': 132}), 22: (1, {'@': 132})}, 59: {20: (0, 188), 6: (1, {'@': 104}), 0: (1, {'@': 104}), 13: (1, {'@': 104}), 14: (1, {'@': 104}), 1: (1, {'@': 104}), 15: (1, {'@': 104}), 16: (1, {'@': 104}), 17: (1, {'@': 104}), 18: (1, {'@': 104}), 22: (1, {'@': 104}), 23: (1, {'@': 104}), 25: (1, {'@': 104}), 5: (1, {'@': 104}), 7: (1, {'@': 104}), 8: (1, {'@': 104}), 9: (1, {'@': 104}), 10: (1, {'@': 104}), 11: (1, {'@': 104}), 12: (1, {'@': 104}), 19: (1, {'@': 104}), 21: (1, {'@': 104}), 24: (1, {'@': 104}), 2: (1, {'@': 104}), 3: (1, {'@': 104}), 4: (1, {'@': 104})}, 60: {0: (1, {'@': 164}), 1: (1, {'@': 164}), 2: (1, {'@': 164}), 3: (1, {'@': 164}), 4: (1, {'@': 164})}, 61: {2: (1, {'@': 234}), 0: (1, {'@': 234}), 3: (1, {'@': 234}), 4: (1, {'@': 234}), 1: (1, {'@': 234})}, 62: {2: (1, {'@': 208}), 3: (1, {'@': 208}), 65: (1, {'@': 208}), 4: (1, {'@': 208}), 1: (1, {'@': 208})}, 63: {0: (1, {'@': 162}), 1: (1, {'@': 162}), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162})}, 64: {5: (0, 34), 10: (0, 12), 9: (0, 91), 105: (0, 78), 106: (0, 20), 107: (0, 120), 23: (0, 26), 12: (0, 66), 108: (0, 36), 25: (0, 58), 17: (0, 57), 8: (0, 52), 109: (0, 49), 19: (0, 76), 71: (0, 92), 94: (0, 42), 73: (0, 94), 13: (0, 102), 6: (0, 123), 11: (0, 121), 110: (0, 116), 15: (0, 168), 111: (0, 138), 16: (0, 206), 21: (0, 111), 24: (0, 198), 18: (0, 196), 112: (0, 25), 14: (0, 186), 22: (0, 5), 7: (0, 100), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 65: {113: (0, 21), 36: (0, 14), 114: (0, 81), 37: (0, 50)}, 66: {7: (1, {'@': 121}), 15: (1, {'@': 121}), 9: (1, {'@': 121}), 23: (1, {'@': 115})}, 67: {17: (1, {'@': 123}), 2: (1, {'@': 123}), 27: (1, {'@': 123}), 21: (1, {'@': 123}), 0: (1, {'@': 123}), 3: (1, {'@': 123}), 4: (1, {'@': 123}), 22: (1, {'@': 123}), 1: (1, {'@': 123})}, 68: {1: (1, {'@': 244}), 2: (1, {'@': 244}), 4: (1, {'@': 244}), 3: (1, {'@': 244})}, 69: {28: (0, 200), 29: (0, 165), 30: (0, 113)}, 70: {2: (1, {'@': 214}), 65: (1, {'@': 214}), 3: (1, {'@': 214}), 4: (1, {'@': 214}), 1: (1, {'@': 214})}, 71: {1: (1, {'@': 247}), 2: (1, {'@': 247}), 4: (1, {'@': 247}), 3: (1, {'@': 247})}, 72: {97: (0, 3), 36: (1, {'@': 80}), 37: (1, {'@': 80})}, 73: {0: (1, {'@': 203}), 1: (1, {'@': 203}), 2: (1, {'@': 203}), 3: (1, {'@': 203}), 4: (1, {'@': 203})}, 74: {75: (0, 142), 77: (0, 64), 78: (0, 180), 79: (0, 31), 58: (0, 175), 44: (0, 45), 80: (0, 128), 83: (0, 80), 45: (0, 203), 47: (0, 153), 46: (0, 112), 50: (0, 190), 55: (0, 90), 92: (0, 75), 43: (0, 171), 86: (0, 170), 38: (0, 11), 66: (0, 96), 82: (0, 40), 56: (0, 88), 74: (0, 97), 88: (0, 56), 42: (0, 39), 62: (0, 119), 90: (0, 115), 91: (0, 110), 51: (0, 137), 57: (0, 134), 63: (0, 98), 59: (0, 105), 64: (0, 132), 54: (0, 158), 41: (0, 150), 48: (0, 146), 52: (0, 195), 93: (0, 191), 60: (0, 189), 40: (0, 185), 53: (0, 177), 39: (0, 4), 61: (0, 1), 49: (0, 209)}, 75: {1: (1, {'@': 246}), 2: (1, {'@': 246}), 4: (1, {'@': 246}), 3: (1, {'@': 246})}, 76: {7: (1, {'@': 120}), 15: (1, {'@': 120}), 9: (1, {'@': 120}), 23: (1, {'@': 114})}, 77: {57: (0, 134), 63: (0, 98), 59: (0, 105), 50: (0, 190), 93: (0, 133), 55: (0, 90), 42: (0, 39), 62: (0, 119), 52: (0, 195), 43: (0, 171), 90: (0, 130), 66: (0, 162), 54: (0, 136), 45: (0, 203), 38: (0, 11), 47: (0, 153), 60: (0, 189), 53: (0, 177), 39: (0, 4), 61: (0, 1), 46: (0, 112), 56: (0, 88)}, 78: {9: (0, 107), 7: (0, 67), 15: (0, 33)}, 79: {2: (1, {'@': 215}), 65: (1, {'@': 215}), 3: (1, {'@': 215}), 4: (1, {'@': 215}), 1: (1, {'@': 215})}, 80: {25: (0, 58), 10: (0, 12), 27: (0, 141), 94: (0, 32), 26: (0, 124), 7: (0, 2), 6: (0, 123), 0: (1, {'@': 194}), 1: (1, {'@': 194}), 2: (1, {'@': 194}), 3: (1, {'@': 194}), 4: (1, {'@': 194})}, 81: {38: (1, {'@': 87}), 39: (1, {'@': 87}), 40: (1, {'@': 87}), 41: (1, {'@': 87}), 42: (1, {'@': 87}), 43: (1, {'@': 87}), 44: (1, {'@': 87}), 45: (1, {'@': 87}), 46: (1, {'@': 87}), 47: (1, {'@': 87}), 48: (1, {'@': 87}), 49: (1, {'@': 87}), 50: (1, {'@': 87}), 51: (1, {'@': 87}), 52: (1, {'@': 87}), 53: (1, {'@': 87}), 54: (1, {'@': 87}), 55: (1, {'@': 87}), 56: (1, {'@': 87}), 57: (1, {'@': 87}), 58: (1, {'@': 87}), 59: (1, {'@': 87}), 60: (1, {'@': 87}), 61: (1, {'@': 87}), 62: (1, {'@': 87}), 63: (1, {'@': 87}), 64: (1, {'@': 87})}, 82: {2: (1, {'@': 142}), 0: (1, {'@': 142}), 32: (1, {'@': 142}), 3: (1, {'@': 142}), 33: (1, {'@': 142}), 4: (1, {'@': 142}), 1: (1, {'@': 142}), 34: (1, {'@': 142})}, 83: {2: (1, {'@': 206}), 3: (1, {'@': 206}), 65: (1, {'@': 206}), 4: (1, {'@': 206}), 1: (1, {'@': 206})}, 84: {115: (0, 145), 65: (0, 51), 3: (1, {'@': 228}), 2: (1, {'@': 228}), 4: (1, {'@': 228}), 1: (1, {'@': 228})}, 85: {2: (1, {'@': 144}), 0: (1, {'@': 144}), 32: (1, {'@': 144}), 3: (1, {'@': 144}), 33: (1, {'@': 144}), 4: (1, {'@': 144}), 1: (1, {'@': 144}), 34: (1, {'@': 144})}, 86: {17: (0, 57), 21: (0, 111), 101: (0, 109), 70: (0, 54), 71: (0, 19), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 87: {0: (1, {'@': 202}), 1: (1, {'@': 202}), 2: (1, {'@': 202}), 3: (1, {'@': 202}), 4: (1, {'@': 202})}, 88: {36: (1, {'@': 71}), 37: (1, {'@': 71}), 57: (1, {'@': 71}), 38: (1, {'@': 71}), 39: (1, {'@': 71}), 59: (1, {'@': 71}), 60: (1, {'@': 71}), 46: (1, {'@': 71}), 43: (1, {'@': 71}), 61: (1, {'@': 71}), 62: (1, {'@': 71}), 50: (1, {'@': 71}), 63: (1, {'@': 71}), 52: (1, {'@': 71}), 55: (1, {'@': 71}), 47: (1, {'@': 71}), 97: (1, {'@': 71}), 2: (1, {'@': 71}), 3: (1, {'@': 71}), 65: (1, {'@': 71}), 4: (1, {'@': 71}), 1: (1, {'@': 71})}, 89: {2: (1, {'@': 222}), 65: (1, {'@': 222}), 3: (1, {'@': 222}), 4: (1, {'@': 222}), 1: (1, {'@': 222})}, 90: {5: (1, {'@': 90}), 6: (1, {'@': 90}), 7: (1, {'@': 90}), 8: (1, {'@': 90}), 9: (1, {'@': 90}), 10: (1, {'@': 90}), 11: (1, {'@': 90}), 0: (1, {'@': 90}), 12: (1, {'@': 90}), 13: (1, {'@': 90}), 14: (1, {'@': 90}), 1: (1, {'@': 90}), 15: (1, {'@': 90}), 16: (1, {'@': 90}), 17: (1, {'@': 90}), 18: (1, {'@': 90}), 19: (1, {'@': 90}), 20: (1, {'@': 90}), 21: (1, {'@': 90}), 22: (1, {'@': 90}), 23: (1, {'@': 90}), 24: (1, {'@': 90}), 25: (1, {'@': 90}), 3: (1, {'@': 90}), 4: (1, {'@': 90}), 2: (1, {'@': 90})}, 91: {17: (1, {'@': 124}), 116: (1, {'@': 124}), 2: (1, {'@': 124}), 0: (1, {'@': 124}), 21: (1, {'@': 124}), 3: (1, {'@': 124}), 4: (1, {'@': 124}), 33: (1, {'@': 124}), 22: (1, {'@': 124}), 1: (1, {'@': 124})}, 92: {2: (1, {'@': 155}), 0: (1, {'@': 155}), 3: (1, {'@': 155}), 4: (1, {'@': 155}), 1: (1, {'@': 155})}, 93: {1: (1, {'@': 230}), 3: (1, {'@': 230}), 2: (1, {'@': 230}), 4: (1, {'@': 230})}, 94: {0: (1, {'@': 160}), 1: (1, {'@': 160}), 2: (1, {'@': 160}), 3: (1, {'@': 160}), 4: (1, {'@': 160})}, 95: {98: (0, 192), 0: (0, 77), 99: (0, 129), 100: (0, 106), 1: (1, {'@': 241}), 2: (1, {'@': 241}), 4: (1, {'@': 241}), 3: (1, {'@': 241})}, 96: {57: (0, 134), 63: (0, 98), 59: (0, 105), 62: (0, 119), 61: (0, 1), 50: (0, 190), 38: (0, 11), 47: (0, 153), 55: (0, 90), 60: (0, 189), 52: (0, 195), 43: (0, 171), 93: (0, 127), 90: (0, 59), 39: (0, 4), 46: (0, 112)}, 97: {98: (0, 192), 0: (0, 77), 99: (0, 68), 100: (0, 106), 1: (1, {'@': 242}), 2: (1, {'@': 242}), 4: (1, {'@': 242}), 3: (1, {'@': 242})}, 98: {5: (1, {'@': 97}), 6: (1, {'@': 97}), 7: (1, {'@': 97}), 8: (1, {'@': 97}), 9: (1, {'@': 97}), 10: (1, {'@': 97}), 11: (1, {'@': 97}), 0: (1, {'@': 97}), 12: (1, {'@': 97}), 25: (1, {'@': 97}), 13: (1, {'@': 97}), 14: (1, {'@': 97}), 1: (1, {'@': 97}), 15: (1, {'@': 97}), 16: (1, {'@': 97}), 17: (1, {'@': 97}), 18: (1, {'@': 97}), 19: (1, {'@': 97}), 21: (1, {'@': 97}), 22: (1, {'@': 97}), 31: (1, {'@': 97}), 24: (1, {'@': 97}), 23: (1, {'@': 97}), 3: (1, {'@': 97}), 4: (1, {'@': 97}), 2: (1, {'@': 97})}, 99: {0: (1, {'@': 163}), 1: (1, {'@': 163}), 2: (1, {'@': 163}), 3: (1, {'@': 163}), 4: (1, {'@': 163})}, 100: {17: (1, {'@': 122}), 2: (1, {'@': 122}), 27: (1, {'@': 122}), 21: (1, {'@': 122}), 0: (1, {'@': 122}), 3: (1, {'@': 122}), 4: (1, {'@': 122}), 22: (1, {'@': 122}), 1: (1, {'@': 122})}, 101: {0: (1, {'@': 171}), 1: (1, {'@': 171}), 2: (1, {'@': 171}), 3: (1, {'@': 171}), 4: (1, {'@': 171})}, 102: {17: (1, {'@': 131}), 2: (1, {'@': 131}), 0: (1, {'@': 131}), 21: (1, {'@': 131}), 3: (1, {'@': 131}), 4: (1, {'@': 131}), 22: (1, {'@': 131}), 1: (1, {'@': 131})}, 103: {1: (1, {'@': 239}), 2: (1, {'@': 239}), 4: (1, {'@': 239}), 3: (1, {'@': 239})}, 104: {2: (1, {'@': 217}), 65: (1, {'@': 217}), 3: (1, {'@': 217}), 4: (1, {'@': 217}), 1: (1, {'@': 217})}, 105: {5: (1, {'@': 98}), 6: (1, {'@': 98}), 7: (1, {'@': 98}), 8: (1, {'@': 98}), 9: (1, {'@': 98}), 10: (1, {'@': 98}), 11: (1, {'@': 98}), 0: (1, {'@': 98}), 12: (1, {'@': 98}), 25: (1, {'@': 98}), 13: (1, {'@': 98}), 14: (1, {'@': 98}), 1: (1, {'@': 98}), 15: (1, {'@': 98}), 16: (1, {'@': 98}), 17: (1, {'@': 98}), 18: (1, {'@': 98}), 19: (1, {'@': 98}), 21: (1, {'@': 98}), 22: (1, {'@': 98}), 31: (1, {'@': 98}), 24: (1, {'@': 98}), 23: (1, {'@': 98}), 3: (1, {'@': 98}), 4: (1, {'@': 98}), 2: (1, {'@': 98})}, 106: {2: (1, {'@': 253}), 0: (1, {'@': 253}), 3: (1, {'@': 253}), 4: (1, {'@': 253}), 1: (1, {'@': 253})}, 107: {17: (1, {'@': 125}), 116: (1, {'@': 125}), 2: (1, {'@': 125}), 0: (1, {'@': 125}), 21: (1, {'@': 125}), 3: (1, {'@': 125}), 4: (1, {'@': 125}), 33: (1, {'@': 125}), 22: (1, {'@': 125}), 1: (1, {'@': 125})}, 108: {68: (0, 204), 17: (0, 57), 21: (0, 111), 70: (0, 23), 71: (0, 19), 117: (0, 126), 118: (0, 101), 72: (0, 118), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 32: (1, {'@': 147}), 3: (1, {'@': 147}), 33: (1, {'@': 147}), 4: (1, {'@': 147}), 34: (1, {'@': 147}), 1: (1, {'@': 147})}, 109: {0: (1, {'@': 165}), 1: (1, {'@': 165}), 2: (1, {'@': 165}), 3: (1, {'@': 165}), 4: (1, {'@': 165})}, 110: {25: (0, 58), 10: (0, 12), 27: (0, 141), 94: (0, 47), 26: (0, 16), 6: (0, 123), 0: (1, {'@': 186}), 1: (1, {'@': 186}), 2: (1, {'@': 186}), 3: (1, {'@': 186}), 4: (1, {'@': 186})}, 111: {17: (0, 208), 22: (0, 82), 2: (1, {'@': 143}), 0: (1, {'@': 143}), 32: (1, {'@': 143}), 3: (1, {'@': 143}), 33: (1, {'@': 143}), 4: (1, {'@': 143}), 1: (1, {'@': 143}), 34: (1, {'@': 143})}, 112: {5: (1, {'@': 91}), 6: (1, {'@': 91}), 7: (1, {'@': 91}), 8: (1, {'@': 91}), 9: (1, {'@': 91}), 10: (1, {'@': 91}), 11: (1, {'@': 91}), 0: (1, {'@': 91}), 12: (1, {'@': 91}), 13: (1, {'@': 91}), 14: (1, {'@': 91}), 1: (1, {'@': 91}), 15: (1, {'@': 91}), 16: (1, {'@': 91}), 17: (1, {'@': 91}), 18: (1, {'@': 91}), 19: (1, {'@': 91}), 20: (1, {'@': 91}), 21: (1, {'@': 91}), 22: (1, {'@': 91}), 23: (1, {'@': 91}), 24: (1, {'@': 91}), 25: (1, {'@': 91}), 3: (1, {'@': 91}), 4: (1, {'@': 91}), 2: (1, {'@': 91})}, 113: {36: (1, {'@': 81}), 37: (1, {'@': 81})}, 114: {0: (1, {'@': 169}), 1: (1, {'@': 169}), 2: (1, {'@': 169}), 3: (1, {'@': 169}), 4: (1, {'@': 169})}, 115: {20: (0, 22), 6: (1, {'@': 103}), 0: (1, {'@': 103}), 13: (1, {'@': 103}), 14: (1, {'@': 103}), 1: (1, {'@': 103}), 15: (1, {'@': 103}), 16: (1, {'@': 103}), 17: (1, {'@': 103}), 18: (1, {'@': 103}), 22: (1, {'@': 103}), 23: (1, {'@': 103}), 25: (1, {'@': 103}), 5: (1, {'@': 103}), 7: (1, {'@': 103}), 8: (1, {'@': 103}), 9: (1, {'@': 103}), 10: (1, {'@': 103}), 11: (1, {'@': 103}), 12: (1, {'@': 103}), 19: (1, {'@': 103}), 21: (1, {'@': 103}), 24: (1, {'@': 103}), 2: (1, {'@': 103}), 3: (1, {'@': 103}), 4: (1, {'@': 103})}, 116: {117: (0, 126), 118: (0, 122), 72: (0, 118), 119: (0, 108), 68: (0, 204), 17: (0, 57), 70: (0, 23), 21: (0, 111), 95: (0, 182), 71: (0, 19), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 32: (1, {'@': 147}), 3: (1, {'@': 147}), 33: (1, {'@': 147}), 4: (1, {'@': 147}), 34: (1, {'@': 147}), 1: (1, {'@': 147})}, 117: {2: (1, {'@': 223}), 3: (1, {'@': 223}), 65: (1, {'@': 223}), 4: (1, {'@': 223}), 1: (1, {'@': 223})}, 118: {34: (0, 55), 2: (1, {'@': 154}), 0: (1, {'@': 154}), 3: (1, {'@': 154}), 4: (1, {'@': 154}), 1: (1, {'@': 154})}, 119: {5: (1, {'@': 100}), 6: (1, {'@': 100}), 7: (1, {'@': 100}), 8: (1, {'@': 100}), 9: (1, {'@': 100}), 10: (1, {'@': 100}), 11: (1, {'@': 100}), 0: (1, {'@': 100}), 12: (1, {'@': 100}), 25: (1, {'@': 100}), 13: (1, {'@': 100}), 14: (1, {'@': 100}), 1: (1, {'@': 100}), 15: (1, {'@': 100}), 16: (1, {'@': 100}), 17: (1, {'@': 100}), 18: (1, {'@': 100}), 19: (1, {'@': 100}), 21: (1, {'@': 100}), 22: (1, {'@': 100}), 31: (1, {'@': 100}), 24: (1, {'@': 100}), 23: (1, {'@': 100}), 3: (1, {'@': 100}), 4: (1, {'@': 100}), 2: (1, {'@': 100})}, 120: {17: (0, 57), 96: (0, 149), 21: (0, 111), 70: (0, 23), 71: (0, 19), 120: (0, 38), 116: (0, 6), 22: (0, 5), 68: (0, 37), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 33: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 121: {7: (1, {'@': 119}), 15: (1, {'@': 119}), 9: (1, {'@': 119}), 23: (1, {'@': 113})}, 122: {0: (1, {'@': 170}), 1: (1, {'@': 170}), 2: (1, {'@': 170}), 3: (1, {'@': 170}), 4: (1, {'@': 170})}, 123: {2: (1, {'@': 133}), 0: (1, {'@': 133}), 3: (1, {'@': 133}), 4: (1, {'@': 133}), 1: (1, {'@': 133}), 17: (1, {'@': 133}), 21: (1, {'@': 133}), 22: (1, {'@': 133})}, 124: {0: (1, {'@': 196}), 1: (1, {'@': 196}), 2: (1, {'@': 196}), 3: (1, {'@': 196}), 4: (1, {'@': 196})}, 125: {2: (1, {'@': 211}), 65: (1, {'@': 211}), 3: (1, {'@': 211}), 4: (1, {'@': 211}), 1: (1, {'@': 211})}, 126: {2: (1, {'@': 159}), 0: (1, {'@': 159}), 3: (1, {'@': 159}), 4: (1, {'@': 159}), 1: (1, {'@': 159})}, 127: {31: (0, 8), 6: (1, {'@': 108}), 0: (1, {'@': 108}), 13: (1, {'@': 108}), 14: (1, {'@': 108}), 1: (1, {'@': 108}), 15: (1, {'@': 108}), 16: (1, {'@': 108}), 17: (1, {'@': 108}), 18: (1, {'@': 108}), 22: (1, {'@': 108}), 23: (1, {'@': 108}), 25: (1, {'@': 108}), 5: (1, {'@': 108}), 7: (1, {'@': 108}), 8: (1, {'@': 108}), 9: (1, {'@': 108}), 10: (1, {'@': 108}), 11: (1, {'@': 108}), 12: (1, {'@': 108}), 19: (1, {'@': 108}), 21: (1, {'@': 108}), 24: (1, {'@': 108}), 2: (1, {'@': 108}), 3: (1, {'@': 108}), 4: (1, {'@': 108})}, 128: {25: (0, 58), 10: (0, 12), 27: (0, 141), 94: (0, 199), 7: (0, 173), 6: (0, 123), 26: (0, 73), 0: (1, {'@': 201}), 1: (1, {'@': 201}), 2: (1, {'@': 201}), 3: (1, {'@': 201}), 4: (1, {'@': 201})}, 129: {1: (1, {'@': 243}), 2: (1, {'@': 243}), 4: (1, {'@': 243}), 3: (1, {'@': 243})}, 130: {2: (1, {'@': 231}), 0: (1, {'@': 231}), 3: (1, {'@': 231}), 4: (1, {'@': 231}), 1: (1, {'@': 231})}, 131: {4: (0, 28), 2: (1, {'@': 250})}, 132: {0: (1, {'@': 178}), 13: (1, {'@': 178}), 1: (1, {'@': 178}), 2: (1, {'@': 178}), 3: (1, {'@': 178}), 4: (1, {'@': 178})}, 133: {2: (1, {'@': 233}), 0: (1, {'@': 233}), 3: (1, {'@': 233}), 4: (1, {'@': 233}), 1: (1, {'@': 233})}, 134: {5: (1, {'@': 99}), 6: (1, {'@': 99}), 7: (1, {'@': 99}), 8: (1, {'@': 99}), 9: (1, {'@': 99}), 10: (1, {'@': 99}), 11: (1, {'@': 99}), 0: (1, {'@': 99}), 12: (1, {'@': 99}), 25: (1, {'@': 99}), 13: (1, {'@': 99}), 14: (1, {'@': 99}), 1: (1, {'@': 99}), 15: (1, {'@': 99}), 16: (1, {'@': 99}), 17: (1, {'@': 99}), 18: (1, {'@': 99}), 19: (1, {'@': 99}), 21: (1, {'@': 99}), 22: (1, {'@': 99}), 31: (1, {'@': 99}), 24: (1, {'@': 99}), 23: (1, {'@': 99}), 3: (1, {'@': 99}), 4: (1, {'@': 99}), 2: (1, {'@': 99})}, 135: {2: (1, {'@': 151}), 0: (1, {'@': 151}), 3: (1, {'@': 151}), 4: (1, {'@': 151}), 1: (1, {'@': 151}), 34: (1, {'@': 151})}, 136: {2: (1, {'@': 235}), 0: (1, {'@': 235}), 3: (1, {'@': 235}), 4: (1, {'@': 235}), 1: (1, {'@': 235})}, 137: {6: (1, {'@': 179}), 7: (1, {'@': 179}), 1: (1, {'@': 179}), 10: (1, {'@': 179}), 27: (1, {'@': 179}), 0: (1, {'@': 179}), 25: (1, {'@': 179}), 2: (1, {'@': 179}), 3: (1, {'@': 179}), 4: (1, {'@': 179})}, 138: {17: (0, 57), 21: (0, 111), 71: (0, 92), 73: (0, 99), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 139: {2: (1, {'@': 216}), 65: (1, {'@': 216}), 3: (1, {'@': 216}), 4: (1, {'@': 216}), 1: (1, {'@': 216})}, 140: {2: (1, {'@': 220}), 65: (1, {'@': 220}), 3: (1, {'@': 220}), 4: (1, {'@': 220}), 1: (1, {'@': 220})}, 141: {2: (1, {'@': 136}), 0: (1, {'@': 136}), 3: (1, {'@': 136}), 4: (1, {'@': 136}), 1: (1, {'@': 136}), 17: (1, {'@': 136}), 21: (1, {'@': 136}), 22: (1, {'@': 136})}, 142: {0: (1, {'@': 192}), 1: (1, {'@': 192}), 2: (1, {'@': 192}), 3: (1, {'@': 192}), 4: (1, {'@': 192})}, 143: {0: (1, {'@': 161}), 1: (1, {'@': 161}), 2: (1, {'@': 161}), 3: (1, {'@': 161}), 4: (1, {'@': 161})}, 144: {2: (1, {'@': 212}), 65: (1, {'@': 212}), 3: (1, {'@': 212}), 4: (1, {'@': 212}), 1: (1, {'@': 212})}, 145: {1: (1, {'@': 229}), 2: (1, {'@': 229}), 4: (1, {'@': 229}), 3: (1, {'@': 229})}, 146: {0: (1, {'@': 176}), 1: (1, {'@': 176}), 2: (1, {'@': 176}), 3: (1, {'@': 176}), 4: (1, {'@': 176})}, 147: {2: (1, {'@': 224}), 3: (1, {'@': 224}), 65: (1, {'@': 224}), 4: (1, {'@': 224}), 1: (1, {'@': 224})}, 148: {0: (1, {'@': 184}), 1: (1, {'@': 184}), 2: (1, {'@': 184}), 3: (1, {'@': 184}), 4: (1, {'@': 184})}, 149: {0: (1, {'@': 166}), 1: (1, {'@': 166}), 2: (1, {'@': 166}), 3: (1, {'@': 166}), 4: (1, {'@': 166})}, 150: {0: (1, {'@': 173}), 18: (1, {'@': 173}), 13: (1, {'@': 173}), 24: (1, {'@': 173}), 1: (1, {'@': 173}), 2: (1, {'@': 173}), 3: (1, {'@': 173}), 4: (1, {'@': 173})}, 151: {2: (1, {'@': 213}), 65: (1, {'@': 213}), 3: (1, {'@': 213}), 4: (1, {'@': 213}), 1: (1, {'@': 213})}, 152: {0: (1, {'@': 181}), 1: (1, {'@': 181}), 2: (1, {'@': 181}), 3: (1, {'@': 181}), 4: (1, {'@': 181})}, 153: {5: (1, {'@': 89}), 6: (1, {'@': 89}), 7: (1, {'@': 89}), 8: (1, {'@': 89}), 9: (1, {'@': 89}), 10: (1, {'@': 89}), 11: (1, {'@': 89}), 0: (1, {'@': 89}), 12: (1, {'@': 89}), 13: (1, {'@': 89}), 14: (1, {'@': 89}), 1: (1, {'@': 89}), 15: (1, {'@': 89}), 16: (1, {'@': 89}), 17: (1, {'@': 89}), 18: (1, {'@': 89}), 19: (1, {'@': 89}), 20: (1, {'@': 89}), 21: (1, {'@': 89}), 22: (1, {'@': 89}), 23: (1, {'@': 89}), 24: (1, {'@': 89}), 25: (1, {'@': 89}), 3: (1, {'@': 89}), 4: (1, {'@': 89}), 2: (1, {'@': 89})}, 154: {98: (0, 192), 0: (0, 77), 99: (0, 103), 100: (0, 106), 1: (1, {'@': 237}), 2: (1, {'@': 237}), 4: (1, {'@': 237}), 3: (1, {'@': 237})}, 155: {}, 156: {0: (1, {'@': 185}), 1: (1, {'@': 185}), 2: (1, {'@': 185}), 3: (1, {'@': 185}), 4: (1, {'@': 185})}, 157: {66: (0, 72), 42: (0, 39), 97: (0, 69), 45: (0, 203), 53: (0, 177), 56: (0, 88), 36: (1, {'@': 79}), 37: (1, {'@': 79})}, 158: {0: (1, {'@': 175}), 18: (1, {'@': 175}), 13: (1, {'@': 175}), 24: (1, {'@': 175}), 1: (1, {'@': 175}), 2: (1, {'@': 175}), 3: (1, {'@': 175}), 4: (1, {'@': 175})}, 159: {115: (0, 93), 65: (0, 51), 2: (1, {'@': 228}), 3: (1, {'@': 228}), 4: (1, {'@': 228}), 1: (1, {'@': 228})}, 160: {42: (0, 39), 45: (0, 203), 66: (0, 62), 53: (0, 177), 56: (0, 88), 2: (1, {'@': 207}), 3: (1, {'@': 207}), 65: (1, {'@': 207}), 4: (1, {'@': 207}), 1: (1, {'@': 207})}, 161: {3: (0, 24)}, 162: {57: (0, 134), 63: (0, 98), 59: (0, 105), 62: (0, 119), 61: (0, 1), 50: (0, 190), 38: (0, 11), 47: (0, 153), 55: (0, 90), 60: (0, 189), 52: (0, 195), 43: (0, 171), 93: (0, 61), 90: (0, 41), 39: (0, 4), 46: (0, 112)}, 163: {2: (1, {'@': 249})}, 164: {1: (1, {'@': 245}), 2: (1, {'@': 245}), 4: (1, {'@': 245}), 3: (1, {'@': 245})}, 165: {36: (1, {'@': 85}), 37: (1, {'@': 85})}, 166: {1: (0, 163)}, 167: {2: (1, {'@': 252})}, 168: {17: (1, {'@': 128}), 2: (1, {'@': 128}), 0: (1, {'@': 128}), 21: (1, {'@': 128}), 32: (1, {'@': 128}), 3: (1, {'@': 128}), 95: (1, {'@': 128}), 4: (1, {'@': 128}), 33: (1, {'@': 128}), 22: (1, {'@': 128}), 34: (1, {'@': 128}), 1: (1, {'@': 128})}, 169: {74: (0, 95), 121: (0, 155), 75: (0, 142), 76: (0, 157), 77: (0, 64), 78: (0, 180), 44: (0, 184), 79: (0, 31), 58: (0, 175), 80: (0, 128), 45: (0, 203), 47: (0, 153), 81: (0, 18), 46: (0, 112), 50: (0, 190), 89: (0, 131), 55: (0, 90), 82: (0, 154), 83: (0, 80), 84: (0, 71), 85: (0, 74), 43: (0, 171), 86: (0, 170), 38: (0, 11), 66: (0, 96), 87: (0, 65), 56: (0, 88), 88: (0, 56), 42: (0, 39), 62: (0, 119), 90: (0, 115), 91: (0, 110), 51: (0, 137), 63: (0, 98), 59: (0, 105), 57: (0, 134), 64: (0, 132), 122: (0, 167), 92: (0, 164), 54: (0, 158), 41: (0, 150), 48: (0, 146), 52: (0, 195), 93: (0, 191), 60: (0, 189), 40: (0, 185), 53: (0, 177), 39: (0, 4), 61: (0, 1), 49: (0, 209), 123: (0, 205), 124: (0, 13)}, 170: {112: (0, 35), 18: (0, 196), 111: (0, 43), 24: (0, 198), 13: (0, 102), 0: (1, {'@': 189}), 1: (1, {'@': 189}), 2: (1, {'@': 189}), 3: (1, {'@': 189}), 4: (1, {'@': 189})}, 171: {5: (1, {'@': 96}), 6: (1, {'@': 96}), 7: (1, {'@': 96}), 8: (1, {'@': 96}), 9: (1, {'@': 96}), 10: (1, {'@': 96}), 11: (1, {'@': 96}), 0: (1, {'@': 96}), 12: (1, {'@': 96}), 25: (1, {'@': 96}), 13: (1, {'@': 96}), 14: (1, {'@': 96}), 1: (1, {'@': 96}), 15: (1, {'@': 96}), 16: (1, {'@': 96}), 17: (1, {'@': 96}), 18: (1, {'@': 96}), 19: (1, {'@': 96}), 21: (1, {'@': 96}), 22: (1, {'@': 96}), 31: (1, {'@': 96}), 24: (1, {'@': 96}), 23: (1, {'@': 96}), 3: (1, {'@': 96}), 4: (1, {'@': 96}), 2: (1, {'@': 96})}, 172: {2: (1, {'@': 221}), 65: (1, {'@': 221}), 3: (1, {'@': 221}), 4: (1, {'@': 221}), 1: (1, {'@': 221})}, 173: {26: (0, 87), 27: (0, 141), 0: (1, {'@': 200}), 1: (1, {'@': 200}), 2: (1, {'@': 200}), 3: (1, {'@': 200}), 4: (1, {'@': 200})}, 174: {36: (1, {'@': 78}), 37: (1, {'@': 78})}, 175: {10: (1, {'@': 174}), 6: (1, {'@': 174}), 27: (1, {'@': 174}), 0: (1, {'@': 174}), 1: (1, {'@': 174}), 25: (1, {'@': 174}), 2: (1, {'@': 174}), 3: (1, {'@': 174}), 4: (1, {'@': 174})}, 176: {1: (1, {'@': 240}), 2: (1, {'@': 240}), 4: (1, {'@': 240}), 3: (1, {'@': 240})}, 177: {36: (1, {'@': 73}), 37: (1, {'@': 73}), 57: (1, {'@': 73}), 38: (1, {'@': 73}), 39: (1, {'@': 73}), 59: (1, {'@': 73}), 60: (1, {'@': 73}), 46: (1, {'@': 73}), 43: (1, {'@': 73}), 61: (1, {'@': 73}), 62: (1, {'@': 73}), 50: (1, {'@': 73}), 63: (1, {'@': 73}), 52: (1, {'@': 73}), 55: (1, {'@': 73}), 47: (1, {'@': 73}), 97: (1, {'@': 73}), 2: (1, {'@': 73}), 3: (1, {'@': 73}), 65: (1, {'@': 73}), 4: (1, {'@': 73}), 1: (1, {'@': 73})}, 178: {2: (1, {'@': 218}), 65: (1, {'@': 218}), 3: (1, {'@': 218}), 4: (1, {'@': 218}), 1: (1, {'@': 218})}, 179: {0: (1, {'@': 182}), 1: (1, {'@': 182}), 2: (1, {'@': 182}), 3: (1, {'@': 182}), 4: (1, {'@': 182})}, 180: {18: (0, 196), 24: (0, 198), 13: (0, 102), 112: (0, 156), 111: (0, 148), 0: (1, {'@': 183}), 1: (1, {'@': 183}), 2: (1, {'@': 183}), 3: (1, {'@': 183}), 4: (1, {'@': 183})}, 181: {0: (1, {'@': 168}), 1: (1, {'@': 168}), 2: (1, {'@': 168}), 3: (1, {'@': 168}), 4: (1, {'@': 168})}, 182: {17: (1, {'@': 139}), 2: (1, {'@': 139}), 0: (1, {'@': 139}), 32: (1, {'@': 139}), 21: (1, {'@': 139}), 3: (1, {'@': 139}), 4: (1, {'@': 139}), 33: (1, {'@': 139}), 22: (1, {'@': 139}), 34: (1, {'@': 139}), 1: (1, {'@': 139})}, 183: {36: (1, {'@': 82}), 37: (1, {'@': 82})}, 184: {125: (0, 197), 56: (0, 88), 43: (0, 139), 102: (0, 147), 104: (0, 159), 66: (0, 44), 62: (0, 140), 103: (0, 117), 46: (0, 125), 81: (0, 160), 42: (0, 39), 55: (0, 17), 45: (0, 203), 39: (0, 89), 53: (0, 177), 61: (0, 151), 52: (0, 70), 60: (0, 144), 59: (0, 178), 47: (0, 193), 38: (0, 172), 57: (0, 207), 63: (0, 104), 50: (0, 79), 126: (0, 84)}, 185: {10: (1, {'@': 172}), 6: (1, {'@': 172}), 27: (1, {'@': 172}), 0: (1, {'@': 172}), 1: (1, {'@': 172}), 25: (1, {'@': 172}), 2: (1, {'@': 172}), 3: (1, {'@': 172}), 4: (1, {'@': 172})}, 186: {7: (1, {'@': 117}), 15: (1, {'@': 117}), 9: (1, {'@': 117})}, 187: {68: (0, 204), 17: (0, 57), 21: (0, 111), 70: (0, 23), 71: (0, 19), 69: (0, 114), 72: (0, 15), 22: (0, 5), 2: (1, {'@': 147}), 0: (1, {'@': 147}), 32: (1, {'@': 147}), 3: (1, {'@': 147}), 33: (1, {'@': 147}), 4: (1, {'@': 147}), 1: (1, {'@': 147})}, 188: {6: (1, {'@': 106}), 0: (1, {'@': 106}), 13: (1, {'@': 106}), 14: (1, {'@': 106}), 1: (1, {'@': 106}), 15: (1, {'@': 106}), 16: (1, {'@': 106}), 17: (1, {'@': 106}), 18: (1, {'@': 106}), 22: (1, {'@': 106}), 23: (1, {'@': 106}), 25: (1, {'@': 106}), 5: (1, {'@': 106}), 7: (1, {'@': 106}), 8: (1, {'@': 106}), 9: (1, {'@': 106}), 10: (1, {'@': 106}), 11: (1, {'@': 106}), 12: (1, {'@': 106}), 19: (1, {'@': 106}), 21: (1, {'@': 106}), 24: (1, {'@': 106}), 2: (1, {'@': 106}), 3: (1, {'@': 106}), 4: (1, {'@': 106})}, 189: {5: (1, {'@': 92}), 6: (1, {'@': 92}), 7: (1, {'@': 92}), 8: (1, {'@': 92}), 9: (1, {'@': 92}), 10: (1, {'@': 92}), 11: (1, {'@': 92}), 0: (1, {'@': 92}), 12: (1, {'@': 92}), 13: (1, {'@': 92}), 14: (1, {'@': 92}), 1: (1, {'@': 92}), 15: (1, {'@': 92}), 16: (1, {'@': 92}), 17: (1, {'@': 92}), 18: (1, {'@': 92}), 19: (1, {'@': 92}), 20: (1, {'@': 92}), 21: (1, {'@': 92}), 22: (1, {'@': 92}), 23: (1, {'@': 92}), 24: (1, {'@': 92}), 25: (1, {'@': 92}), 3: (1, {'@': 92}), 4: (1, {'@': 92}), 2: (1, {'@': 92})}, 190: {5: (1, {'@': 95}), 6: (1, {'@': 95}), 7: (1, {'@': 95}), 8: (1, {'@': 95}), 9: (1, {'@': 95}), 10: (1, {'@': 95}), 11: (1, {'@': 95}), 0: (1, {'@': 95}), 12: (1, {'@': 95}), 13: (1, {'@': 95}), 14: (1, {'@': 95}), 1: (1, {'@': 95}), 15: (1, {'@': 95}), 16: (1, {'@': 95}), 17: (1, {'@': 95}), 18: (1, {'@': 95}), 19: (1, {'@': 95}), 20: (1, {'@': 95}), 21: (1, {'@': 95}), 22: (1, {'@': 95}), 23: (1, {'@': 95}), 24: (1, {'@': 95}), 25: (1, {'@': 95}), 3: (1, {'@': 95}), 4: (1, {'@': 95}), 2: (1, {'@': 95})}, 191: {31: (0, 29), 6: (1, {'@': 107}), 0: (1, {'@': 107}), 13: (1, {'@': 107}), 14: (1, {'@': 107}), 1: (1, {'@': 107}), 15: (1, {'@': 107}), 16: (1, {'@': 107}), 17: (1, {'@': 107}), 18: (1, {'@': 107}), 22: (1, {'@': 107}), 23: (1, {'@': 107}), 25: (1, {'@': 107}), 5: (1, {'@': 107}), 7: (1, {'@': 107}), 8: (1, {'@': 107}), 9: (1, {'@': 107}), 10: (1, {'@': 107}), 11: (1, {'@': 107}), 12: (1, {'@': 107}), 19: (1, {'@': 107}), 21: (1, {'@': 107}), 24: (1, {'@': 107}), 2: (1, {'@': 107}), 3: (1, {'@': 107}), 4: (1, {'@': 107})}, 192: {0: (0, 77), 100: (0, 9), 3: (1, {'@': 236}), 2: (1, {'@': 236}), 4: (1, {'@': 236}), 1: (1, {'@': 236})}, 193: {2: (1, {'@': 209}), 65: (1, {'@': 209}), 3: (1, {'@': 209}), 4: (1, {'@': 209}), 1: (1, {'@': 209})}, 194: {2: (1, {'@': 225}), 3: (1, {'@': 225}), 65: (1, {'@': 225}), 4: (1, {'@': 225}), 1: (1, {'@': 225})}, 195: {5: (1, {'@': 94}), 6: (1, {'@': 94}), 7: (1, {'@': 94}), 8: (1, {'@': 94}), 9: (1, {'@': 94}), 10: (1, {'@': 94}), 11: (1, {'@': 94}), 0: (1, {'@': 94}), 12: (1, {'@': 94}), 13: (1, {'@': 94}), 14: (1, {'@': 94}), 1: (1, {'@': 94}), 15: (1, {'@': 94}), 16: (1, {'@': 94}), 17: (1, {'@': 94}), 18: (1, {'@': 94}), 19: (1, {'@': 94}), 20: (1, {'@': 94}), 21: (1, {'@': 94}), 22: (1, {'@': 94}), 23: (1, {'@': 94}), 24: (1, {'@': 94}), 25: (1, {'@': 94}), 3: (1, {'@': 94}), 4: (1, {'@': 94}), 2: (1, {'@': 94})}, 196: {17: (1, {'@': 130}), 2: (1, {'@': 130}), 0: (1, {'@': 130}), 21: (1, {'@': 130}), 3: (1, {'@': 130}), 4: (1, {'@': 130}), 22: (1, {'@': 130}), 1: (1, {'@': 130})}, 197: {42: (0, 39), 45: (0, 203), 53: (0, 177), 66: (0, 83), 56: (0, 88), 2: (1, {'@': 205}), 3: (1, {'@': 205}), 65: (1, {'@': 205}), 4: (1, {'@': 205}), 1: (1, {'@': 205})}, 198: {17: (1, {'@': 135}), 2: (1, {'@': 135}), 0: (1, {'@': 135}), 21: (1, {'@': 135}), 3: (1, {'@': 135}), 4: (1, {'@': 135}), 22: (1, {'@': 135}), 1: (1, {'@': 135})}, 199: {0: (1, {'@': 204}), 1: (1, {'@': 204}), 2: (1, {'@': 204}), 3: (1, {'@': 204}), 4: (1, {'@': 204})}, 200: {36: (1, {'@': 83}), 37: (1, {'@': 83})}, 201: {2: (1, {'@': 226}), 3: (1, {'@': 226}), 65: (1, {'@': 226}), 4: (1, {'@': 226}), 1: (1, {'@': 226})}, 202: {2: (1, {'@': 140}), 0: (1, {'@': 140}), 32: (1, {'@': 140}), 3: (1, {'@': 140}), 33: (1, {'@': 140}), 4: (1, {'@': 140}), 1: (1, {'@': 140}), 34: (1, {'@': 140})}, 203: {36: (1, {'@': 72}), 37: (1, {'@': 72}), 57: (1, {'@': 72}), 38: (1, {'@': 72}), 39: (1, {'@': 72}), 59: (1, {'@': 72}), 60: (1, {'@': 72}), 46: (1, {'@': 72}), 43: (1, {'@': 72}), 61: (1, {'@': 72}), 62: (1, {'@': 72}), 50: (1, {'@': 72}), 63: (1, {'@': 72}), 52: (1, {'@': 72}), 55: (1, {'@': 72}), 47: (1, {'@': 72}), 97: (1, {'@': 72}), 2: (1, {'@': 72}), 3: (1, {'@': 72}), 65: (1, {'@': 72}), 4: (1, {'@': 72}), 1: (1, {'@': 72})}, 204: {32: (0, 135), 2: (1, {'@': 152}), 0: (1, {'@': 152}), 3: (1, {'@': 152}), 4: (1, {'@': 152}), 1: (1, {'@': 152}), 34: (1, {'@': 152})}, 205: {74: (0, 95), 75: (0, 142), 76: (0, 157), 77: (0, 64), 78: (0, 180), 44: (0, 184), 79: (0, 31), 58: (0, 175), 80: (0, 128), 45: (0, 203), 47: (0, 153), 81: (0, 18), 46: (0, 112), 50: (0, 190), 55: (0, 90), 82: (0, 154), 83: (0, 80), 84: (0, 71), 85: (0, 74), 43: (0, 171), 89: (0, 161), 86: (0, 170), 38: (0, 11), 66: (0, 96), 87: (0, 65), 56: (0, 88), 88: (0, 56), 42: (0, 39), 62: (0, 119), 90: (0, 115), 91: (0, 110), 51: (0, 137), 63: (0, 98), 59: (0, 105), 57: (0, 134), 64: (0, 132), 92: (0, 164), 54: (0, 158), 41: (0, 150), 48: (0, 146), 52: (0, 195), 93: (0, 191), 60: (0, 189), 40: (0, 185), 53: (0, 177), 39: (0, 4), 61: (0, 1), 49: (0, 209)}, 206: {7: (1, {'@': 116}), 15: (1, {'@': 116}), 9: (1, {'@': 116})}, 207: {2: (1, {'@': 219}), 65: (1, {'@': 219}), 3: (1, {'@': 219}), 4: (1, {'@': 219}), 1: (1, {'@': 219})}, 208: {22: (0, 202), 2: (1, {'@': 141}), 0: (1, {'@': 141}), 32: (1, {'@': 141}), 3: (1, {'@': 141}), 33: (1, {'@': 141}), 4: (1, {'@': 141}), 1: (1, {'@': 141}), 34: (1, {'@': 141})}, 209: {6: (1, {'@': 177}), 7: (1, {'@': 177}), 1: (1, {'@': 177}), 10: (1, {'@': 177}), 27: (1, {'@': 177}), 0: (1, {'@': 177}), 25: (1, {'@': 177}), 2: (1, {'@': 177}), 3: (1, {'@': 177}), 4: (1, {'@': 177})}}, 'start_states': {'start': 169}, 'end_states': {'start': 155}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}, {'@': 246}, {'@': 247}, {'@': 248}, {'@': 249}, {'@': 250}, {'@': 251}, {'@': 252}, {'@': 253}, {'@': 254}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': False, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+)
+MEMO = (
+{0: {'name': 'FLAT', 'pattern': {'value': '(?:\\-|b)', 'flags': [], 'raw': None, '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'DOUBLE_FLAT', 'pattern': {'value': '(?:\\-\\-|bb)', 'flags': [], 'raw': None, '_width': [2, 2], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'SHARP', 'pattern': {'value': '#', 'flags': [], 'raw': '"#"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'DOUBLE_SHARP', 'pattern': {'value': '(?:\\#\\#|x)', 'flags': [], 'raw': None, '_width': [1, 2], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': 'NOTE_LETTER_UPPERCASE', 'pattern': {'value': '[A-G]', 'flags': [], 'raw': None, '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'KEY_LETTER_LOWERCASE', 'pattern': {'value': '[a-g](?=(?:--?|bb?|##?|x)?(?:_(?:nat|har|mel))?(?:=>)?:)', 'flags': [], 'raw': '/[a-g](?=(?:--?|bb?|##?|x)?(?:_(?:nat|har|mel))?(?:=>)?:)/', '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 6: {'name': 'PITCH_CLASS_LETTER_LOWERCASE', 'pattern': {'value': '[a-g](?!(?:--?|bb?|##?|x)?[IViv])', 'flags': [], 'raw': '/[a-g](?!(?:--?|bb?|##?|x)?[IViv])/', '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 7: {'name': '_MINOR_NATURAL', 'pattern': {'value': 'nat', 'flags': [], 'raw': '"nat"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 8: {'name': '_MINOR_HARMONIC', 'pattern': {'value': 'har', 'flags': [], 'raw': '"har"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': '_MINOR_MELODIC', 'pattern': {'value': 'mel', 'flags': [], 'raw': '"mel"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'KEY_AS_REFERENCE', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'KEY_AS_ESTABLISHED', 'pattern': {'value': '=>:', 'flags': [], 'raw': '"=>:"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'TONIC_UPPERCASE', 'pattern': {'value': 'I', 'flags': [], 'raw': '"I"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'SUPERTONIC_UPPERCASE', 'pattern': {'value': 'II', 'flags': [], 'raw': '"II"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'MEDIANT_UPPERCASE', 'pattern': {'value': 'III', 'flags': [], 'raw': '"III"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'SUBDOMINANT_UPPERCASE', 'pattern': {'value': 'IV', 'flags': [], 'raw': '"IV"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'DOMINANT_UPPERCASE', 'pattern': {'value': 'V', 'flags': [], 'raw': '"V"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'SUBMEDIANT_UPPERCASE', 'pattern': {'value': 'VI', 'flags': [], 'raw': '"VI"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'SEVENTH_DEGREE_UPPERCASE', 'pattern': {'value': 'VII', 'flags': [], 'raw': '"VII"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'TONIC_LOWERCASE', 'pattern': {'value': 'i', 'flags': [], 'raw': '"i"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'SUPERTONIC_LOWERCASE', 'pattern': {'value': 'ii', 'flags': [], 'raw': '"ii"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'MEDIANT_LOWERCASE', 'pattern': {'value': 'iii', 'flags': [], 'raw': '"iii"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'SUBDOMINANT_LOWERCASE', 'pattern': {'value': 'iv', 'flags': [], 'raw': '"iv"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'DOMINANT_LOWERCASE', 'pattern': {'value': 'v', 'flags': [], 'raw': '"v"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'SUBMEDIANT_LOWERCASE', 'pattern': {'value': 'vi', 'flags': [], 'raw': '"vi"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'SEVENTH_DEGREE_LOWERCASE', 'pattern': {'value': 'vii', 'flags': [], 'raw': '"vii"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'AUGMENTED_FIFTH', 'pattern': {'value': '+', 'flags': [], 'raw': '"+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'DIMINISHED_FIFTH', 'pattern': {'value': 'o', 'flags': [], 'raw': '"o"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': 'INTERVAL_SEVENTH', 'pattern': {'value': '7', 'flags': [], 'raw': '"7"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'INTERVAL_NINTH', 'pattern': {'value': '9', 'flags': [], 'raw': '"9"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'INTERVAL_ELEVENTH', 'pattern': {'value': '11', 'flags': [], 'raw': '"11"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'INTERVAL_THIRTEENTH', 'pattern': {'value': '13', 'flags': [], 'raw': '"13"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'MAJOR_INTERVAL', 'pattern': {'value': 'M', 'flags': [], 'raw': '"M"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'MINOR_INTERVAL', 'pattern': {'value': 'm', 'flags': [], 'raw': '"m"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'PERFECT_INTERVAL', 'pattern': {'value': 'P', 'flags': [], 'raw': '"P"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'AUGMENTED_INTERVAL', 'pattern': {'value': 'A', 'flags': [], 'raw': '"A"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'DIMINISHED_INTERVAL', 'pattern': {'value': 'D', 'flags': [], 'raw': '"D"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'DOUBLE_AUGMENTED_INTERVAL', 'pattern': {'value': 'AA', 'flags': [], 'raw': '"AA"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'DOUBLE_DIMINISHED_INTERVAL', 'pattern': {'value': 'DD', 'flags': [], 'raw': '"DD"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': 'TRIAD_FIRST_INVERSION_NUMERIC', 'pattern': {'value': '6', 'flags': [], 'raw': '"6"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': 'TRIAD_SECOND_INVERSION_NUMERIC', 'pattern': {'value': '64', 'flags': [], 'raw': '"64"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': 'SEVENTHCHORD_FIRST_INVERSION_NUMERIC', 'pattern': {'value': '65', 'flags': [], 'raw': '"65"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': 'SEVENTHCHORD_SECOND_INVERSION_NUMERIC', 'pattern': {'value': '43', 'flags': [], 'raw': '"43"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': 'SEVENTHCHORD_THIRD_INVERSION_NUMERIC', 'pattern': {'value': '(?:42|2)', 'flags': [], 'raw': None, '_width': [1, 2], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': 'TRIAD_INVERSION_LETTER', 'pattern': {'value': '[a-c]', 'flags': [], 'raw': None, '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'SEVENTHCHORD_INVERSION_LETTER', 'pattern': {'value': '[a-d]', 'flags': [], 'raw': None, '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': 'NINTHCHORD_INVERSION_LETTER', 'pattern': {'value': '[a-e]', 'flags': [], 'raw': None, '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'ELEVENTHCHORD_INVERSION_LETTER', 'pattern': {'value': '[a-f]', 'flags': [], 'raw': None, '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': 'THIRTEENTHCHORD_INVERSION_LETTER', 'pattern': {'value': '[a-g]', 'flags': [], 'raw': None, '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': 'MISSING_ROOT', 'pattern': {'value': 'x1', 'flags': [], 'raw': '"x1"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'MISSING_THIRD', 'pattern': {'value': 'x3', 'flags': [], 'raw': '"x3"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'name': 'MISSING_FIFTH', 'pattern': {'value': 'x5', 'flags': [], 'raw': '"x5"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 52: {'name': 'MISSING_SEVENTH', 'pattern': {'value': 'x7', 'flags': [], 'raw': '"x7"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 53: {'name': 'MISSING_NINTH', 'pattern': {'value': 'x9', 'flags': [], 'raw': '"x9"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 54: {'name': 'MISSING_ELEVENTH', 'pattern': {'value': 'x11', 'flags': [], 'raw': '"x11"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 55: {'name': 'GERMAN', 'pattern': {'value': '(?:Ger|Gn)', 'flags': [], 'raw': None, '_width': [2, 3], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 56: {'name': 'ITALIAN', 'pattern': {'value': '(?:Lt|It)', 'flags': [], 'raw': None, '_width': [2, 2], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 57: {'name': 'FRENCH', 'pattern': {'value': 'Fr', 'flags': [], 'raw': '"Fr"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 58: {'name': 'NEAPOLITAN', 'pattern': {'value': 'N', 'flags': [], 'raw': '"N"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 59: {'name': 'TRISTAN', 'pattern': {'value': 'Tr', 'flags': [], 'raw': '"Tr"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 60: {'name': 'HALF_DIMINISHED_SEVENTH', 'pattern': {'value': 'vii0', 'flags': [], 'raw': '"vii0"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 61: {'name': 'CADENTIAL_SIX_FOUR', 'pattern': {'value': 'Cad', 'flags': [], 'raw': '"Cad"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 62: {'name': 'COMMON_TONE_DIMINISHED', 'pattern': {'value': 'CTo', 'flags': [], 'raw': '"CTo"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 63: {'name': 'DESCRIPTIVE_INTERVALS', 'pattern': {'value': '(?:(?:AA|DD|P|A|D)1(?!\\d)(?:(?:AA|DD|M|m|A|D)2)?(?:(?:AA|DD|M|m|A|D)3)?(?:(?:AA|DD|P|A|D)4)?(?:(?:AA|DD|P|A|D)5)?(?:(?:AA|DD|M|m|A|D)6)?(?:(?:AA|DD|M|m|A|D)7)?(?:(?:AA|DD|P|A|D)8)?(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)2(?:(?:AA|DD|M|m|A|D)3)?(?:(?:AA|DD|P|A|D)4)?(?:(?:AA|DD|P|A|D)5)?(?:(?:AA|DD|M|m|A|D)6)?(?:(?:AA|DD|M|m|A|D)7)?(?:(?:AA|DD|P|A|D)8)?(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)3(?:(?:AA|DD|P|A|D)4)?(?:(?:AA|DD|P|A|D)5)?(?:(?:AA|DD|M|m|A|D)6)?(?:(?:AA|DD|M|m|A|D)7)?(?:(?:AA|DD|P|A|D)8)?(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|P|A|D)4(?:(?:AA|DD|P|A|D)5)?(?:(?:AA|DD|M|m|A|D)6)?(?:(?:AA|DD|M|m|A|D)7)?(?:(?:AA|DD|P|A|D)8)?(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|P|A|D)5(?:(?:AA|DD|M|m|A|D)6)?(?:(?:AA|DD|M|m|A|D)7)?(?:(?:AA|DD|P|A|D)8)?(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)6(?:(?:AA|DD|M|m|A|D)7)?(?:(?:AA|DD|P|A|D)8)?(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)7(?:(?:AA|DD|P|A|D)8)?(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|P|A|D)8(?:(?:AA|DD|M|m|A|D)9)?(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)9(?:(?:AA|DD|M|m|A|D)10)?(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)10(?:(?:AA|DD|P|A|D)11)?(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|P|A|D)11(?:(?:AA|DD|P|A|D)12)?(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|P|A|D)12(?:(?:AA|DD|M|m|A|D)13)?(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)13(?:(?:AA|DD|M|m|A|D)14)?(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|M|m|A|D)14(?:(?:AA|DD|P|A|D)15)?|(?:AA|DD|P|A|D)15)', 'flags': [], 'raw': None, '_width': [2, 51], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 64: {'name': 'UNDERSCORE', 'pattern': {'value': '_', 'flags': [], 'raw': '"_"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 65: {'name': 'QMARK', 'pattern': {'value': '?', 'flags': [], 'raw': '"?"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 66: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], 'raw': '"/"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 67: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 68: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 69: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 70: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 71: {'origin': {'name': Token('RULE', '_alteration'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FLAT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': Token('RULE', '_alteration'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOUBLE_FLAT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': Token('RULE', '_alteration'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SHARP', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': Token('RULE', '_alteration'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOUBLE_SHARP', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': Token('RULE', 'key_as_reference'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_AS_REFERENCE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': Token('RULE', 'key_as_established'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_AS_ESTABLISHED', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOTE_LETTER_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'major_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOTE_LETTER_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'major_key_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'default_minor_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'default_minor_key_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_MINOR_NATURAL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'natural_minor_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}, {'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_MINOR_NATURAL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'natural_minor_key_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_MINOR_HARMONIC', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': 'harmonic_minor_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}, {'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_MINOR_HARMONIC', 'filter_out': True, '__type__': 'Terminal'}], 'order': 7, 'alias': 'harmonic_minor_key_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_MINOR_MELODIC', 'filter_out': True, '__type__': 'Terminal'}], 'order': 8, 'alias': 'melodic_minor_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': Token('RULE', 'key_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'KEY_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}, {'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_MINOR_MELODIC', 'filter_out': True, '__type__': 'Terminal'}], 'order': 9, 'alias': 'melodic_minor_key_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': Token('RULE', 'key'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key_definition', '__type__': 'NonTerminal'}, {'name': 'key_as_reference', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': Token('RULE', 'key'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key_definition', '__type__': 'NonTerminal'}, {'name': 'key_as_established', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': Token('RULE', '_scale_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TONIC_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': Token('RULE', '_scale_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUPERTONIC_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': Token('RULE', '_scale_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MEDIANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': Token('RULE', '_scale_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBDOMINANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': Token('RULE', '_scale_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOMINANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': Token('RULE', '_scale_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBMEDIANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': Token('RULE', '_scale_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTH_DEGREE_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': Token('RULE', '_scale_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TONIC_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': Token('RULE', '_scale_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUPERTONIC_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': Token('RULE', '_scale_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MEDIANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': Token('RULE', '_scale_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBDOMINANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': Token('RULE', '_scale_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOMINANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': Token('RULE', '_scale_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBMEDIANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': Token('RULE', '_scale_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTH_DEGREE_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_scale_degree_major', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'major_triad', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_scale_degree_major', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'major_triad_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_scale_degree_major', '__type__': 'NonTerminal'}, {'name': 'AUGMENTED_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'augmented_triad', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_scale_degree_major', '__type__': 'NonTerminal'}, {'name': 'AUGMENTED_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'augmented_triad_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_scale_degree_minor', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'minor_triad', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_scale_degree_minor', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'minor_triad_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_scale_degree_minor', '__type__': 'NonTerminal'}, {'name': 'DIMINISHED_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': 'diminished_triad', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': Token('RULE', 'triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_scale_degree_minor', '__type__': 'NonTerminal'}, {'name': 'DIMINISHED_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 7, 'alias': 'diminished_triad_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': Token('RULE', '_perfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PERFECT_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': Token('RULE', '_perfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AUGMENTED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': Token('RULE', '_perfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DIMINISHED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': Token('RULE', '_perfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOUBLE_AUGMENTED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': Token('RULE', '_perfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOUBLE_DIMINISHED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': Token('RULE', '_nonperfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MAJOR_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': Token('RULE', '_nonperfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINOR_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': Token('RULE', '_nonperfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AUGMENTED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': Token('RULE', '_nonperfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DIMINISHED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': Token('RULE', '_nonperfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOUBLE_AUGMENTED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': Token('RULE', '_nonperfect_interval_quality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOUBLE_DIMINISHED_INTERVAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': Token('RULE', 'added_seventh'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INTERVAL_SEVENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'added_seventh_diatonic', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': Token('RULE', 'added_seventh'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_nonperfect_interval_quality', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_SEVENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'added_seventh_with_quality', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': Token('RULE', 'added_ninth'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INTERVAL_NINTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'added_ninth_diatonic', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': Token('RULE', 'added_ninth'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_nonperfect_interval_quality', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_NINTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'added_ninth_with_quality', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': Token('RULE', 'added_eleventh'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INTERVAL_ELEVENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'added_eleventh_diatonic', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': Token('RULE', 'added_eleventh'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_perfect_interval_quality', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_ELEVENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'added_eleventh_with_quality', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': Token('RULE', 'added_thirteenth'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INTERVAL_THIRTEENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'added_thirteenth_diatonic', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': Token('RULE', 'added_thirteenth'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_nonperfect_interval_quality', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_THIRTEENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'added_thirteenth_with_quality', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': Token('RULE', 'triad_inversion_by_number'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRIAD_FIRST_INVERSION_NUMERIC', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': Token('RULE', 'triad_inversion_by_number'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRIAD_SECOND_INVERSION_NUMERIC', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': Token('RULE', 'seventhchord_inversion_by_number'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTHCHORD_FIRST_INVERSION_NUMERIC', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': Token('RULE', 'seventhchord_inversion_by_number'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTHCHORD_SECOND_INVERSION_NUMERIC', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': Token('RULE', 'seventhchord_inversion_by_number'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTHCHORD_THIRD_INVERSION_NUMERIC', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': Token('RULE', 'triad_inversion_by_letter'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRIAD_INVERSION_LETTER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': Token('RULE', 'seventhchord_inversion_by_letter'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTHCHORD_INVERSION_LETTER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': Token('RULE', 'ninthchord_inversion_by_letter'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NINTHCHORD_INVERSION_LETTER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': Token('RULE', 'eleventhchord_inversion_by_letter'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELEVENTHCHORD_INVERSION_LETTER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': Token('RULE', 'thirteenthchord_inversion_by_letter'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'THIRTEENTHCHORD_INVERSION_LETTER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MISSING_ROOT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MISSING_THIRD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MISSING_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MISSING_ROOT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MISSING_THIRD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MISSING_ROOT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MISSING_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MISSING_ROOT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MISSING_THIRD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MISSING_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MISSING_THIRD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MISSING_FIFTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': Token('RULE', '_missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': Token('RULE', '_missing_intervals_seventhchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_triad', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': Token('RULE', '_missing_intervals_ninthchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_seventhchord', '__type__': 'NonTerminal'}, {'name': 'MISSING_SEVENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': Token('RULE', '_missing_intervals_ninthchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_seventhchord', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': Token('RULE', '_missing_intervals_eleventhchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_ninthchord', '__type__': 'NonTerminal'}, {'name': 'MISSING_NINTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': Token('RULE', '_missing_intervals_eleventhchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_ninthchord', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': Token('RULE', '_missing_intervals_thirteenthchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_eleventhchord', '__type__': 'NonTerminal'}, {'name': 'MISSING_ELEVENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': Token('RULE', '_missing_intervals_thirteenthchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_eleventhchord', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': Token('RULE', 'missing_intervals_triad'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_triad', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': Token('RULE', 'missing_intervals_seventhchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_seventhchord', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': Token('RULE', 'missing_intervals_ninthchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_ninthchord', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': Token('RULE', 'missing_intervals_eleventhchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_eleventhchord', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': Token('RULE', 'missing_intervals_thirteenthchord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_missing_intervals_thirteenthchord', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_triad', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'tertian_triad', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'triad_inversion_by_number', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_triad', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'tertian_triad_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_number', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_seventhchord', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'tertian_seventh_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'triad_inversion_by_letter', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_triad', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'tertian_triad_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_seventh', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_seventhchord', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'tertian_seventh', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_seventh', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_letter', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_seventhchord', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'tertian_seventh_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_ninth', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_ninthchord', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'tertian_ninth', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_ninth', '__type__': 'NonTerminal'}, {'name': 'ninthchord_inversion_by_letter', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_ninthchord', '__type__': 'NonTerminal'}], 'order': 7, 'alias': 'tertian_ninth_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_eleventh', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_eleventhchord', '__type__': 'NonTerminal'}], 'order': 8, 'alias': 'tertian_eleventh', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_eleventh', '__type__': 'NonTerminal'}, {'name': 'eleventhchord_inversion_by_letter', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_eleventhchord', '__type__': 'NonTerminal'}], 'order': 9, 'alias': 'tertian_eleventh_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_thirteenth', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_thirteenthchord', '__type__': 'NonTerminal'}], 'order': 10, 'alias': 'tertian_thirteenth', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': Token('RULE', 'tertian_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'triad', '__type__': 'NonTerminal'}, {'name': 'added_thirteenth', '__type__': 'NonTerminal'}, {'name': 'thirteenthchord_inversion_by_letter', '__type__': 'NonTerminal'}, {'name': 'missing_intervals_thirteenthchord', '__type__': 'NonTerminal'}], 'order': 11, 'alias': 'tertian_thirteenth_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': Token('RULE', 'german'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'GERMAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': Token('RULE', 'italian'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ITALIAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': Token('RULE', 'french'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FRENCH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': Token('RULE', 'neapolitan'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NEAPOLITAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': Token('RULE', 'tristan'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRISTAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': Token('RULE', 'half_diminished_seventh'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HALF_DIMINISHED_SEVENTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': Token('RULE', 'cadential_six_four'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CADENTIAL_SIX_FOUR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': Token('RULE', 'common_tone_diminished'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMON_TONE_DIMINISHED', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'special_chord_name', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'german', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'special_german', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'german', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'special_german_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'german', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_number', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'special_german_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italian', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'special_italian', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italian', '__type__': 'NonTerminal'}, {'name': 'triad_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'special_italian_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italian', '__type__': 'NonTerminal'}, {'name': 'triad_inversion_by_number', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'special_italian_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'french', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'special_french', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'french', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 7, 'alias': 'special_french_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'french', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_number', '__type__': 'NonTerminal'}], 'order': 8, 'alias': 'special_french_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'neapolitan', '__type__': 'NonTerminal'}], 'order': 9, 'alias': 'special_neapolitan', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'neapolitan', '__type__': 'NonTerminal'}, {'name': 'triad_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 10, 'alias': 'special_neapolitan_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'neapolitan', '__type__': 'NonTerminal'}, {'name': 'triad_inversion_by_number', '__type__': 'NonTerminal'}], 'order': 11, 'alias': 'special_neapolitan_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tristan', '__type__': 'NonTerminal'}], 'order': 12, 'alias': 'special_tristan', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'half_diminished_seventh', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_SEVENTH', 'filter_out': True, '__type__': 'Terminal'}], 'order': 13, 'alias': 'special_halfdiminished', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'half_diminished_seventh', '__type__': 'NonTerminal'}], 'order': 14, 'alias': 'special_halfdiminished', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'half_diminished_seventh', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_SEVENTH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'seventhchord_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 15, 'alias': 'special_halfdiminished_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'half_diminished_seventh', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 16, 'alias': 'special_halfdiminished_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'half_diminished_seventh', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_number', '__type__': 'NonTerminal'}], 'order': 17, 'alias': 'special_halfdiminished_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'cadential_six_four', '__type__': 'NonTerminal'}, {'name': 'TRIAD_SECOND_INVERSION_NUMERIC', 'filter_out': True, '__type__': 'Terminal'}], 'order': 18, 'alias': 'special_cadential', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'cadential_six_four', '__type__': 'NonTerminal'}], 'order': 19, 'alias': 'special_cadential', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'common_tone_diminished', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_SEVENTH', 'filter_out': True, '__type__': 'Terminal'}], 'order': 20, 'alias': 'special_commontone', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'common_tone_diminished', '__type__': 'NonTerminal'}], 'order': 21, 'alias': 'special_commontone', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'common_tone_diminished', '__type__': 'NonTerminal'}, {'name': 'INTERVAL_SEVENTH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'seventhchord_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 22, 'alias': 'special_commontone_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'common_tone_diminished', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_letter', '__type__': 'NonTerminal'}], 'order': 23, 'alias': 'special_commontone_with_inversion_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': Token('RULE', 'special_chord'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'common_tone_diminished', '__type__': 'NonTerminal'}, {'name': 'seventhchord_inversion_by_number', '__type__': 'NonTerminal'}], 'order': 24, 'alias': 'special_commontone_with_inversion_by_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 205: {'origin': {'name': Token('RULE', 'pitch_class_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PITCH_CLASS_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'pitch_class', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 206: {'origin': {'name': Token('RULE', 'pitch_class_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PITCH_CLASS_LETTER_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'pitch_class_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 207: {'origin': {'name': Token('RULE', 'pitch_class_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOTE_LETTER_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'pitch_class', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 208: {'origin': {'name': Token('RULE', 'pitch_class_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOTE_LETTER_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'pitch_class_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 209: {'origin': {'name': Token('RULE', '_descriptive_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TONIC_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 210: {'origin': {'name': Token('RULE', '_descriptive_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUPERTONIC_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 211: {'origin': {'name': Token('RULE', '_descriptive_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MEDIANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 212: {'origin': {'name': Token('RULE', '_descriptive_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBDOMINANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 213: {'origin': {'name': Token('RULE', '_descriptive_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOMINANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 214: {'origin': {'name': Token('RULE', '_descriptive_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBMEDIANT_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 215: {'origin': {'name': Token('RULE', '_descriptive_degree_major'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTH_DEGREE_UPPERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 216: {'origin': {'name': Token('RULE', '_descriptive_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TONIC_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 217: {'origin': {'name': Token('RULE', '_descriptive_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUPERTONIC_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 218: {'origin': {'name': Token('RULE', '_descriptive_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MEDIANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 219: {'origin': {'name': Token('RULE', '_descriptive_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBDOMINANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 220: {'origin': {'name': Token('RULE', '_descriptive_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOMINANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 221: {'origin': {'name': Token('RULE', '_descriptive_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUBMEDIANT_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 222: {'origin': {'name': Token('RULE', '_descriptive_degree_minor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEVENTH_DEGREE_LOWERCASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 223: {'origin': {'name': Token('RULE', 'scale_degree_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_descriptive_degree_major', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'scale_degree', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 224: {'origin': {'name': Token('RULE', 'scale_degree_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_descriptive_degree_minor', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'scale_degree', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 225: {'origin': {'name': Token('RULE', 'scale_degree_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_descriptive_degree_major', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'scale_degree_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 226: {'origin': {'name': Token('RULE', 'scale_degree_root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_descriptive_degree_minor', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'scale_degree_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 227: {'origin': {'name': Token('RULE', 'descriptive_intervals'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DESCRIPTIVE_INTERVALS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 228: {'origin': {'name': Token('RULE', 'descriptive_intervals'), '__type__': 'NonTerminal'}, 'expansion': [], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True,), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 229: {'origin': {'name': Token('RULE', 'descriptive_chord_by_letter'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QMARK', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'pitch_class_root', '__type__': 'NonTerminal'}, {'name': 'descriptive_intervals', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 230: {'origin': {'name': Token('RULE', 'descriptive_chord_by_degree'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QMARK', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'scale_degree_root', '__type__': 'NonTerminal'}, {'name': 'descriptive_intervals', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 231: {'origin': {'name': Token('RULE', 'by_scale_degree'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_scale_degree_major', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'by_scale_degree_major', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 232: {'origin': {'name': Token('RULE', 'by_scale_degree'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_scale_degree_major', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'by_scale_degree_major_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 233: {'origin': {'name': Token('RULE', 'by_scale_degree'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_scale_degree_minor', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'by_scale_degree_minor', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 234: {'origin': {'name': Token('RULE', 'by_scale_degree'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_alteration', '__type__': 'NonTerminal'}, {'name': '_scale_degree_minor', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'by_scale_degree_minor_with_alteration', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 235: {'origin': {'name': Token('RULE', 'by_scale_degree'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NEAPOLITAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'by_scale_degree_neapolitan', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 236: {'origin': {'name': Token('RULE', 'tonicization'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__tonicization_plus_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 237: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tertian_chord', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'harmalysis_tertian', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 238: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key', '__type__': 'NonTerminal'}, {'name': 'tertian_chord', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'harmalysis_tertian_with_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 239: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tertian_chord', '__type__': 'NonTerminal'}, {'name': 'tonicization', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'harmalysis_tertian_with_tonicization', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 240: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key', '__type__': 'NonTerminal'}, {'name': 'tertian_chord', '__type__': 'NonTerminal'}, {'name': 'tonicization', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'harmalysis_tertian_with_key_and_tonicization', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 241: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'special_chord', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'harmalysis_special', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 242: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key', '__type__': 'NonTerminal'}, {'name': 'special_chord', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'harmalysis_special_with_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 243: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'special_chord', '__type__': 'NonTerminal'}, {'name': 'tonicization', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'harmalysis_special_with_tonicization', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 244: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key', '__type__': 'NonTerminal'}, {'name': 'special_chord', '__type__': 'NonTerminal'}, {'name': 'tonicization', '__type__': 'NonTerminal'}], 'order': 7, 'alias': 'harmalysis_special_with_key_and_tonicization', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 245: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'descriptive_chord_by_degree', '__type__': 'NonTerminal'}], 'order': 8, 'alias': 'harmalysis_descriptive_by_degree', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 246: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key', '__type__': 'NonTerminal'}, {'name': 'descriptive_chord_by_degree', '__type__': 'NonTerminal'}], 'order': 9, 'alias': 'harmalysis_descriptive_by_degree_with_key', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 247: {'origin': {'name': Token('RULE', 'harmalysis'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'descriptive_chord_by_letter', '__type__': 'NonTerminal'}], 'order': 10, 'alias': 'harmalysis_descriptive_by_letter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 248: {'origin': {'name': Token('RULE', 'implicit'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'harmalysis', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 249: {'origin': {'name': Token('RULE', 'alternate'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'harmalysis', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'harmalysis', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 250: {'origin': {'name': Token('RULE', 'start'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'harmalysis', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 251: {'origin': {'name': Token('RULE', 'start'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'implicit', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 252: {'origin': {'name': Token('RULE', 'start'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'alternate', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 253: {'origin': {'name': '__tonicization_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'by_scale_degree', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 254: {'origin': {'name': '__tonicization_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__tonicization_plus_0', '__type__': 'NonTerminal'}, {'name': 'by_scale_degree', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+)
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(**kwargs):
+  return Lark._load_from_dict(DATA, MEMO, **kwargs)
@@ -0,0 +1,113 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import numpy as np
+
+import harmalysis.common as common
+
+FULL_MASK = (1 << common.PITCH_CLASSES) - 1
+
+# popcount[m] is the number of pitch classes in the 12-bit mask m
+popcount = np.array([bin(m).count('1') for m in range(FULL_MASK + 1)], dtype=np.uint8)
+
+
+def pitch_class_mask(query):
+    # Accepts a mask, a chord, a Harmalysis object or an iterable of pitch classes
+    if isinstance(query, (int, np.integer)):
+        if not 0 <= query <= FULL_MASK:
+            raise ValueError("'{}' is not a 12-bit pitch-class mask.".format(query))
+        return int(query)
+    if hasattr(query, 'chord'):
+        query = query.chord
+    if hasattr(query, 'get_pcset_code'):
+        return query.get_pcset_code()
+    if hasattr(query, 'get_pitch_classes'):
+        query = query.get_pitch_classes()
+    mask = 0
+    for pc in query:
+        mask |= 1 << (pc % common.PITCH_CLASSES)
+    return mask
+
+
+def rotations(masks):
+    # rotations(masks)[..., t] is the mask transposed up by t semitones
+    masks = np.asarray(masks, dtype=np.uint16)[..., np.newaxis]
+    t = np.arange(common.PITCH_CLASSES, dtype=np.uint16)
+    rotated = (masks << t) | (masks >> ((common.PITCH_CLASSES - t) % common.PITCH_CLASSES))
+    return rotated & FULL_MASK
+
+
+# Every 12-bit mask with its 12 transpositions
+_all_rotations = rotations(np.arange(FULL_MASK + 1))
+
+
+def _distance_table(mask, transpose):
+    # Distance from each of the 4096 possible masks to the query, so that
+    # the corpus is scanned with a single gather instead of 12 XORs per chord
+    if not transpose:
+        return popcount[np.arange(FULL_MASK + 1, dtype=np.uint16) ^ mask]
+    return popcount[_all_rotations ^ mask].min(axis=1)
+
+
+class PitchClassSetIndex(object):
+    def __init__(self, chords=None):
+        self._pending = []
+        self._masks = np.empty(0, dtype=np.uint16)
+        if chords is not None:
+            self.extend(chords)
+
+    def __len__(self):
+        return len(self._masks) + len(self._pending)
+
+    def add(self, chord):
+        self._pending.append(pitch_class_mask(chord))
+        return len(self) - 1
+
+    def extend(self, chords):
+        self._pending.extend(pitch_class_mask(chord) for chord in chords)
+
+    @property
+    def masks(self):
+        if self._pending:
+            pending = np.array(self._pending, dtype=np.uint16)
+            self._masks = np.concatenate([self._masks, pending])
+            self._pending = []
+        return self._masks
+
+    def distances(self, query, transpose=True):
+        return _distance_table(pitch_class_mask(query), transpose)[self.masks]
+
+    def transpositions(self, query):
+        # Semitones that bring each indexed chord closest to the query
+        table = popcount[_all_rotations ^ pitch_class_mask(query)].argmin(axis=1)
+        return table[self.masks]
+
+    def search(self, query, max_distance=1, transpose=True):
+        distances = self.distances(query, transpose)
+        indices = np.flatnonzero(distances <= max_distance)
+        order = np.argsort(distances[indices], kind='stable')
+        return indices[order], distances[indices[order]]
+
+    def nearest(self, query, k=10, transpose=True):
+        distances = self.distances(query, transpose)
+        k = min(k, len(distances))
+        if k == 0:
+            return np.empty(0, dtype=np.int64), distances[:0]
+        indices = np.argpartition(distances, k - 1)[:k]
+        indices = indices[np.lexsort((indices, distances[indices]))]
+        return indices, distances[indices]
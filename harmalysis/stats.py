@@ -0,0 +1,155 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import numpy as np
+
+import harmalysis.common as common
+import harmalysis.modulation as modulation
+from harmalysis.classes.chord import TertianChord, AugmentedSixthChord
+from harmalysis.classes.pitch_class import PitchClassSpelling
+
+# The vocabularies are fixed, so partial counts computed anywhere can be
+# merged by adding their arrays. The last code of each one is 'other'.
+ALTERATIONS = [-2, -1, 0, 1, 2]
+DEGREES = [
+    PitchClassSpelling.alterations_canonical[alteration] + common.int_to_roman[degree]
+    for alteration in ALTERATIONS
+    for degree in range(1, common.DIATONIC_CLASSES + 1)
+] + ['other']
+QUALITIES = TertianChord.triad_qualities + list(AugmentedSixthChord.augmented_sixth_labels) + ['other']
+FUNCTIONS = ['tonic', 'subdominant', 'dominant', 'other']
+KEYS = [key.to_label() for key in modulation.relations().keys] + ['other']
+
+_counts = ['degree', 'quality', 'function', 'key']
+
+
+def degree_code(chord):
+    if not chord.scale_degree:
+        return len(DEGREES) - 1
+    alteration = PitchClassSpelling.alterations.get(chord.scale_degree_alteration, 0)
+    degree = common.roman_to_int[chord.scale_degree]
+    return ALTERATIONS.index(alteration) * common.DIATONIC_CLASSES + degree - 1
+
+
+def quality_code(chord):
+    if isinstance(chord, AugmentedSixthChord):
+        return QUALITIES.index(chord.augmented_sixth_type)
+    quality = getattr(chord, 'triad_quality', None)
+    return QUALITIES.index(quality) if quality else len(QUALITIES) - 1
+
+
+def function_code(chord):
+    if chord.default_function in FUNCTIONS:
+        return FUNCTIONS.index(chord.default_function)
+    return len(FUNCTIONS) - 1
+
+
+def key_code(key):
+    # Chords described by letter (e.g., '?CM3P5') have no key
+    if key is None:
+        return len(KEYS) - 1
+    try:
+        return modulation.relations().index(key)
+    except KeyError:
+        return len(KEYS) - 1
+
+
+class CorpusStatistics(object):
+    def __init__(self):
+        self.degree_counts = np.zeros(len(DEGREES), dtype=np.int64)
+        self.quality_counts = np.zeros(len(QUALITIES), dtype=np.int64)
+        self.function_counts = np.zeros(len(FUNCTIONS), dtype=np.int64)
+        self.key_counts = np.zeros(len(KEYS), dtype=np.int64)
+        self.degree_quality_counts = np.zeros((len(DEGREES), len(QUALITIES)), dtype=np.int64)
+        self.degree_transitions = np.zeros((len(DEGREES), len(DEGREES)), dtype=np.int64)
+        self.function_transitions = np.zeros((len(FUNCTIONS), len(FUNCTIONS)), dtype=np.int64)
+        self._pending = {name: [] for name in _counts}
+        self._previous = None
+
+    def __len__(self):
+        return int(self.degree_counts.sum()) + len(self._pending['degree'])
+
+    def update(self, harmalysis):
+        # Only the codes are kept, the analysis can be released right away
+        chord = harmalysis.chord
+        self._pending['degree'].append(degree_code(chord))
+        self._pending['quality'].append(quality_code(chord))
+        self._pending['function'].append(function_code(chord))
+        self._pending['key'].append(key_code(harmalysis.main_key))
+
+    def flush(self):
+        degrees = np.array(self._pending['degree'], dtype=np.int64)
+        qualities = np.array(self._pending['quality'], dtype=np.int64)
+        functions = np.array(self._pending['function'], dtype=np.int64)
+        keys = np.array(self._pending['key'], dtype=np.int64)
+        self._pending = {name: [] for name in _counts}
+        if not len(degrees):
+            return
+        self.degree_counts += np.bincount(degrees, minlength=len(DEGREES))
+        self.quality_counts += np.bincount(qualities, minlength=len(QUALITIES))
+        self.function_counts += np.bincount(functions, minlength=len(FUNCTIONS))
+        self.key_counts += np.bincount(keys, minlength=len(KEYS))
+        np.add.at(self.degree_quality_counts, (degrees, qualities), 1)
+        # Transitions continue from the last chord of the previous flush
+        if self._previous is not None:
+            degrees = np.concatenate([[self._previous[0]], degrees])
+            functions = np.concatenate([[self._previous[1]], functions])
+        np.add.at(self.degree_transitions, (degrees[:-1], degrees[1:]), 1)
+        np.add.at(self.function_transitions, (functions[:-1], functions[1:]), 1)
+        self._previous = (degrees[-1], functions[-1])
+
+    def end_piece(self):
+        # No transitions are counted across pieces
+        self.flush()
+        self._previous = None
+
+    def consume(self, analyses, batch_size=4096):
+        for harmalysis in analyses:
+            self.update(harmalysis)
+            if len(self._pending['degree']) >= batch_size:
+                self.flush()
+        self.end_piece()
+        return self
+
+    def _arrays(self):
+        return [name for name in vars(self) if not name.startswith('_')]
+
+    def merge(self, other):
+        self.flush()
+        other.flush()
+        for name in self._arrays():
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    def transition_probabilities(self, kind='function'):
+        self.flush()
+        transitions = getattr(self, '{}_transitions'.format(kind))
+        totals = transitions.sum(axis=1, keepdims=True)
+        return np.divide(transitions, totals, out=np.zeros(transitions.shape), where=totals > 0)
+
+    def save(self, filename):
+        self.flush()
+        np.savez_compressed(filename, **{name: getattr(self, name) for name in self._arrays()})
+
+    @classmethod
+    def load(cls, filename):
+        statistics = cls()
+        with np.load(filename) as data:
+            for name in statistics._arrays():
+                setattr(statistics, name, data[name])
+        return statistics
@@ -0,0 +1,351 @@
+import harmalysis
+import harmalysis.agreement
+import harmalysis.functions
+import harmalysis.keyfinding
+import harmalysis.modulation
+import harmalysis.ngrams
+import harmalysis.search
+import harmalysis.stats
+import harmalysis.timeline
+import harmalysis.voicing
+from harmalysis.classes.key import Key
+import os
+import tempfile
+import unittest
+
+
+class TestModulation(unittest.TestCase):
+    def test_circle_of_fifths_distance(self):
+        queries = [
+            (Key('C'), Key('G'), 1),
+            (Key('C'), Key('a', scale='minor'), 0),
+            (Key('C'), Key('F', '#'), 6),
+            (Key('E', 'b'), Key('D', '#'), 0),
+        ]
+        for key_a, key_b, distance in queries:
+            with self.subTest(key_a=str(key_a), key_b=str(key_b)):
+                self.assertEqual(harmalysis.modulation.distance(key_a, key_b), distance)
+
+    def test_pivot_chords(self):
+        pivots = harmalysis.modulation.pivot_chords(Key('C'), Key('G'))
+        self.assertEqual([(a, b) for a, b, _, _ in pivots], [(1, 4), (3, 6), (5, 1), (6, 2)])
+
+    def test_pivot_mask(self):
+        harmalysis.parse('C=>:I')
+        chords = [harmalysis.parse(label).chord for label in ['I', 'ii', 'V7', 'Ger65', '?CM3P5']]
+        mask = harmalysis.modulation.pivot_mask(chords, Key('C'), Key('G'))
+        self.assertEqual(mask.tolist(), [True, False, True, False, False])
+
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        harmalysis.parse('C=>:I')
+        labels = ['I', 'V7', 'ii', 'G:I', 'viioD7', 'I6']
+        self.chords = [harmalysis.parse(label) for label in labels]
+        self.index = harmalysis.search.PitchClassSetIndex(self.chords)
+
+    def test_pitch_class_mask(self):
+        self.assertEqual(harmalysis.search.pitch_class_mask(self.chords[0]), 0b000010010001)
+        self.assertEqual(harmalysis.search.pitch_class_mask([0, 4, 7]), 0b000010010001)
+        self.assertEqual(harmalysis.search.rotations([0b1])[0].tolist(), [1 << t for t in range(12)])
+
+    def test_search(self):
+        indices, distances = self.index.search([0, 4, 7], max_distance=0, transpose=False)
+        self.assertEqual(indices.tolist(), [0, 5])
+        indices, distances = self.index.search([0, 4, 7], max_distance=0)
+        self.assertEqual(indices.tolist(), [0, 3, 5])
+        indices, distances = self.index.search([7, 11, 2], max_distance=1, transpose=False)
+        self.assertEqual(indices.tolist(), [3, 1])
+        self.assertEqual(distances.tolist(), [0, 1])
+        self.assertEqual(int(self.index.transpositions([7, 11, 2])[0]), 7)
+
+    def test_nearest(self):
+        self.index.add([2, 5, 8, 11])
+        indices, distances = self.index.nearest([2, 5, 8, 11], k=2)
+        self.assertEqual(indices.tolist(), [4, 6])
+        self.assertEqual(distances.tolist(), [0, 0])
+
+
+class TestNgrams(unittest.TestCase):
+    def setUp(self):
+        pieces = [
+            ['C:I', 'C:ii65', 'C:V7', 'C:I', 'C:V/V', 'C:V'],
+            ['c:i', 'c:iio65', 'c:V7', 'c:i'],
+            ['G:V/V', 'G:V', 'G:I'],
+        ]
+        self.index = harmalysis.ngrams.NgramIndex()
+        for i, piece in enumerate(pieces):
+            self.index.add_piece([harmalysis.parse(label) for label in piece], name=str(i))
+
+    def test_query(self):
+        matches = self.index.query(['V/V', 'V'])
+        self.assertEqual(list(zip(matches.pieces.tolist(), matches.positions.tolist())), [(0, 4), (2, 0)])
+        matches = self.index.query(['iio65', 'V7', 'i'], mode='minor')
+        self.assertEqual(list(zip(matches.pieces.tolist(), matches.positions.tolist())), [(1, 1)])
+        self.assertEqual(self.index.count(['V7', 'I']), 1)
+        self.assertEqual(self.index.count(['V7']), 2)
+        self.assertEqual(self.index.count(['V7'], mode='major'), 1)
+        self.assertEqual(self.index.count(['Ger65']), 0)
+
+    def test_modes(self):
+        self.index.add_piece([harmalysis.parse(label) for label in ['C:ii', 'C:V7', 'c:i', 'C:I', '?CM3P5m7', 'C:V']])
+        self.assertEqual(len(self.index), 19)
+        self.assertEqual(len(self.index.piece_names), 4)
+        self.assertEqual(self.index.count(['V7', 'i']), 2)
+        self.assertEqual(self.index.count(['V7', 'i'], mode='minor'), 1)
+        self.assertEqual(self.index.count(['V7', 'i'], mode='major'), 0)
+        self.assertEqual(self.index.count(['I']), 4)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'index.npz')
+            self.index.save(filename)
+            index = harmalysis.ngrams.NgramIndex.load(filename)
+        index.add_piece([harmalysis.parse(label) for label in ['D:V/V', 'D:V', 'D:vi']])
+        matches = index.query(['V/V', 'V'])
+        self.assertEqual(matches.pieces.tolist(), [0, 2, 3])
+        self.assertEqual(index.piece_names, ['0', '1', '2', None])
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        self.pieces = [
+            ['C:I', 'C:IV', 'C:V7', 'C:I'],
+            ['a:i', 'a:Ger65', 'a:V', 'a:i', 'a:bVI'],
+        ]
+
+    def _statistics(self, pieces, batch_size=4096):
+        statistics = harmalysis.stats.CorpusStatistics()
+        for piece in pieces:
+            statistics.consume((harmalysis.parse(label) for label in piece), batch_size=batch_size)
+        return statistics
+
+    def test_counts(self):
+        statistics = self._statistics(self.pieces, batch_size=2)
+        degrees = harmalysis.stats.DEGREES
+        functions = harmalysis.stats.FUNCTIONS
+        self.assertEqual(len(statistics), 9)
+        self.assertEqual(statistics.degree_counts[degrees.index('I')], 4)
+        self.assertEqual(statistics.degree_counts[degrees.index('-VI')], 1)
+        self.assertEqual(statistics.quality_counts[harmalysis.stats.QUALITIES.index('german')], 1)
+        self.assertEqual(statistics.key_counts[harmalysis.stats.KEYS.index('a')], 5)
+        self.assertEqual(statistics.degree_transitions[degrees.index('V'), degrees.index('I')], 2)
+        self.assertEqual(statistics.degree_transitions.sum(), 7)
+        self.assertEqual(statistics.function_transitions[functions.index('dominant'), functions.index('tonic')], 2)
+
+    def test_descriptive(self):
+        statistics = self._statistics([['C:I', '?CM3P5m7', 'C:V']])
+        self.assertEqual(len(statistics), 3)
+        self.assertEqual(statistics.key_counts[harmalysis.stats.KEYS.index('C')], 2)
+        self.assertEqual(statistics.key_counts[-1], 1)
+        self.assertEqual(statistics.degree_counts[-1], 1)
+
+    def test_merge(self):
+        merged = self._statistics(self.pieces[:1]).merge(self._statistics(self.pieces[1:]))
+        single = self._statistics(self.pieces)
+        for name in ['degree_counts', 'key_counts', 'degree_quality_counts', 'degree_transitions', 'function_transitions']:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(merged, name).tolist(), getattr(single, name).tolist())
+        probabilities = merged.transition_probabilities('function')
+        self.assertAlmostEqual(probabilities[harmalysis.stats.FUNCTIONS.index('dominant')].sum(), 1.0)
+
+
+class TestVoicing(unittest.TestCase):
+    def test_chord_tones(self):
+        queries = {
+            'C:V7': (7, 11, 2, 5),
+            'C:V9': (7, 11, 2, 5, 9),
+            'C:Ger65': (6, 8, 0, 3),
+        }
+        for label, tones in queries.items():
+            with self.subTest(label=label):
+                self.assertEqual(harmalysis.voicing.chord_tones(harmalysis.parse(label).chord), tones)
+
+    def test_bass_tone(self):
+        queries = {
+            'C:V7': 7,
+            'C:V7b': 11,
+            'C:V7dx5': 5,
+            'C:V7cx3': 2,
+            'C:V7bx5': 11,
+            'C:V9e': 9,
+            'C:V9ex3': 9,
+            'C:Ger65': 8,
+        }
+        for label, bass in queries.items():
+            with self.subTest(label=label):
+                chord = harmalysis.parse(label).chord
+                self.assertEqual(harmalysis.voicing.bass_tone(chord, harmalysis.voicing.chord_tones(chord)), bass)
+
+    def test_realize(self):
+        progression = ['C:I', 'C:IV', 'C:V65/V', 'C:Cad64', 'C:V7', 'C:I']
+        voicings = harmalysis.realize(progression)
+        self.assertEqual(voicings.shape, (6, 4))
+        self.assertEqual((voicings[:, 0] % 12).tolist(), [0, 5, 6, 7, 7, 0])
+        self.assertTrue((voicings[:, 1:] >= voicings[:, :-1]).all())
+        for voicing, label in zip(voicings, progression):
+            with self.subTest(label=label):
+                tones = set(harmalysis.voicing.chord_tones(harmalysis.parse(label).chord))
+                self.assertTrue(set((voicing % 12).tolist()) <= tones)
+        costs = harmalysis.voicing.transition_costs(voicings[:-1], voicings[1:])
+        self.assertTrue((costs.diagonal() < harmalysis.voicing.PARALLEL_COST).all())
+
+
+class TestFunctions(unittest.TestCase):
+    def test_infer_functions(self):
+        queries = {
+            'C:I': 'tonic',
+            'C:vi': 'subdominant',
+            'C:ii65': 'subdominant',
+            'C:Cad64': 'dominant',
+            'C:V7': 'dominant',
+            'C:vi6': 'tonic',
+            'C:iii': 'tonic',
+            'C:IV': 'subdominant',
+            'C:V7/V': 'subdominant',
+            'C:V': 'dominant',
+            'C:I/IV': 'subdominant',
+            'C:Cad': 'tonic',
+            'C:IV6': 'subdominant',
+            'C:I6': 'tonic',
+            '?Cm3': 'unknown',
+            'c:i': 'tonic',
+            'c:v6': 'dominant',
+            'c:iv6': 'subdominant',
+            'c:V': 'dominant',
+        }
+        analyses = harmalysis.parsers.roman.parse_batch(list(queries), infer_functions=True)
+        self.assertEqual([analysis.chord.contextual_function for analysis in analyses], list(queries.values()))
+        self.assertEqual(harmalysis.functions.infer_functions([]), [])
+        # Functions left by an earlier inference are inferred again
+        deceptive = harmalysis.parsers.roman.parse_batch(['C:V', 'C:vi'], infer_functions=True)
+        self.assertEqual(deceptive[1].chord.contextual_function, 'tonic')
+        self.assertEqual(harmalysis.functions.infer_functions(deceptive[1:]), ['subdominant'])
+        applied = harmalysis.parsers.roman.parse_batch(['C:V/V', 'C:IV/V', 'C:ii/V', 'C:viio7/ii'])
+        self.assertEqual(harmalysis.functions.infer_functions(applied), ['subdominant', 'tonic', 'tonic', 'tonic'])
+
+
+class TestKeyFinding(unittest.TestCase):
+    def setUp(self):
+        self.histograms = [
+            [1, 0, 2, 0, 0, 1, 0, 3, 0, 0, 0, 2],
+            [3, 0, 1, 0, 2, 1, 0, 2, 0, 1, 0, 1],
+            [2, 0, 1, 0, 2, 1, 0, 0, 2, 3, 0, 1],
+        ]
+
+    def test_find_keys(self):
+        finder = harmalysis.keyfinding.key_finder()
+        self.assertEqual(len(finder.keys), 48)
+        indices, scores = finder.find_keys(self.histograms, top=2)
+        self.assertEqual(indices.shape, (3, 2))
+        self.assertTrue((scores[:, 0] >= scores[:, 1]).all())
+        self.assertEqual(finder.keys[indices[1, 0]].to_label(), 'C')
+        self.assertEqual(finder.keys[indices[2, 0]].to_label(), 'a')
+
+    def test_propose(self):
+        proposals = harmalysis.keyfinding.propose(self.histograms, top=5)
+        self.assertEqual([len(window) for window in proposals], [5, 5, 5])
+        self.assertIn('C:V', [p.label for p in proposals[0]])
+        self.assertEqual(proposals[1][0].label, 'C:I')
+        self.assertEqual(proposals[2][0].label, 'a:i')
+        for window in proposals:
+            for proposal in window:
+                self.assertEqual(harmalysis.parse(proposal.label).main_key.to_label(), proposal.key.to_label())
+
+    def test_propose_all(self):
+        # More proposals than candidates: the padding of the shorter
+        # vocabularies is not proposed
+        finder = harmalysis.keyfinding.key_finder()
+        key_indices, label_indices, scores = finder.propose_indices(self.histograms, top=1000)
+        self.assertLess(scores.shape[1], 3 * finder.vocabulary)
+        for window, window_scores in zip(finder.propose(self.histograms, top=1000), scores):
+            self.assertEqual(len(window), harmalysis.keyfinding.np.isfinite(window_scores).sum())
+            for proposal in window:
+                self.assertFalse(proposal.label.endswith(':'))
+                self.assertGreater(proposal.score, -float('inf'))
+
+
+class TestAgreement(unittest.TestCase):
+    def test_alignment(self):
+        result = harmalysis.diff(['C:I', 'C:IV', 'C:V7', 'C:I'], ['C:I', 'C:ii6', 'C:V', 'C:vi', 'C:I'])
+        self.assertEqual(result.pairs.tolist(), [[0, 0], [1, 1], [2, 2], [-1, 3], [3, 4]])
+        self.assertEqual((result.compared, result.gaps), (4, 1))
+        self.assertEqual(result.matches, {'label': 2, 'degree': 3, 'chord': 2, 'pcset': 2, 'key': 4})
+        mismatches = result.mismatches
+        self.assertEqual([(m.label_a, m.label_b) for m in mismatches], [('C:IV', 'C:iib'), ('C:V7', 'C:V'), (None, 'C:vi')])
+        self.assertEqual(mismatches[1].levels, ('label', 'chord', 'pcset'))
+
+    def test_edge_labels(self):
+        # Labels the chord classes reject are kept as written
+        result = harmalysis.diff(['C:Tr', 'C:I'], ['C:I'])
+        self.assertEqual(result.pairs.tolist(), [[0, -1], [1, 0]])
+        self.assertEqual(result.matches['label'], 1)
+        # The key established by a does not carry into b
+        result = harmalysis.diff(['G=>:I', 'V'], ['V'])
+        self.assertEqual([(m.label_a, m.label_b) for m in result.mismatches], [('G:I', 'C:V'), ('G:V', None)])
+
+    def test_onsets(self):
+        a = [harmalysis.parse(query) for query in ['C:I', 'C:V7', 'C:I']]
+        result = harmalysis.diff(a, ['C:I', 'C:V', 'C:I6'], [0, 2, 3], [0, 1, 3])
+        self.assertEqual(result.onsets.tolist(), [0, 1, 2, 3])
+        self.assertEqual(result.pairs.tolist(), [[0, 0], [0, 1], [1, 1], [2, 2]])
+        self.assertEqual(result.agreement['key'], 1.0)
+        self.assertEqual([m.onset for m in result.mismatches], [1.0, 2.0, 3.0])
+        self.assertEqual(result.mismatches[-1].levels, ('label',))
+        with self.assertRaises(ValueError):
+            harmalysis.diff(['C:I'], ['C:I'], [0], None)
+
+    def test_corpus(self):
+        pieces = [(['C:I', 'C:V'], ['C:I', 'C:V']), (['C:I', 'C:X'], ['C:I', 'C:X'])]
+        diffs, agreement = harmalysis.agreement.diff_corpus(pieces)
+        self.assertEqual(len(diffs), 2)
+        self.assertEqual(agreement['label'], 0.75)
+        self.assertEqual(diffs[1].mismatches[0].label_a, 'C:X')
+
+
+class TestTimeline(unittest.TestCase):
+    def setUp(self):
+        self.timeline = harmalysis.timeline.HarmonicTimeline.from_labels(
+            ['C:I', 'C:V7/V', 'C:V', '?Em3P5', 'G:I', 'C:X'], [0, 1, 2, 3, 4, 6], end=8, skip_errors=True)
+
+    def test_point(self):
+        self.assertEqual(self.timeline.indices_at([-1, 0, 1.5, 2, 5.9, 7, 8]).tolist(), [-1, 0, 1, 2, 4, 5, -1])
+        self.assertEqual(self.timeline.at(1.5).to_label(), 'V7/V')
+        self.assertIsNone(self.timeline.at(9))
+
+    def test_range(self):
+        self.assertEqual(self.timeline.overlapping(1.5, 3).tolist(), [1, 2])
+        self.assertEqual(self.timeline.overlapping(1, 2).tolist(), [1])
+        self.assertEqual(self.timeline.overlapping(8, 9).tolist(), [])
+        overlapping = harmalysis.timeline.HarmonicTimeline.from_labels(['C:I', 'C:V', 'C:IV'], [0, 1, 2], durations=[10, 0.5, 1])
+        self.assertEqual(overlapping.overlapping(1.6, 1.8).tolist(), [0])
+        self.assertEqual(overlapping.indices_at([1.2, 1.7, 2.5, 11]).tolist(), [1, 0, 2, -1])
+
+    def test_keys(self):
+        keys = self.timeline.keys_at([-1, 0.5, 1.5, 3.5, 4, 7])
+        self.assertEqual([key.to_label() if key else None for key in keys], [None, 'C', 'C', 'C', 'G', 'G'])
+        self.assertEqual(self.timeline.key_at(1.5, local=True).to_label(), 'G')
+        established = harmalysis.classes.harmalysis.Harmalysis.established_key
+        try:
+            timeline = harmalysis.timeline.HarmonicTimeline.from_labels(['G=>:I', 'V', 'C:I', 'IV'], [0, 1, 2, 3])
+        finally:
+            harmalysis.classes.harmalysis.Harmalysis.established_key = established
+        self.assertEqual([key.to_label() for key in timeline.keys_at([0, 1, 2, 3])], ['G', 'G', 'C', 'G'])
+        try:
+            timeline = harmalysis.timeline.HarmonicTimeline.from_labels(['C:I', 'IV', 'G=>:I', 'V'], [2, 3, 0, 1], durations=[1, 1, 1, 1])
+        finally:
+            harmalysis.classes.harmalysis.Harmalysis.established_key = established
+        self.assertEqual([key.to_label() for key in timeline.keys_at([0, 1, 2, 3])], ['G', 'G', 'C', 'G'])
+        self.assertEqual(timeline.at(3.5).to_label(), 'IV')
+
+    def test_sounding(self):
+        ends = [9, 1, 4, 2, 3, 8, 6, 7, 5]
+        tree = harmalysis.timeline.segment_tree(ends)
+        for index in range(len(ends)):
+            for value in range(10):
+                before = [position for position in range(index + 1) if ends[position] > value]
+                self.assertEqual(harmalysis.timeline.last_greater(tree, [index], [value]).tolist(), [before[-1] if before else -1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import harmalysis
 import itertools
+import pickle
 import unittest
 
 keys_major = ['C', 'D', 'E', 'F', 'G', 'A', 'B']
@@ -72,5 +73,74 @@ class TestTertian(unittest.TestCase):
     # TODO: test_diatonic_thirteenths
 
 
+class TestIdentityCodes(unittest.TestCase):
+    def test_enharmonic(self):
+        german = harmalysis.parse('C:Ger').chord
+        dominant = harmalysis.parse('C:V7/-II').chord
+        self.assertNotEqual(german.get_spelled_code(), dominant.get_spelled_code())
+        self.assertEqual(german.get_pcset_code(), dominant.get_pcset_code())
+        self.assertEqual(german.get_pcset_code(), (1 << 8) | (1 << 0) | (1 << 3) | (1 << 6))
+
+    def test_set_class(self):
+        codes = set()
+        for key in keys_major:
+            with self.subTest(key=key):
+                chord = harmalysis.parse('{}:V7'.format(key)).chord
+                codes.add(chord.get_set_class_code())
+                self.assertEqual(chord.get_spelled_code(), harmalysis.parse('{}:V7'.format(key)).chord.get_spelled_code())
+        self.assertEqual(len(codes), 1)
+        self.assertNotEqual(codes.pop(), harmalysis.parse('C:ii7').chord.get_set_class_code())
+
+
+class TestScales(unittest.TestCase):
+    def test_rotation(self):
+        # Every mode of a scale is a rotation of its steps
+        major = harmalysis.classes.scale.MajorScale()
+        for mode, name in enumerate(['ionian', 'dorian', 'phrygian', 'lydian', 'mixolydian', 'aeolian', 'locrian'], 1):
+            church = harmalysis.classes.key.Key._scale_mapping[name]
+            for step in range(1, 15):
+                with self.subTest(mode=name, step=step):
+                    self.assertEqual(church.step_to_semitones(step), major.step_to_semitones(step, mode=mode))
+                    self.assertEqual(str(church.step_to_interval_spelling(step)), str(major.step_to_interval_spelling(step, mode=mode)))
+
+    def test_harmonic_minor(self):
+        minor = harmalysis.classes.scale.HarmonicMinorScale()
+        self.assertEqual(str(minor.step_to_interval_spelling(5, mode=3)), 'A5')
+        self.assertEqual(minor.step_to_semitones(5, mode=3), 8)
+        self.assertEqual(str(minor.step_to_interval_spelling(7)), 'M7')
+
+    def test_modal_key(self):
+        key = harmalysis.classes.key.Key('D', scale='dorian')
+        self.assertEqual([key.scale_degree(d).to_label() for d in range(1, 8)], ['D', 'E', 'F', 'G', 'A', 'B', 'C'])
+        self.assertIs(pickle.loads(pickle.dumps(key)), harmalysis.classes.key.from_code(key.to_code()))
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            harmalysis.classes.scale.Scale((2, 2, 2, 2, 2, 2))
+
+
+class TestPickle(unittest.TestCase):
+    def test_round_trip(self):
+        queries = ['C:V7', 'c#:viio65/V', 'C:Ger65', 'Eb:Cad64', '?e#m3D5m7', 'C:I[G:V]', '(F:ii7b)', 'C:I9x7']
+        for query in queries:
+            with self.subTest(query=query):
+                analysis = harmalysis.parse(query)
+                data = pickle.dumps(analysis)
+                loaded = pickle.loads(data)
+                self.assertEqual(loaded.to_label(), analysis.to_label())
+                self.assertEqual(str(loaded.chord), str(analysis.chord))
+                self.assertEqual(loaded.chord.get_pitch_spellings(), analysis.chord.get_pitch_spellings())
+                self.assertEqual(type(loaded.chord), type(analysis.chord))
+                self.assertEqual(set(loaded.chord.__dict__), set(analysis.chord.__dict__))
+                # Every attribute of a parsed chord is pickled by position
+                self.assertIsNone(analysis.chord.__reduce__()[1][-1])
+                self.assertLess(len(data), 400)
+
+    def test_interned(self):
+        analyses = pickle.loads(pickle.dumps([harmalysis.parse('C:V7'), harmalysis.parse('C:V7/V')]))
+        self.assertIs(analyses[0].main_key, analyses[1].main_key)
+        self.assertIs(analyses[0].chord.intervals[3], analyses[1].chord.intervals[3])
+
+
 if __name__ == '__main__':
     unittest.main()
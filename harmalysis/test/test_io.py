@@ -0,0 +1,191 @@
+import harmalysis.io.humdrum
+import harmalysis.io.labels
+import harmalysis.io.rntxt
+import harmalysis.parsers.roman
+from harmalysis.classes.harmalysis import Harmalysis
+import io
+import os
+import pickle
+import tempfile
+import unittest
+
+rntxt_example = '''Composer: J. S. Bach
+Time Signature: 3/4
+
+m1 G: I b2 I6 b3 IV6
+m2 V7/V b3 viio65 ||
+m3 e: iiø65 b2.5 V7[no5]
+m4 = m3
+'''
+
+humdrum_example = '''!!!COM: Bach
+**kern\t**harm
+*M4/4\t*
+*G:\t*G:
+=1\t=1
+4G\tI
+4B\t.
+
+4c\tV7b/V
+=2\t=2
+*e:\t*e:
+4e\tviio7
+4e\t(Gnb)
+4f#\tN[Ic]
+4g\t-VI/V
+*-\t*-
+'''
+
+
+class TestRomanText(unittest.TestCase):
+    def test_translate(self):
+        queries = {
+            'I': 'I',
+            'viio7': 'viioD7',
+            'viio65': 'viioD7b',
+            'iiø7': 'iiom7',
+            'vii/o43/V': 'viiom7c/V',
+            'V7[no5]': 'V7x5',
+            'Ger7': 'Ger',
+            'It6': 'It6',
+        }
+        for label, translation in queries.items():
+            with self.subTest(label=label):
+                self.assertEqual(harmalysis.io.rntxt.translate(label), translation)
+        self.assertRaises(ValueError, harmalysis.io.rntxt.translate, 'V7[add9]')
+        self.assertRaises(ValueError, harmalysis.io.rntxt.translate, 'I[add#6]')
+
+    def test_translate_minor(self):
+        # Sixth and seventh degrees of RomanText minor keys
+        queries = {
+            'VI': 'VI',
+            'vi': '#vi',
+            'vio': '#vio',
+            'bVI': '-VI',
+            'VII': '-VII',
+            'vii': 'vii',
+            'viio7': 'viioD7',
+            '#viio7': 'viioD7',
+            'bVII': '--VII',
+            'V/VII': 'V/-VII',
+            'viio7/V': 'viioD7/V',
+            'VII/iv': '-VII/iv',
+            'iv': 'iv',
+        }
+        for label, translation in queries.items():
+            with self.subTest(label=label):
+                self.assertEqual(harmalysis.io.rntxt.translate(label, minor=True), translation)
+        records = harmalysis.io.rntxt.parse_lines(['m1 e: VII b2 #viio7 b3 vi b4 VI'])
+        self.assertEqual([str(r.harmalysis.chord) for r in records], ['DM3P5', 'D#m3D5D7', 'C#m3P5', 'CM3P5'])
+        self.assertEqual(str(next(harmalysis.io.rntxt.parse_lines(['m1 C: VII'])).harmalysis.chord), 'BM3P5')
+
+    def test_parse_lines(self):
+        records = list(harmalysis.io.rntxt.parse_lines(rntxt_example.splitlines()))
+        self.assertEqual([(r.measure, r.beat) for r in records], [(1, 1.0), (1, 2.0), (1, 3.0), (2, 1.0), (2, 3.0), (3, 1.0), (3, 2.5)])
+        self.assertEqual(str(records[0].harmalysis.main_key), 'G major')
+        self.assertEqual(str(records[4].harmalysis.chord), 'F#m3D5D7')
+        self.assertEqual(str(records[5].harmalysis.main_key), 'E minor')
+        self.assertEqual(str(records[6].harmalysis.chord), 'BM3m7')
+
+    def test_parse_lines_interleaved(self):
+        established_key = Harmalysis.established_key
+        try:
+            keys = []
+            for record in harmalysis.io.rntxt.parse_lines(rntxt_example.splitlines()):
+                keys.append(str(record.harmalysis.main_key))
+                harmalysis.parsers.roman.parse('Ab=>:I')
+            self.assertEqual(keys, ['G major'] * 5 + ['E minor'] * 2)
+        finally:
+            Harmalysis.established_key = established_key
+
+
+class TestHumdrum(unittest.TestCase):
+    def test_parse_lines(self):
+        records = list(harmalysis.io.humdrum.parse_lines(humdrum_example.splitlines(), batch_size=2))
+        self.assertEqual([(r.measure, r.spine) for r in records], [(1, 1), (1, 1), (2, 1), (2, 1), (2, 1), (2, 1)])
+        self.assertEqual(str(records[1].harmalysis.chord), 'AM3P5m7')
+        self.assertEqual(str(records[2].harmalysis.main_key), 'E minor')
+        self.assertEqual(str(records[2].harmalysis.chord), 'D#m3D5D7')
+        self.assertEqual([str(r.harmalysis.main_key) for r in records], ['G major'] * 2 + ['E minor'] * 4)
+
+    def test_translate(self):
+        queries = {
+            'V7b/V': 'V7b/V',
+            '(Gnb)': '(Gerb)',
+            'Lt/V': 'It/V',
+            'Fr': 'Fr',
+        }
+        for token, translation in queries.items():
+            with self.subTest(token=token):
+                self.assertEqual(harmalysis.io.humdrum.translate(token), translation)
+        self.assertRaises(ValueError, harmalysis.io.humdrum.translate, 'Trb')
+
+    def test_write_roundtrip(self):
+        records = list(harmalysis.io.humdrum.parse_lines(humdrum_example.splitlines()))
+        harm = io.StringIO()
+        harmalysis.io.humdrum.write(records, harm)
+        tokens = [line for line in harm.getvalue().splitlines() if line[0] not in '*=']
+        self.assertEqual(tokens, ['I', 'V7b/V', 'viio7', '(Gnb)', 'N[Ic]', '-VI/V'])
+        reread = list(harmalysis.io.humdrum.parse_lines(harm.getvalue().splitlines()))
+        self.assertEqual([str(r.harmalysis.chord) for r in reread], [str(r.harmalysis.chord) for r in records])
+
+    def test_write_descriptive(self):
+        harm = io.StringIO()
+        harmalysis.io.humdrum.write([harmalysis.parsers.roman.parse('C:I[?CM3P5]'), harmalysis.parsers.roman.parse('C:V[I]')], harm)
+        tokens = [line for line in harm.getvalue().splitlines() if line[0] not in '*=']
+        self.assertEqual(tokens, ['I', 'V[I]'])
+        reread = list(harmalysis.io.humdrum.parse_lines(harm.getvalue().splitlines()))
+        self.assertEqual([str(r.harmalysis.chord) for r in reread], ['CM3P5', 'GM3P5'])
+        self.assertEqual(str(reread[1].harmalysis.alternative.chord), 'CM3P5')
+        with self.assertRaises(ValueError):
+            harmalysis.io.humdrum.write([harmalysis.parsers.roman.parse('?CM3P5')], io.StringIO())
+
+
+class TestLabelFile(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.folder.name, 'labels.txt')
+        with open(self.filename, 'wb') as f:
+            f.write(b'C:I\nC:V7\r\n\nc#:viio65/V\nC:X\n?CM3P5')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_random_access(self):
+        with harmalysis.io.labels.LabelFile(self.filename) as labels:
+            self.assertEqual(len(labels), 6)
+            self.assertEqual(labels[:], ['C:I', 'C:V7', '', 'c#:viio65/V', 'C:X', '?CM3P5'])
+            self.assertEqual(labels[3], 'c#:viio65/V')
+            self.assertEqual(labels[-1], '?CM3P5')
+            self.assertEqual(labels[1:2], ['C:V7'])
+            self.assertEqual(labels[5:100], ['?CM3P5'])
+            with self.assertRaises(IndexError):
+                labels[6]
+            self.assertEqual(labels.split(4), [(0, 1), (1, 3), (3, 4), (4, 6)])
+            self.assertEqual(pickle.loads(pickle.dumps(labels))[3], 'c#:viio65/V')
+        self.assertTrue(os.path.exists(harmalysis.io.labels.index_filename(self.filename)))
+        with harmalysis.io.labels.LabelFile(self.filename) as labels:
+            self.assertIsInstance(labels.offsets, harmalysis.io.labels.np.memmap)
+            self.assertEqual(labels[0], 'C:I')
+
+    def test_truncated_index(self):
+        # E.g., loaded while another process was writing it
+        index = harmalysis.io.labels.index_filename(self.filename)
+        with harmalysis.io.labels.LabelFile(self.filename):
+            pass
+        with open(index, 'rb') as f:
+            data = f.read()
+        with open(index, 'wb') as f:
+            f.write(data[:len(data) - 12])
+        with harmalysis.io.labels.LabelFile(self.filename) as labels:
+            self.assertEqual(labels[-1], '?CM3P5')
+        self.assertEqual(sorted(os.listdir(self.folder.name)), ['labels.txt', 'labels.txt.lines.npy'])
+        self.assertEqual(harmalysis.io.labels.load_index(index).tolist()[-1], os.path.getsize(self.filename))
+
+    def test_read(self):
+        analyses = list(harmalysis.io.labels.read(self.filename, 3, skip_errors=True, batch_size=2))
+        self.assertEqual([a.to_label() if a else None for a in analyses], ['viio7b/V', None, '?CM3P5'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,14 @@
+import harmalysis.footprint as footprint
+import unittest
+
+
+class TestMemory(unittest.TestCase):
+    def test_footprint(self):
+        # Same measurement as benchmarks/memory.py, see FOOTPRINTS
+        for family, labels in footprint.FAMILIES.items():
+            with self.subTest(family=family):
+                self.assertLess(footprint.bytes_per_label(labels), footprint.threshold(family))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,297 @@
+import harmalysis
+import harmalysis.parsers.build
+import harmalysis.parsers.cache
+import harmalysis.parsers.chordlabel
+import harmalysis.parsers.generator
+import harmalysis.parsers.limits
+import harmalysis.parsers.render
+import harmalysis.parsers.roman
+import os
+import pickle
+import tempfile
+import types
+import unittest
+from harmalysis.classes.harmalysis import Harmalysis
+
+
+class TestValidate(unittest.TestCase):
+    def test_valid_labels(self):
+        labels = ['I', 'V7/V', 'C:viio65', 'Ger65', 'I[V]', '(V7)', '?CM3P5m7', '?e#m3D5m7']
+        self.assertEqual(harmalysis.validate(labels), [])
+
+    def test_invalid_labels(self):
+        labels = ['I', 'Vz', 'V/', 'I', 'Vz']
+        invalid = harmalysis.validate(labels)
+        self.assertEqual([(e.index, e.label, e.column) for e in invalid], [(1, 'Vz', 2), (2, 'V/', 3), (4, 'Vz', 2)])
+        self.assertIn('SLASH', invalid[0].expected)
+        self.assertIn('DOMINANT_UPPERCASE', invalid[1].expected)
+
+
+class TestCanonical(unittest.TestCase):
+    def test_normalize(self):
+        queries = {
+            'bVI': '-VI',
+            'bbVI': '--VI',
+            'xIV': '##IV',
+            'V65/V': 'V7b/V',
+            'V42': 'V7d',
+            'I6': 'Ib',
+            'Ia': 'I',
+            'Gn65': 'Gerb',
+            'Lt6': 'Itb',
+            'Cad64': 'Cad',
+            'CTo7': 'CTo',
+            'vii07': 'vii0',
+            'viiø65': 'vii0b',
+            'V/N': 'V/-II',
+            'Bb=>:V7': 'B-=>:V7',
+            'e_har:i': 'e:i',
+            '?bbM3': '?B-M3',
+            '(V6)': '(Vb)',
+            'I[V65]': 'I[V7b]',
+            'Vz': 'Vz',
+        }
+        for label, normalized in queries.items():
+            with self.subTest(label=label):
+                self.assertEqual(harmalysis.normalize(label), normalized)
+
+    def test_to_label(self):
+        harmalysis.parse('C=>:I')
+        queries = {
+            'V65/V': 'V7b/V',
+            'Vm7': 'V7',
+            'VM7': 'VM7',
+            'V9': 'V9',
+            'VM9': 'VM9',
+            'bII6': '-IIb',
+            '#viiom7bx5': '#viiom7bx5',
+            'Gn65': 'Gerb',
+            'Cad64': 'Cad',
+            'vii065': 'vii0b',
+            'V/N': 'V/-II',
+            'viio7/ii': 'viio7/ii',
+            '?e#m3D5m7': '?E#m3D5m7',
+            '?bVIM3P5': '?-viM3P5',
+            '(V7)': '(V7)',
+        }
+        for label, canonical in queries.items():
+            with self.subTest(label=label):
+                self.assertEqual(harmalysis.parse(label).to_label(), canonical)
+                self.assertEqual(harmalysis.normalize(canonical), canonical)
+        self.assertEqual(harmalysis.parse('bb:V7').to_label('reference'), 'b-:V7')
+        self.assertEqual(harmalysis.parse('I[G:V]').to_label(), 'I[G:V]')
+        self.assertEqual(harmalysis.parse('?Em3D5A9[D:##ivo]').to_label(), '?Em3D5A9[D:##ivo]')
+        self.assertEqual(harmalysis.parse('D##:IM7a').to_label('reference'), 'D##:IM7')
+
+
+class TestGenerator(unittest.TestCase):
+    def test_seed(self):
+        first = list(harmalysis.parsers.generator.generate(100, seed=7))
+        second = list(harmalysis.parsers.generator.generate(100, seed=7))
+        self.assertEqual(first, second)
+
+    def test_valid_labels(self):
+        for label in harmalysis.parsers.generator.generate(300, seed=1):
+            with self.subTest(label=label):
+                harmalysis.parsers.roman.parse_tree(label)
+
+    def test_weights(self):
+        weights = {'implicit': 0, 'alternate': 0, 'special_chord': 0, 'tonicization': 0, 'descriptive_chord_by_degree': 0, 'descriptive_chord_by_letter': 0}
+        for label in harmalysis.parsers.generator.generate(200, weights, seed=1):
+            with self.subTest(label=label):
+                self.assertFalse(set(label) & set('()[]/?'))
+
+
+class TestStandalone(unittest.TestCase):
+    def test_up_to_date(self):
+        build = harmalysis.parsers.build
+        for grammar, module in build.GRAMMARS.items():
+            with self.subTest(grammar=grammar):
+                self.assertEqual(build.module_digest(module), build.grammar_digest(grammar),
+                                 '{} is stale, run python -m harmalysis.parsers.build'.format(module))
+
+    def test_regenerate(self):
+        module = types.ModuleType('roman_lalr')
+        exec(harmalysis.parsers.build.generate('roman.lark'), module.__dict__)
+        tree = module.Lark_StandAlone().parse('V65/V')
+        self.assertEqual(tree, harmalysis.parsers.roman.parser.parse('V65/V'))
+
+    def test_lalr_coverage(self):
+        # Labels that need the contextual terminals of the grammar
+        queries = {
+            'b:V7': 'b:V7',
+            'bb=>:V': 'b-:V',
+            'b_har:V': 'b:V',
+            'bII6': 'C:-IIb',
+            'VM7': 'C:VM7',
+            'Vm7': 'C:V7',
+            'IA7': 'C:IA7',
+            'V7x3x5': 'C:V7x3x5',
+            '?bM3P5': '?BM3P5',
+            '?bbM3P5': '?B-M3P5',
+        }
+        established_key = Harmalysis.established_key
+        try:
+            for label, canonical in queries.items():
+                with self.subTest(label=label):
+                    harmalysis.parse('C=>:I')
+                    self.assertEqual(harmalysis.parse(label).to_label('reference'), canonical)
+        finally:
+            Harmalysis.established_key = established_key
+        self.assertEqual(str(harmalysis.parse('?bVIM3P5').chord), 'AbM3P5')
+        with self.assertRaises(harmalysis.parsers.roman.UnexpectedCharacters):
+            harmalysis.parse('Vz')
+        self.assertEqual(harmalysis.validate(['V97'])[0].column, 3)
+
+
+class TestDescriptive(unittest.TestCase):
+    def test_intervals(self):
+        queries = {
+            '?CM3P5m7': 'CM3P5m7',
+            '?CP11': 'CP11',
+            '?CM3P12': 'CM3P12',
+            '?CM2M3P4P5M6m7P8M9m10P11A12M13m14P15': 'CM2M3P4P5M6m7P8M9m10P11A12M13m14P15',
+            '?e#AA3DD5': 'E#AA3DD5',
+        }
+        for query, chord in queries.items():
+            with self.subTest(query=query):
+                self.assertEqual(str(harmalysis.parse(query).chord), chord)
+
+    def test_invalid_intervals(self):
+        # Descending intervals, repeated intervals and wrong qualities
+        queries = ['?CP5M3', '?CM3M3', '?CP3', '?CM5', '?CM16']
+        invalid = harmalysis.validate(queries)
+        self.assertEqual([error.label for error in invalid], queries)
+
+
+class TestRender(unittest.TestCase):
+    def test_render(self):
+        queries = ['C:V7', 'C:I', 'C:V7', 'c:viio65/V']
+        with tempfile.TemporaryDirectory() as folder:
+            with harmalysis.parsers.render.TreeRenderer(folder=folder, fmt='dot', workers=2) as renderer:
+                self.assertEqual(len(renderer.submit(queries)), 3)
+                self.assertEqual(renderer.submit(['C:I']), [])
+                filenames = renderer.wait()
+            self.assertEqual(sorted(os.listdir(folder)), sorted(os.path.basename(f) for f in filenames))
+            self.assertEqual(len(filenames), 3)
+            with open(harmalysis.parsers.roman.create_filename('C:V7', folder, 'dot')) as f:
+                source = f.read()
+            self.assertTrue(source.startswith('digraph'))
+            self.assertIn("'V'", source)
+
+    def test_submit_after_shutdown(self):
+        with tempfile.TemporaryDirectory() as folder:
+            renderer = harmalysis.parsers.render.TreeRenderer(folder=folder, fmt='dot', workers=1, pending=1)
+            renderer.executor.shutdown()
+            with self.assertRaises(RuntimeError):
+                renderer.submit(['C:I'])
+            # The slot taken for the rejected tree is free again
+            self.assertTrue(renderer.slots.acquire(timeout=1))
+
+    def test_sheet(self):
+        source = harmalysis.parsers.render.render_sheet(['C:I', 'C:V7', 'C:I'], fmt='dot').decode()
+        self.assertEqual(source.count('subgraph cluster'), 2)
+        self.assertIn('label="C:V7"', source)
+
+
+class TestCache(unittest.TestCase):
+    def test_persistent(self):
+        queries = ['C:V7', 'c#:viio65/V', 'C:V7', 'C:Ger65', 'C:X', '?e#m3D5m7']
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, 'cache.sqlite')
+            with harmalysis.parsers.cache.ParseCache(filename) as cache:
+                cold = harmalysis.parsers.roman.parse_batch(queries, skip_errors=True, cache=cache)
+                self.assertEqual(len(cache), 5)
+            with harmalysis.parsers.cache.ParseCache(filename) as cache:
+                self.assertEqual(cache.prefetch(queries), 5)
+                warm = cache.parse_batch(queries, skip_errors=True)
+                self.assertEqual(cache.pending, {})
+                # Raised from the cache, with the location of the error
+                with self.assertRaises(harmalysis.parsers.cache.CachedParseError) as context:
+                    cache.parse('C:X')
+                self.assertEqual(context.exception.column, 3)
+                self.assertEqual(harmalysis.validate(['C:X'])[0].column, 3)
+            self.assertIsNot(warm[0], warm[2])
+            self.assertEqual([a.to_label('reference') if a else None for a in warm], [a.to_label('reference') if a else None for a in cold])
+            self.assertIsNone(warm[4])
+
+    def test_referenced(self):
+        established_key = Harmalysis.established_key
+        with tempfile.TemporaryDirectory() as folder:
+            with harmalysis.parsers.cache.ParseCache(os.path.join(folder, 'cache.sqlite')) as cache:
+                try:
+                    for key in ['C', 'G', 'd']:
+                        harmalysis.parse(key + '=>:I')
+                        for query in ['C:V7', 'V7', '(C:V7)', 'G:V7[D:V]', 'G:V7[V]']:
+                            cache.parse(query)
+                finally:
+                    Harmalysis.established_key = established_key
+                cache.flush()
+                # Labels with a key of their own are stored once
+                self.assertEqual(len(cache), 3 + 3 + 3)
+
+    def test_version(self):
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, 'cache.sqlite')
+            with harmalysis.parsers.cache.ParseCache(filename) as cache:
+                cache.parse_batch(['C:I', 'C:V'])
+            with harmalysis.parsers.cache.ParseCache(filename) as cache:
+                cache.version = 'other'
+                self.assertEqual(len(cache), 0)
+                self.assertEqual(cache.prefetch(['C:I']), 0)
+                cache.clear()
+                cache.version = harmalysis.__version__.__version__
+                self.assertEqual(len(cache), 0)
+
+
+class TestLimits(unittest.TestCase):
+    def test_prescan(self):
+        queries = {
+            'C:' + 'V/' * 20 + 'V': 'max_tonicizations',
+            '?C' + 'M3' * 100: 'max_length',
+            'C:I[V][V]': 'max_alternatives',
+        }
+        for query, limit in queries.items():
+            with self.subTest(query=query):
+                with self.assertRaises(harmalysis.parsers.limits.LabelLimitError) as context:
+                    harmalysis.parse(query)
+                self.assertEqual(context.exception.limit, limit)
+        self.assertEqual(harmalysis.parse('C:V/V/V[ii/V]').to_label(), 'V/V/V[ii/V]')
+        analyses = harmalysis.parsers.roman.parse_batch(list(queries) + ['C:I'], skip_errors=True)
+        self.assertEqual([a is None for a in analyses], [True, True, True, False])
+        self.assertEqual([invalid.expected for invalid in harmalysis.validate(queries)], [(limit,) for limit in queries.values()])
+
+    def test_configurable(self):
+        limits = harmalysis.parsers.limits.DEFAULT._replace(max_tonicizations=None, max_length=None)
+        self.assertEqual(harmalysis.parse('C:V' + '/IV/V' * 10, limits=limits).to_label(), 'V' + '/IV/V' * 10)
+
+
+class TestChordLabel(unittest.TestCase):
+    def test_structured(self):
+        label = harmalysis.parse('GM3P5m7', syntax='chordlabel')
+        self.assertEqual(label.description, 'G dominant seventh')
+        self.assertEqual(str(label), 'G dominant seventh')
+        self.assertIs(label.chord_type, harmalysis.classes.chordlabel.ChordType.DOMINANT_SEVENTH)
+        self.assertEqual([str(i) for i in label.intervals], ['M3', 'P5', 'm7'])
+        self.assertEqual(label.get_pitch_classes(), [7, 11, 2, 5])
+        self.assertIs(label, harmalysis.parse('gM3P5m7', syntax='chordlabel'))
+        self.assertIs(pickle.loads(pickle.dumps(label)), label)
+
+    def test_fast_path(self):
+        # The expression and the parser agree on the whole language
+        chordlabel = harmalysis.parsers.chordlabel
+        for chord_type, intervals in harmalysis.classes.chordlabel.chord_type_intervals.items():
+            for root in ['C', 'f#', 'Bb', 'b-', 'bbb', 'Ex', 'D##', 'A--']:
+                query = root + intervals
+                with self.subTest(query=query):
+                    self.assertIs(chordlabel._match(query), chordlabel.ChordLabelParser().transform(chordlabel.parser.parse(query)))
+                    self.assertIs(chordlabel.parse(query).chord_type, chord_type)
+        for query in ['CM3', 'HM3P5', 'CM3P5m7M9', 'C#bM3P5', 'CM3P5 ']:
+            with self.subTest(query=query):
+                self.assertIsNone(chordlabel._match(query))
+                with self.assertRaises(chordlabel.chordlabel_lalr.UnexpectedInput):
+                    chordlabel.parse(query)
+
+
+if __name__ == '__main__':
+    unittest.main()
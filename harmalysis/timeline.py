@@ -0,0 +1,185 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Analyses placed in time, e.g., aligned to a score or to a recording.
+# Onsets and ends are kept in sorted arrays, so that the harmony and the key
+# at any time, and the harmonies overlapping any interval, are found with
+# binary searches (np.searchsorted also answers many times at once).
+
+import numpy as np
+
+import harmalysis.parsers.roman as roman
+from harmalysis.classes import key as key_module
+
+NO_KEY = -1
+
+
+def segment_tree(values):
+    # Maximum of the values under each node of a complete binary tree; the
+    # root is node 1, the children of node i are 2i and 2i + 1, and the
+    # leaves start at len(tree) // 2 (padded with -inf)
+    size = 2
+    while size < len(values):
+        size *= 2
+    tree = np.full(2 * size, -np.inf)
+    tree[size:size + len(values)] = values
+    start = size // 2
+    while start:
+        tree[start:2 * start] = np.maximum(tree[2 * start:4 * start:2], tree[2 * start + 1:4 * start:2])
+        start //= 2
+    return tree
+
+
+def last_greater(tree, indices, values):
+    # For each (index, value), the last leaf at or before index that is
+    # greater than value, -1 if there is none. The prefix is walked through
+    # its O(log n) canonical nodes from the right, then one descent finds the
+    # leaf in the first node that is greater.
+    size = len(tree) // 2
+    nodes = np.asarray(indices, dtype=np.int64) + size
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(len(nodes), -1, dtype=np.int64)
+    found = np.zeros(len(nodes), dtype=bool)
+    active = np.arange(len(nodes))
+    while len(active):
+        hit = tree[nodes[active]] > values[active]
+        found[active[hit]] = True
+        active = active[~hit]
+        # The node that covers the positions just before this one
+        lowest = nodes[active] & -nodes[active]
+        nodes[active] = nodes[active] // lowest - 1
+        active = active[nodes[active] > 0]
+    active = np.flatnonzero(found)
+    active = active[nodes[active] < size]
+    while len(active):
+        right = 2 * nodes[active] + 1
+        nodes[active] = np.where(tree[right] > values[active], right, right - 1)
+        active = active[nodes[active] < size]
+    result[found] = nodes[found] - size
+    return result
+
+
+class HarmonicTimeline(object):
+    def __init__(self, analyses, onsets, durations=None, end=None):
+        # Without durations every harmony lasts until the next one, and the
+        # last one until 'end' (or forever)
+        analyses = list(analyses)
+        onsets = np.asarray(onsets, dtype=np.float64)
+        if len(onsets) != len(analyses):
+            raise ValueError('there must be one onset per analysis.')
+        order = np.argsort(onsets, kind='stable')
+        self.analyses = [analyses[i] for i in order]
+        self.onsets = onsets[order]
+        if durations is None:
+            self.ends = np.append(self.onsets[1:], np.inf if end is None else end)
+        else:
+            durations = np.asarray(durations, dtype=np.float64)
+            if len(durations) != len(analyses):
+                raise ValueError('there must be one duration per analysis.')
+            if np.any(durations < 0):
+                raise ValueError('durations cannot be negative.')
+            self.ends = self.onsets + durations[order]
+        # Harmonies may overlap when durations are given; the running
+        # maximum of the ends is sorted, so range queries stay binary searches
+        self.max_ends = np.maximum.accumulate(self.ends) if len(self.ends) else self.ends
+        self.end_tree = segment_tree(self.ends)
+        self.main_keys, self.local_keys = self._keys()
+
+    @classmethod
+    def from_labels(cls, labels, onsets, durations=None, end=None, skip_errors=False):
+        # Labels with '=>:' establish the key of the labels after them, so
+        # they are parsed in the order of their onsets
+        labels = list(labels)
+        onsets = np.asarray(onsets, dtype=np.float64)
+        if len(onsets) != len(labels):
+            raise ValueError('there must be one onset per analysis.')
+        order = np.argsort(onsets, kind='stable')
+        if durations is not None:
+            durations = np.asarray(durations, dtype=np.float64)
+            if len(durations) != len(labels):
+                raise ValueError('there must be one duration per analysis.')
+            durations = durations[order]
+        analyses = roman.parse_batch([labels[i] for i in order], skip_errors=skip_errors)
+        return cls(analyses, onsets[order], durations, end)
+
+    def _keys(self):
+        # The main key remains in effect until another one is given (e.g.,
+        # over descriptive chords by letter and unparsed labels); the local
+        # key is the last tonicized key of each harmony. The extra NO_KEY at
+        # the end is found by the index -1, before the first harmony.
+        main_keys = np.full(len(self.analyses) + 1, NO_KEY, dtype=np.int32)
+        local_keys = np.full(len(self.analyses) + 1, NO_KEY, dtype=np.int32)
+        previous = NO_KEY
+        for i, analysis in enumerate(self.analyses):
+            if analysis is not None and analysis.main_key is not None:
+                previous = analysis.main_key.to_code()
+            main_keys[i] = previous
+            if analysis is not None and analysis.secondary_key is not None:
+                local_keys[i] = analysis.secondary_key.to_code()
+            else:
+                local_keys[i] = previous
+        return main_keys, local_keys
+
+    def __len__(self):
+        return len(self.analyses)
+
+    def indices_at(self, times):
+        # Index of the harmony sounding at each time, -1 if there is none.
+        # With overlapping harmonies, the one that started last.
+        times = np.asarray(times, dtype=np.float64)
+        shape = times.shape
+        times = times.ravel()
+        indices = np.searchsorted(self.onsets, times, side='right') - 1
+        sounding = indices >= 0
+        sounding[sounding] = self.ends[indices[sounding]] > times[sounding]
+        result = np.where(sounding, indices, -1)
+        # An earlier harmony may still sound: the last one before the index
+        # that ends after the time, found in the segment tree of the ends
+        covered = ~sounding & (indices >= 0)
+        covered[covered] = self.max_ends[indices[covered]] > times[covered]
+        result[covered] = last_greater(self.end_tree, indices[covered], times[covered])
+        return result.reshape(shape)
+
+    def at(self, time):
+        index = int(self.indices_at(time))
+        return self.analyses[index] if index >= 0 else None
+
+    def overlapping(self, start, stop):
+        # Indices of the harmonies that overlap [start, stop), by onset
+        first = np.searchsorted(self.max_ends, start, side='right')
+        last = np.searchsorted(self.onsets, stop, side='left')
+        if first >= last:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.arange(first, last)
+        return candidates[self.ends[first:last] > start]
+
+    def between(self, start, stop):
+        return [self.analyses[i] for i in self.overlapping(start, stop)]
+
+    def key_codes_at(self, times, local=False):
+        # The key in effect at each time, also between harmonies; NO_KEY
+        # before the first one
+        indices = np.searchsorted(self.onsets, np.asarray(times, dtype=np.float64), side='right') - 1
+        codes = self.local_keys if local else self.main_keys
+        return codes[indices]
+
+    def keys_at(self, times, local=False):
+        return [key_module.from_code(int(code)) if code != NO_KEY else None for code in self.key_codes_at(times, local)]
+
+    def key_at(self, time, local=False):
+        return self.keys_at([time], local)[0]
@@ -0,0 +1,165 @@
+'''
+    harmalysis - a language for harmonic analysis and roman numerals
+    Copyright (C) 2020  Nestor Napoles Lopez
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import functools
+import itertools
+
+import numpy as np
+
+import harmalysis.common as common
+import harmalysis.parsers.roman as roman
+from harmalysis.classes.chord import InvertibleChord
+
+# MIDI ranges of the bass, tenor, alto and soprano
+RANGES = ((40, 60), (48, 67), (55, 74), (60, 81))
+VOICES = len(RANGES)
+# Largest interval between adjacent upper voices
+MAX_SPACING = 12
+
+# Costs
+MOTION_WEIGHTS = np.array([0.5, 1.0, 1.0, 1.0])
+LEAP = 7
+LEAP_COST = 2.0
+PARALLEL_COST = 20.0
+DOUBLED_THIRD_COST = 3.0
+DOUBLED_TONE_COST = 1.0
+OMITTED_FIFTH_COST = 1.0
+# Candidates kept per chord, the cheapest ones by their own cost
+MAX_CANDIDATES = 128
+
+_voice_pairs = np.array(list(itertools.combinations(range(VOICES), 2)))
+
+
+def chord_tones(chord):
+    # Pitch classes stacked in thirds from the root; diatonic extensions
+    # are stored as simple intervals (a ninth as a second, etc.)
+    steps = [step for step, interv in chord.intervals.items() if interv]
+    steps.sort(key=lambda step: step if step % 2 else step + common.DIATONIC_CLASSES)
+    tones = [chord.root.chromatic_class]
+    for step in steps:
+        tones.append(chord.root.to_interval(chord.intervals[step]).chromatic_class)
+    return tuple(tones)
+
+
+def bass_tone(chord, tones):
+    # The inversion names the step in the bass (third, fifth, seventh, ...),
+    # which keeps its place when other chord tones are missing
+    if isinstance(chord, InvertibleChord) and chord.inversion:
+        step = 2 * chord.inversion + 1
+        if step > common.DIATONIC_CLASSES:
+            step -= common.DIATONIC_CLASSES
+        interv = chord.intervals.get(step)
+        if interv:
+            return chord.root.to_interval(interv).chromatic_class
+    return tones[0]
+
+
+def _required_tones(tones, bass):
+    # Root, third, seventh, the highest extension and the fifth, as far as
+    # four voices allow
+    priority = [tones[0]] + list(tones[1:2]) + list(tones[3:4]) + list(tones[4:][-1:]) + list(tones[2:3])
+    required = [bass]
+    for tone in priority:
+        if tone not in required and len(required) < VOICES:
+            required.append(tone)
+    return required
+
+
+@functools.lru_cache(maxsize=4096)
+def candidates(tones, bass):
+    # All the (bass, tenor, alto, soprano) voicings of a chord, with their cost
+    grids = []
+    for voice, (low, high) in enumerate(RANGES):
+        notes = np.arange(low, high + 1)
+        if voice == 0:
+            grids.append(notes[notes % common.PITCH_CLASSES == bass])
+        else:
+            grids.append(notes[np.isin(notes % common.PITCH_CLASSES, tones)])
+    voicings = np.stack([grid.ravel() for grid in np.meshgrid(*grids, indexing='ij')], axis=1)
+    b, t, a, s = voicings.T
+    valid = (b < t) & (t <= a) & (a <= s) & (a - t <= MAX_SPACING) & (s - a <= MAX_SPACING)
+    pcs = voicings % common.PITCH_CLASSES
+    for tone in _required_tones(tones, bass):
+        valid &= (pcs == tone).any(axis=1)
+    if not valid.any():
+        valid = (b < t) & (t <= a) & (a <= s)
+    voicings = voicings[valid]
+    pcs = pcs[valid]
+    counts = np.stack([(pcs == tone).sum(axis=1) for tone in tones], axis=1)
+    cost = np.zeros(len(voicings))
+    if len(tones) > 1:
+        cost += DOUBLED_THIRD_COST * (counts[:, 1] > 1)
+    if len(tones) > 2:
+        cost += DOUBLED_TONE_COST * (counts[:, 2:] > 1).sum(axis=1)
+        cost += OMITTED_FIFTH_COST * (counts[:, 2] == 0)
+    order = np.argsort(cost, kind='stable')[:MAX_CANDIDATES]
+    voicings = voicings[order]
+    cost = cost[order]
+    voicings.setflags(write=False)
+    cost.setflags(write=False)
+    return voicings, cost
+
+
+def transition_costs(previous, current):
+    # Cost of moving from each previous voicing (rows) to each current one (columns)
+    motion = current[np.newaxis, :, :] - previous[:, np.newaxis, :]
+    distance = np.abs(motion)
+    cost = (distance * MOTION_WEIGHTS).sum(axis=2)
+    cost += LEAP_COST * np.maximum(distance[:, :, 1:] - LEAP, 0).sum(axis=2)
+    # Parallel fifths and octaves (or unisons) between any two voices
+    lower, upper = _voice_pairs.T
+    before = (previous[:, upper] - previous[:, lower]) % common.PITCH_CLASSES
+    after = (current[:, upper] - current[:, lower]) % common.PITCH_CLASSES
+    perfect = (before[:, np.newaxis, :] == after[np.newaxis, :, :]) & np.isin(after, (0, 7))[np.newaxis, :, :]
+    moving = (motion[:, :, lower] != 0) & (np.sign(motion[:, :, lower]) == np.sign(motion[:, :, upper]))
+    cost += PARALLEL_COST * (perfect & moving).sum(axis=2)
+    return cost
+
+
+def realize(progression):
+    # Returns an array with one (bass, tenor, alto, soprano) row of MIDI
+    # numbers per chord, minimizing the voice-leading cost of the sequence
+    progression = list(progression)
+    labels = [item for item in progression if isinstance(item, str)]
+    parsed = iter(roman.parse_batch(labels))
+    chords = []
+    for item in progression:
+        if isinstance(item, str):
+            item = next(parsed)
+        chords.append(getattr(item, 'chord', item))
+    if not chords:
+        return np.empty((0, VOICES), dtype=np.int64)
+    options = []
+    for chord in chords:
+        tones = chord_tones(chord)
+        options.append(candidates(tuple(sorted(set(tones), key=tones.index)), bass_tone(chord, tones)))
+    voicings, cost = options[0]
+    total = cost.copy()
+    backpointers = []
+    for previous, (voicings, cost) in zip(options, options[1:]):
+        steps = total[:, np.newaxis] + transition_costs(previous[0], voicings)
+        best = steps.argmin(axis=0)
+        backpointers.append(best)
+        total = steps[best, np.arange(len(voicings))] + cost
+    choice = int(total.argmin())
+    path = [choice]
+    for best in reversed(backpointers):
+        choice = int(best[choice])
+        path.append(choice)
+    path.reverse()
+    return np.array([options[i][0][choice] for i, choice in enumerate(path)])
@@ -44,12 +44,13 @@ PACKAGE_DATA = {
 
 # What packages are required for this module to be executed?
 REQUIRED = [
-    'lark-parser',
+    'numpy',
 ]
 
 # What packages are optional?
 EXTRAS = {
-    # 'fancy feature': ['django'],
+    # The parsers are standalone modules, lark only regenerates them
+    'build': ['lark>=1.1.6'],
 }
 
 # The rest you shouldn't have to touch too much :)
@@ -114,6 +115,22 @@ class UploadCommand(Command):
         sys.exit()
 
 
+class ParsersCommand(Command):
+    """Support setup.py parsers."""
+
+    description = 'Regenerate the standalone LALR parsers from the grammars.'
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        os.system('{0} -m harmalysis.parsers.build'.format(sys.executable))
+
+
 # Where the magic happens:
 setup(
     name=NAME,
@@ -151,5 +168,6 @@ setup(
     # $ setup.py publish support.
     cmdclass={
         'upload': UploadCommand,
+        'parsers': ParsersCommand,
     },
 )
\ No newline at end of file